@@ -13,6 +13,36 @@ fixtures_dir=${FIXTURES_DIR:-/app/fixtures}
 
 uwsgi_port=${UWSGI_PORT:-8000}
 
+# Server settings, see INSTALL.rst
+# The CPUs of the container: nproc reports those of the host, so read the quota
+# of the cgroup (v2, or v1) if one is set
+cpu_count=$(nproc 2>/dev/null || echo 1)
+if [ -r /sys/fs/cgroup/cpu.max ]; then
+    read -r cpu_quota cpu_period < /sys/fs/cgroup/cpu.max
+elif [ -r /sys/fs/cgroup/cpu/cpu.cfs_quota_us ]; then
+    cpu_quota=$(cat /sys/fs/cgroup/cpu/cpu.cfs_quota_us)
+    cpu_period=$(cat /sys/fs/cgroup/cpu/cpu.cfs_period_us)
+fi
+if [ -n "${cpu_quota:-}" ] && [ "$cpu_quota" != "max" ] && [ "$cpu_quota" -gt 0 ]; then
+    quota_cpus=$(( (cpu_quota + cpu_period - 1) / cpu_period ))
+    if [ "$quota_cpus" -lt "$cpu_count" ]; then
+        cpu_count=$quota_cpus
+    fi
+fi
+# every worker thread holds a database connection, cap the default
+default_workers=$((2 * cpu_count + 1))
+if [ "$default_workers" -gt 9 ]; then
+    default_workers=9
+fi
+server_workers=${SERVER_WORKERS:-$default_workers}
+server_threads=${SERVER_THREADS:-2}
+server_preload=${SERVER_PRELOAD:-1}
+server_max_requests=${SERVER_MAX_REQUESTS:-1000}
+server_max_worker_lifetime=${SERVER_MAX_WORKER_LIFETIME:-3600}
+server_timeout=${SERVER_TIMEOUT:-60}
+server_buffer_size=${SERVER_BUFFER_SIZE:-32768}
+server_stats_port=${SERVER_STATS_PORT:-}
+
 until PGPORT=$db_port PGPASSWORD=$db_password psql -h "$db_host" -U "$db_user" -c '\q'; do
   >&2 echo "Waiting for database connection..."
   sleep 1
@@ -20,9 +50,15 @@ done
 
 >&2 echo "Database is up."
 
+# Migrations and fixtures cover the apps that the API-only settings leave out
+manage_settings=${DJANGO_SETTINGS_MODULE:-ztc.conf.docker}
+if [ "$manage_settings" = "ztc.conf.api_only" ]; then
+    manage_settings=ztc.conf.docker
+fi
+
 # Apply database migrations
 >&2 echo "Apply database migrations"
-python src/manage.py migrate
+python src/manage.py migrate --settings $manage_settings
 
 # Load any JSON fixtures present
 if [ -d $fixtures_dir ]; then
@@ -31,20 +67,58 @@ if [ -d $fixtures_dir ]; then
     for fixture in $(ls "$fixtures_dir/"*.json)
     do
         echo "Loading fixture $fixture"
-        src/manage.py loaddata $fixture
+        src/manage.py loaddata $fixture --settings $manage_settings
     done
 fi
 
+# Fixtures are loaded without signals, calculate their ETag values
+>&2 echo "Calculate missing ETag values in the background"
+python src/manage.py fill_etags &
+
+# Verify that the served OpenAPI schema matches the code, and warn about caches
+# which are not shared by the processes
+>&2 echo "Check the OpenAPI schema and caches"
+python src/manage.py check --deploy --tag openapi --tag caches --fail-level ERROR
+
 # Start server
 >&2 echo "Starting server"
-uwsgi \
-    --http :$uwsgi_port \
-    --http-keepalive \
-    --module ztc.wsgi \
-    --static-map /static=/app/static \
-    --static-map /media=/app/media  \
-    --chdir src \
-    --processes 2 \
-    --threads 2 \
-    --buffer-size=32768
-    # processes & threads are needed for concurrency without nginx sitting inbetween
+if [ "${ASGI:-0}" = "1" ]; then
+    # the read thread pool of each worker, sized by asgiref
+    export ASGI_THREADS=${ASGI_THREADS:-4}
+    # static files must be served by the reverse proxy
+    python -m uvicorn ztc.asgi:application \
+        --app-dir src \
+        --host 0.0.0.0 \
+        --port $uwsgi_port \
+        --workers $server_workers \
+        --limit-max-requests $server_max_requests \
+        --lifespan off
+else
+    uwsgi_options=""
+    # load the app in each worker instead of once before forking
+    if [ "$server_preload" != "1" ]; then
+        uwsgi_options="$uwsgi_options --lazy-apps"
+    fi
+    # JSON stats of the workers, for monitoring their saturation
+    if [ -n "$server_stats_port" ]; then
+        uwsgi_options="$uwsgi_options --stats :$server_stats_port --stats-http"
+    fi
+
+    uwsgi \
+        --http :$uwsgi_port \
+        --http-keepalive \
+        --module ztc.wsgi \
+        --static-map /static=/app/static \
+        --static-map /media=/app/media  \
+        --chdir src \
+        --master \
+        --die-on-term \
+        --need-app \
+        --processes $server_workers \
+        --threads $server_threads \
+        --max-requests $server_max_requests \
+        --max-worker-lifetime $server_max_worker_lifetime \
+        --harakiri $server_timeout \
+        --buffer-size $server_buffer_size \
+        $uwsgi_options
+fi
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+Measure the throughput of read endpoints with concurrent keep-alive clients.
+
+Run it against the WSGI (uWSGI) and the ASGI (``ASGI=1``) server of the same
+container to compare them, e.g.::
+
+    bin/load_test.py http://localhost:8000 --token "$JWT" --concurrency 50
+"""
+import argparse
+import http.client
+import statistics
+import threading
+import time
+from urllib.parse import urlsplit
+
+DEFAULT_PATHS = ("/api/v1/zaaktypen", "/api/v1/statustypen")
+
+
+def run_client(base_url, path, headers, deadline, latencies, errors):
+    url = urlsplit(base_url)
+    connection_class = (
+        http.client.HTTPSConnection
+        if url.scheme == "https"
+        else http.client.HTTPConnection
+    )
+    connection = connection_class(url.netloc, timeout=30)
+    while time.monotonic() < deadline:
+        start = time.monotonic()
+        try:
+            connection.request("GET", f"{url.path.rstrip('/')}{path}", headers=headers)
+            response = connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            errors.append(path)
+            connection.close()
+            continue
+
+        if response.status != 200:
+            errors.append(path)
+        else:
+            latencies.append(time.monotonic() - start)
+    connection.close()
+
+
+def load_test(base_url, path, headers, concurrency, duration):
+    latencies, errors = [], []
+    deadline = time.monotonic() + duration
+    threads = [
+        threading.Thread(
+            target=run_client,
+            args=(base_url, path, headers, deadline, latencies, errors),
+        )
+        for _ in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if not latencies:
+        print(f"{path}: no successful requests, {len(errors)} errors")
+        return
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{path}: {len(latencies) / duration:.1f} req/s, "
+        f"median {statistics.median(latencies) * 1000:.1f} ms, "
+        f"p95 {p95 * 1000:.1f} ms, {len(errors)} errors"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("base_url", help="e.g. http://localhost:8000")
+    parser.add_argument("paths", nargs="*", default=DEFAULT_PATHS)
+    parser.add_argument("--token", help="JWT for the Authorization header")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=int, default=20, help="seconds per path")
+    args = parser.parse_args()
+
+    headers = {}
+    if args.token:
+        headers["Authorization"] = f"Bearer {args.token}"
+
+    for path in args.paths:
+        load_test(args.base_url, path, headers, args.concurrency, args.duration)
+
+
+if __name__ == "__main__":
+    main()
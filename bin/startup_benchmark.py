@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""
+Measure the startup time and memory usage of the application per settings module.
+
+Every run starts a fresh interpreter which loads the WSGI application and the
+URLconf, like a server worker does before its first request::
+
+    bin/startup_benchmark.py ztc.conf.docker ztc.conf.api_only --runs 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+DEFAULT_SETTINGS = ("ztc.conf.docker", "ztc.conf.api_only")
+
+STARTUP_SCRIPT = """
+import resource
+import time
+
+start = time.perf_counter()
+import ztc.wsgi
+from django.urls import get_resolver
+
+get_resolver().url_patterns
+duration = time.perf_counter() - start
+print(duration, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def measure(settings_module: str):
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings_module}
+    result = subprocess.run(
+        [sys.executable, "-c", STARTUP_SCRIPT],
+        cwd=SRC_DIR,
+        env=env,
+        stdout=subprocess.PIPE,
+        check=True,
+        text=True,
+    )
+    duration, max_rss = result.stdout.split()[-2:]
+    # ru_maxrss is in kilobytes on Linux
+    return float(duration), int(max_rss) / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("settings", nargs="*", default=DEFAULT_SETTINGS)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    for settings_module in args.settings:
+        durations, memory = zip(*(measure(settings_module) for _ in range(args.runs)))
+        print(
+            f"{settings_module}: startup median {statistics.median(durations):.2f} s, "
+            f"min {min(durations):.2f} s, max RSS {max(memory):.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -10,4 +10,5 @@ class ZTCApiConfig(AppConfig):
         # ensure that the metaclass for every viewset has run
         register_extensions()
 
+        from . import checks, signals  # noqa
         from .views import besluittype, informatieobjecttype, zaken  # noqa
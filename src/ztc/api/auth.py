@@ -0,0 +1,126 @@
+"""
+Cache the authentication and authorization of API clients.
+
+:class:`vng_api_common.middleware.JWTAuth` decodes the JWT, looks up the secret of
+the client and loads its applicaties and autorisaties from the database on every
+request. :class:`CachedJWTAuth` caches the verified claims per JWT and the scopes
+per client ID in the ``JWT_AUTH_CACHE`` cache, for at most
+``JWT_AUTH_CACHE_TIMEOUT`` seconds.
+
+All cache keys contain a version, which is replaced on any change of the
+applicaties, autorisaties, JWT secrets or the authorizations config (see
+:mod:`ztc.api.signals`), e.g. when the autorisaties notifications are handled.
+The cache must be shared by all processes for this to invalidate the cached
+values of every process.
+"""
+import hashlib
+import time
+import uuid
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.utils.functional import cached_property
+
+from vng_api_common.authorizations.models import AuthorizationsConfig, Autorisatie
+from vng_api_common.middleware import AuthMiddleware as _AuthMiddleware, JWTAuth
+
+VERSION_KEY = "jwt-auth:version"
+
+
+def get_auth_cache() -> BaseCache:
+    return caches[settings.JWT_AUTH_CACHE]
+
+
+def get_auth_cache_version() -> str:
+    cache = get_auth_cache()
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # don't overwrite the version of another process which got here first
+        cache.add(VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(VERSION_KEY, "")
+    return version
+
+
+def invalidate_auth_cache() -> None:
+    # versions are never reused, so values cached before can't be read anymore
+    get_auth_cache().set(VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+class CachedJWTAuth(JWTAuth):
+    @cached_property
+    def _cache_version(self) -> str:
+        return get_auth_cache_version()
+
+    def _get_cache_key(self, *parts: str) -> str:
+        return ":".join(("jwt-auth", self._cache_version, *parts))
+
+    @property
+    def payload(self) -> Optional[dict]:
+        if self.encoded is None or hasattr(self, "_payload"):
+            return super().payload
+
+        cache = get_auth_cache()
+        token_hash = hashlib.sha256(self.encoded.encode()).hexdigest()
+        key = self._get_cache_key("payload", token_hash)
+        payload = cache.get(key)
+        if payload is None:
+            # decodes and verifies the JWT, raises PermissionDenied if it's invalid
+            payload = super().payload
+            timeout = settings.JWT_AUTH_CACHE_TIMEOUT
+            if "exp" in payload:
+                expires_in = payload["exp"] + settings.JWT_LEEWAY - time.time()
+                timeout = max(min(timeout, int(expires_in)), 0)
+            cache.set(key, payload, timeout=timeout)
+
+        self._payload = payload
+        return payload
+
+    def _get_scopes(self, component: Optional[str]) -> Tuple[bool, List[str]]:
+        """
+        Return whether the client has all authorizations, and the scopes of its
+        autorisaties for the component.
+        """
+        cache = get_auth_cache()
+        key = self._get_cache_key("scopes", self.client_id, component or "")
+        scopes = cache.get(key)
+        if scopes is not None:
+            return scopes
+
+        applicaties = list(self.applicaties)
+        if component is None:
+            component = AuthorizationsConfig.get_solo().component
+
+        heeft_alle_autorisaties = any(
+            applicatie.heeft_alle_autorisaties is True for applicatie in applicaties
+        )
+        scopes_provided = set()
+        if not heeft_alle_autorisaties:
+            autorisaties = Autorisatie.objects.filter(
+                applicatie__in=applicaties, component=component
+            )
+            for autorisatie_scopes in autorisaties.values_list("scopes", flat=True):
+                scopes_provided.update(autorisatie_scopes)
+
+        scopes = (heeft_alle_autorisaties, sorted(scopes_provided))
+        cache.set(key, scopes, timeout=settings.JWT_AUTH_CACHE_TIMEOUT)
+        return scopes
+
+    def has_auth(
+        self, scopes: List[str], component: Optional[str] = None, **fields
+    ) -> bool:
+        # the autorisaties are only filtered on the component, filters on other
+        # fields (zaaktype, vertrouwelijkheidaanduiding, ...) are not cached
+        if scopes is None or fields or self.client_id is None:
+            return super().has_auth(scopes, component=component, **fields)
+
+        heeft_alle_autorisaties, scopes_provided = self._get_scopes(component)
+        if heeft_alle_autorisaties:
+            return True
+        return scopes.is_contained_in(scopes_provided)
+
+
+class AuthMiddleware(_AuthMiddleware):
+    def extract_jwt_payload(self, request):
+        super().extract_jwt_payload(request)
+        request.jwt_auth = CachedJWTAuth(request.jwt_auth.encoded)
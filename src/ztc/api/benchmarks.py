@@ -0,0 +1,144 @@
+from importlib import import_module
+
+from django.conf import settings
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.utils.module_loading import import_string
+from django.views.decorators.csrf import csrf_exempt
+
+from ztc.datamodel.models import Catalogus, ZaakType
+from ztc.utils import middleware as path_aware
+from ztc.utils.benchmarks import register
+from ztc.utils.db import check_connection_health
+
+from .filters import ZaakTypeFilter
+from .serializers import (
+    InformatieObjectTypeSerializer,
+    ResultaatTypeSerializer,
+    ZaakTypeSerializer,
+)
+from .utils.serializers import CachedFieldsSerializerMixin
+
+
+def _build_fields(serializer_class):
+    serializer = serializer_class()
+    # bypass the class level cache
+    return super(CachedFieldsSerializerMixin, serializer).get_fields()
+
+
+@register("serializers")
+def serializer_fields():
+    """
+    Construct the fields of the serializers with nested serializers and
+    choice help texts, with and without the class level field cache.
+    """
+    cases = {}
+    for serializer_class in (
+        ZaakTypeSerializer,
+        InformatieObjectTypeSerializer,
+        ResultaatTypeSerializer,
+    ):
+        name = serializer_class.__name__
+        cases[f"{name} (uncached)"] = lambda cls=serializer_class: _build_fields(cls)
+        cases[f"{name} (cached)"] = lambda cls=serializer_class: cls().fields
+    return cases
+
+
+def _catalogus_lookup():
+    list(Catalogus.objects.values_list("uuid")[:1])
+
+
+def _new_connection():
+    connection.close()
+    _catalogus_lookup()
+
+
+def _health_checked_connection():
+    check_connection_health()
+    _catalogus_lookup()
+
+
+@register("database")
+def database_connections():
+    """
+    Run a small query on a fresh connection, as without ``CONN_MAX_AGE``, and on a
+    reused connection with and without the health check.
+    """
+    return {
+        "new connection": _new_connection,
+        "persistent connection": _catalogus_lookup,
+        "persistent connection (health check)": _health_checked_connection,
+    }
+
+
+def _filter_zaaktypen(params):
+    def filter_zaaktypen():
+        filterset = ZaakTypeFilter(params, queryset=ZaakType.objects.all())
+        list(filterset.qs.values_list("pk", flat=True))
+
+    return filter_zaaktypen
+
+
+@register("filters")
+def zaaktype_filters():
+    """
+    Filter the zaaktypen on all of the given trefwoorden (``contains``) and on any
+    of them (``overlap``), both supported by the GIN index on ``trefwoorden``.
+    """
+    trefwoorden = (
+        ZaakType.objects.exclude(trefwoorden=[])
+        .values_list("trefwoorden", flat=True)
+        .first()
+    ) or ["trefwoord"]
+    value = ",".join(trefwoorden[:2])
+    return {
+        "trefwoorden (all)": _filter_zaaktypen({"trefwoorden": value}),
+        "trefwoorden (any)": _filter_zaaktypen({"trefwoorden__overlap": value}),
+    }
+
+
+@csrf_exempt
+def _empty_view(request):
+    return HttpResponse()
+
+
+def _get_request(path):
+    host = settings.ALLOWED_HOSTS[0].lstrip(".") if settings.ALLOWED_HOSTS else "*"
+    request = RequestFactory().get(path, HTTP_HOST=host.replace("*", "localhost"))
+    # as set by the session middleware, the other middleware depends on it
+    request.session = import_module(settings.SESSION_ENGINE).SessionStore()
+    return request
+
+
+def _call_middleware(middleware_class, path):
+    request = _get_request(path)
+    middleware = middleware_class(_empty_view)
+
+    def call():
+        if hasattr(middleware, "process_view"):
+            middleware.process_view(request, _empty_view, (), {})
+        middleware(request)
+
+    return call
+
+
+@register("middleware")
+def middleware():
+    """
+    Pass an API request through each middleware in ``MIDDLEWARE``. The middleware
+    from :mod:`ztc.utils.middleware` is compared with the original middleware and
+    with an admin request.
+    """
+    api_path = f"{settings.API_PATH_PREFIXES[0]}v1/zaaktypen"
+    cases = {"view only": lambda request=_get_request(api_path): _empty_view(request)}
+    for middleware_path in settings.MIDDLEWARE:
+        middleware_class = import_string(middleware_path)
+        name = middleware_class.__name__
+        cases[name] = _call_middleware(middleware_class, api_path)
+
+        if middleware_class.__module__ == path_aware.__name__:
+            original = middleware_class.__bases__[-1]
+            cases[f"{name} (original)"] = _call_middleware(original, api_path)
+            cases[f"{name} (admin)"] = _call_middleware(middleware_class, "/admin/")
+    return cases
@@ -0,0 +1,108 @@
+"""
+Conditional retrieval of API resources based on the stored ETag values.
+
+Drop-in replacement for :func:`vng_api_common.caching.conditional_retrieve` which
+answers revalidation requests without instantiating the resource or its serializer.
+"""
+import hashlib
+from datetime import date
+from functools import partial, wraps
+from typing import Optional, Set
+
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.http import Http404, HttpRequest
+
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework_condition.decorators import condition as drf_condition
+from vng_api_common.caching.registry import extract_dependencies
+from vng_api_common.utils import get_viewset_for_path
+
+from ztc.datamodel.models.mixins import RelatiesVersieMixin
+
+
+def get_geldigheid_etag(
+    etag_value: str, relaties_versie: int, datum_geldigheid: Optional[str] = None
+) -> str:
+    """
+    Combine the stored ETag value with the inputs of the geldigheid filtering.
+
+    The relations are filtered on ``datumGeldigheid`` or today, and change with
+    the related objects, which is tracked by the relation version.
+    """
+    datum_geldigheid = datum_geldigheid or date.today().isoformat()
+    value = f"{etag_value}:{datum_geldigheid}:{relaties_versie}"
+    return hashlib.md5(value.encode()).hexdigest()
+
+
+def etag_func(request: HttpRequest, etag_field: str = "_etag", **view_kwargs) -> str:
+    """
+    Look up the stored ETag value of the resource at ``request.path``.
+
+    Only the ETag column is selected. The value is calculated (and stored) from the
+    full resource representation if it's missing, which ``fill_etags`` prevents.
+    Resources with relations filtered on their geldigheid get an ETag value per
+    date and relation version, see :func:`get_geldigheid_etag`.
+    """
+    path = request.path
+    if settings.FORCE_SCRIPT_NAME and path.startswith(settings.FORCE_SCRIPT_NAME):
+        path = path[len(settings.FORCE_SCRIPT_NAME) :]
+
+    viewset = get_viewset_for_path(path)
+    lookup_url_kwarg = viewset.lookup_url_kwarg or viewset.lookup_field
+    queryset = viewset.get_queryset().filter(
+        **{viewset.lookup_field: viewset.kwargs[lookup_url_kwarg]}
+    )
+
+    versioned = issubclass(queryset.model, RelatiesVersieMixin)
+    fields = [etag_field, "_relaties_versie"] if versioned else [etag_field]
+
+    try:
+        etag_value, *relaties_versie = queryset.values_list(*fields).get()
+    except ObjectDoesNotExist:
+        raise Http404
+
+    if not etag_value:
+        etag_value = queryset.get().calculate_etag_value()
+
+    if versioned:
+        etag_value = get_geldigheid_etag(
+            etag_value, relaties_versie[0], request.GET.get("datumGeldigheid")
+        )
+    return etag_value
+
+
+def conditional_retrieve(
+    action="retrieve",
+    etag_field="_etag",
+    extra_depends_on: Optional[Set[str]] = None,
+):
+    """
+    Decorate a viewset to apply conditional GET and HEAD requests.
+
+    Matching ``If-None-Match`` headers result in a 304 response, and HEAD requests
+    without query parameters are answered with the ETag header only. Both are
+    handled with a single query for the stored ETag value. HEAD requests with query
+    parameters (e.g. ``datumGeldigheid``) can still result in a 404 and go through
+    the regular handler.
+    """
+
+    def decorator(viewset: type):
+        extract_dependencies(viewset, extra_depends_on or set())
+        original_handler = getattr(viewset, action)
+
+        @wraps(original_handler)
+        def handler(self, request, *args, **kwargs):
+            if request.method == "HEAD" and not request.query_params:
+                return Response(status=status.HTTP_200_OK)
+            return original_handler(self, request, *args, **kwargs)
+
+        condition = drf_condition(etag_func=partial(etag_func, etag_field=etag_field))
+        setattr(viewset, action, condition(handler))
+        if not hasattr(viewset, "_conditional_retrieves"):
+            viewset._conditional_retrieves = []
+        viewset._conditional_retrieves.append(action)
+        return viewset
+
+    return decorator
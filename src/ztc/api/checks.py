@@ -0,0 +1,95 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Error, Warning, register
+
+from .openapi import (
+    SCHEMA_SOURCE_FILE,
+    SCHEMA_SOURCE_GENERATE,
+    generate_schema,
+    get_schema_path,
+    load_schema,
+)
+
+
+@register()
+def check_openapi_schema_source(app_configs, **kwargs):
+    sources = (SCHEMA_SOURCE_FILE, SCHEMA_SOURCE_GENERATE)
+    if settings.OPENAPI_SCHEMA_SOURCE in sources:
+        return []
+
+    return [
+        Error(
+            "OPENAPI_SCHEMA_SOURCE must be one of: %s" % ", ".join(sources),
+            id="api.E001",
+        )
+    ]
+
+
+# caches which must be shared by all processes, with the setting that enables them
+SHARED_CACHES = [
+    ("JWT_AUTH_CACHE", "JWT_AUTH_CACHE_TIMEOUT"),
+    ("GELDIGHEID_CACHE", "GELDIGHEID_CACHE_TIMEOUT"),
+]
+
+
+@register("caches", deploy=True)
+def check_shared_caches(app_configs, **kwargs):
+    """
+    Check that the caches invalidated across processes are shared by them.
+
+    With a cache per process, a change only invalidates the cache of the process
+    handling it, and the other processes keep using the stale values.
+    """
+    errors = []
+    for cache_setting, timeout_setting in SHARED_CACHES:
+        alias = getattr(settings, cache_setting)
+        if not getattr(settings, timeout_setting):
+            continue
+        if not isinstance(caches[alias], (LocMemCache, DummyCache)):
+            continue
+
+        errors.append(
+            Warning(
+                "%s uses the %r cache, which is not shared by the processes"
+                % (cache_setting, alias),
+                hint="Configure a shared cache (CACHE_DEFAULT) or disable the cache "
+                "with %s = 0." % timeout_setting,
+                obj=cache_setting,
+                id="api.W001",
+            )
+        )
+    return errors
+
+
+@register("openapi", deploy=True)
+def check_openapi_schema(app_configs, **kwargs):
+    """
+    Check that the checked-in OpenAPI schema matches the schema generated from
+    the code.
+
+    Generating the schema takes a few seconds, so this only runs with
+    ``check --deploy``.
+    """
+    if settings.OPENAPI_SCHEMA_SOURCE != SCHEMA_SOURCE_FILE:
+        return []
+
+    generated = generate_schema()
+    checked_in = load_schema()
+    if generated == checked_in:
+        return []
+
+    paths = sorted(
+        path
+        for path in generated["paths"].keys() | checked_in["paths"].keys()
+        if generated["paths"].get(path) != checked_in["paths"].get(path)
+    )
+    return [
+        Error(
+            "%s does not match the schema generated from the code" % get_schema_path(),
+            hint="Regenerate the schema with `generate_schema`. Differing paths: %s"
+            % (", ".join(paths) or "-"),
+            id="api.E002",
+        )
+    ]
@@ -1,14 +1,15 @@
-from urllib.parse import urlparse
-
-from django.core.exceptions import ObjectDoesNotExist
-from django.core.validators import URLValidator
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.core.validators import RegexValidator, URLValidator
 from django.db import models
+from django.db.models import F, Q
 from django.utils.translation import ugettext_lazy as _
 
 from django_filters import rest_framework as filters
+from django_filters.constants import EMPTY_VALUES
+from rest_framework import serializers
 from vng_api_common.filtersets import FilterSet
-from vng_api_common.utils import get_resource_for_path
 
+from ztc.datamodel.constants import ZONDER_RELATIES_QUERY_PARAM
 from ztc.datamodel.models import (
     BesluitType,
     Catalogus,
@@ -17,11 +18,14 @@ from ztc.datamodel.models import (
     ResultaatType,
     RolType,
     StatusType,
+    Wijziging,
     ZaakInformatieobjectType,
     ZaakType,
 )
 from ztc.datamodel.models.zaakobjecttype import ZaakObjectType
 
+from .utils.urls import get_uuid_from_url
+
 # custom filter to show concept and non-concepts
 STATUS_HELP_TEXT = """filter objects depending on their concept status:
 * `alles`: Toon objecten waarvan het attribuut `concept` true of false is.
@@ -31,6 +35,13 @@ STATUS_HELP_TEXT = """filter objects depending on their concept status:
 
 DATUM_GELDIGHEID_HELP_TEXT = "filter objecten op hun geldigheids datum."
 
+ZOEK_HELP_TEXT = _(
+    "Zoek in de omschrijving, toelichting en trefwoorden van de objecten. "
+    "Woorden tussen aanhalingstekens worden als zinsdeel gezocht, `or` zoekt op "
+    "een van de woorden en `-` sluit een woord uit. De resultaten zijn gesorteerd "
+    "op relevantie."
+)
+
 
 def get_objects_between_geldigheid_dates(queryset, name, value, *args, **kwargs):
     qs_old_version = queryset.filter(
@@ -56,20 +67,77 @@ def status_filter(queryset, name, value):
         return queryset
 
 
-def m2m_filter(queryset, name, value):
-    parsed = urlparse(value)
-    path = parsed.path
-    try:
-        object = get_resource_for_path(path)
-    except ObjectDoesNotExist:
-        return queryset.none()
-    return queryset.filter(**{name: object})
+def zoek_filter(queryset, name, value):
+    """full-text search on the search vector, the best matches first"""
+    query = SearchQuery(value, config="dutch", search_type="websearch")
+    return (
+        queryset.filter(**{name: query})
+        .annotate(zoek_rang=SearchRank(F(name), query))
+        .order_by("-zoek_rang", "-pk")
+    )
+
+
+def sinds_filter(queryset, name, value):
+    """the changes after the change of the cursor ``<transactie>-<id>``"""
+    transactie, pk = (int(part) for part in value.split("-"))
+
+    # the changes after the cursor may be deleted, the client has to start over
+    oudste = queryset.oudste_cursor()
+    if oudste is not None and (transactie, pk) < oudste:
+        raise serializers.ValidationError(
+            {
+                name: _(
+                    "De wijzigingen na deze cursor worden niet meer bewaard. "
+                    "Synchroniseer alle objecten opnieuw."
+                )
+            },
+            code="verlopen-cursor",
+        )
+
+    return queryset.filter(
+        Q(transactie__gt=transactie) | Q(transactie=transactie, pk__gt=pk)
+    )
 
 
 class CharArrayFilter(filters.BaseInFilter, filters.CharFilter):
     pass
 
 
+class UUIDURLFilter(filters.CharFilter):
+    """
+    Filter on the (related) objects of the detail URL of ``resource``.
+
+    The UUID is taken from the URL path, so the URL is not resolved and the object
+    is not fetched. URLs of other resources don't match any object.
+    """
+
+    def __init__(self, *args, resource: str, **kwargs):
+        kwargs.setdefault("validators", [URLValidator()])
+        super().__init__(*args, **kwargs)
+        self.resource = resource
+
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+
+        uuid = get_uuid_from_url(value, self.resource)
+        if uuid is None:
+            return qs.none()
+        return qs.filter(**{f"{self.field_name}__uuid": uuid})
+
+
+class UUIDURLInFilter(filters.BaseInFilter, UUIDURLFilter):
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+
+        uuids = {get_uuid_from_url(url, self.resource) for url in value} - {None}
+        if not uuids:
+            return qs.none()
+        # objects related to more than one of the URLs would be returned repeatedly
+        return qs.filter(**{f"{self.field_name}__uuid__in": uuids}).distinct()
+
+
 class RolTypeFilter(FilterSet):
     status = filters.CharFilter(
         field_name="zaaktype__concept", method=status_filter, help_text=STATUS_HELP_TEXT
@@ -166,11 +234,21 @@ class ZaakTypeFilter(FilterSet):
         field_name="concept", method=status_filter, help_text=STATUS_HELP_TEXT
     )
     trefwoorden = CharArrayFilter(field_name="trefwoorden", lookup_expr="contains")
+    trefwoorden__overlap = CharArrayFilter(
+        field_name="trefwoorden",
+        lookup_expr="overlap",
+        help_text=_(
+            "ZAAKTYPEn met minstens een van de trefwoorden, gescheiden door komma's."
+        ),
+    )
 
     datum_geldigheid = filters.DateFilter(
         method=get_objects_between_geldigheid_dates,
         help_text=DATUM_GELDIGHEID_HELP_TEXT,
     )
+    zoek = filters.CharFilter(
+        field_name="_zoekvector", method=zoek_filter, help_text=ZOEK_HELP_TEXT
+    )
 
     class Meta:
         model = ZaakType
@@ -178,8 +256,10 @@ class ZaakTypeFilter(FilterSet):
             "catalogus",
             "identificatie",
             "trefwoorden",
+            "trefwoorden__overlap",
             "status",
             "datum_geldigheid",
+            "zoek",
         )
 
 
@@ -224,10 +304,13 @@ class InformatieObjectTypeFilter(FilterSet):
         method=get_objects_between_geldigheid_dates,
         help_text=DATUM_GELDIGHEID_HELP_TEXT,
     )
+    zoek = filters.CharFilter(
+        field_name="_zoekvector", method=zoek_filter, help_text=ZOEK_HELP_TEXT
+    )
 
     class Meta:
         model = InformatieObjectType
-        fields = ("catalogus", "status", "datum_geldigheid", "omschrijving")
+        fields = ("catalogus", "status", "datum_geldigheid", "omschrijving", "zoek")
 
 
 class BesluitTypeFilter(FilterSet):
@@ -236,40 +319,80 @@ class BesluitTypeFilter(FilterSet):
         help_text=DATUM_GELDIGHEID_HELP_TEXT,
     )
 
-    zaaktypen = filters.CharFilter(
+    zaaktypen = UUIDURLFilter(
         field_name="zaaktypen",
-        method=m2m_filter,
+        resource="zaaktypen",
         help_text=_(
             "ZAAKTYPE met ZAAKen die relevant kunnen zijn voor dit BESLUITTYPE"
         ),
-        validators=[URLValidator()],
     )
-    informatieobjecttypen = filters.CharFilter(
+    zaaktypen__in = UUIDURLInFilter(
+        field_name="zaaktypen",
+        resource="zaaktypen",
+        help_text=_(
+            "BESLUITTYPEn met minstens een van de ZAAKTYPEn, URLs gescheiden door "
+            "komma's."
+        ),
+    )
+    informatieobjecttypen = UUIDURLFilter(
         field_name="informatieobjecttypen",
-        method=m2m_filter,
+        resource="informatieobjecttypen",
         help_text=_(
             "Het INFORMATIEOBJECTTYPE van informatieobjecten waarin besluiten van dit "
             "BESLUITTYPE worden vastgelegd."
         ),
-        validators=[URLValidator()],
+    )
+    informatieobjecttypen__in = UUIDURLInFilter(
+        field_name="informatieobjecttypen",
+        resource="informatieobjecttypen",
+        help_text=_(
+            "BESLUITTYPEn met minstens een van de INFORMATIEOBJECTTYPEn, URLs "
+            "gescheiden door komma's."
+        ),
     )
     status = filters.CharFilter(
         field_name="concept", method=status_filter, help_text=STATUS_HELP_TEXT
     )
+    zoek = filters.CharFilter(
+        field_name="_zoekvector", method=zoek_filter, help_text=ZOEK_HELP_TEXT
+    )
 
     class Meta:
         model = BesluitType
         fields = (
             "catalogus",
             "zaaktypen",
+            "zaaktypen__in",
             "informatieobjecttypen",
+            "informatieobjecttypen__in",
             "status",
             "omschrijving",
             "datum_geldigheid",
+            "zoek",
         )
 
 
 class CatalogusFilter(FilterSet):
+    zonder_relaties = filters.BooleanFilter(
+        method=detail_filter,
+        help_text=ZONDER_RELATIES_QUERY_PARAM.description,
+    )
+
     class Meta:
         model = Catalogus
         fields = {"domein": ["exact", "in"], "rsin": ["exact", "in"]}
+
+
+class WijzigingFilter(FilterSet):
+    sinds = filters.CharFilter(
+        method=sinds_filter,
+        validators=[RegexValidator(r"^\d+-\d+$", message=_("Ongeldige cursor."))],
+        help_text=_(
+            "De `cursor` van de laatst verwerkte wijziging. Zonder deze parameter "
+            "worden alle wijzigingen vanaf het begin getoond."
+        ),
+    )
+
+    class Meta:
+        model = Wijziging
+        fields = ("sinds",)
@@ -0,0 +1,113 @@
+"""
+Cache the objects which are valid today, for the filtering on geldigheid.
+
+The relations of ZAAKTYPEn, BESLUITTYPEn, INFORMATIEOBJECTTYPEn and RESULTAATTYPEn
+are shown only if the related object is valid on the requested date, which is
+today for most requests. Each process keeps the UUIDs of the objects valid today
+per model in memory, so these requests don't query the database for it. Other
+dates are looked up in the database.
+
+The sets are built again on the next day, after any change of the objects (see
+:mod:`ztc.api.signals`) and at least every ``GELDIGHEID_CACHE_TIMEOUT`` seconds, for
+changes without signals like :meth:`QuerySet.update`. Changes are signalled to all
+processes with a version in the ``GELDIGHEID_CACHE`` cache, which must be shared
+by all processes.
+"""
+import datetime
+import threading
+import time
+import uuid
+from typing import Dict, FrozenSet, Optional, Tuple, Union
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.db.models import Q
+from django.db.models.base import ModelBase
+
+VERSION_KEY = "geldigheid:version"
+
+
+def get_geldigheid_filter(date: Union[datetime.date, str]) -> Q:
+    """
+    Filter the objects which started on or before ``date`` and either ended on or
+    after it, or have no end date.
+    """
+    return Q(datum_begin_geldigheid__lte=date) & (
+        Q(datum_einde_geldigheid__gte=date) | Q(datum_einde_geldigheid=None)
+    )
+
+
+def get_geldigheid_cache() -> BaseCache:
+    return caches[settings.GELDIGHEID_CACHE]
+
+
+def get_geldigheid_cache_version() -> str:
+    cache = get_geldigheid_cache()
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # don't overwrite the version of another process which got here first
+        cache.add(VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(VERSION_KEY, "")
+    return version
+
+
+def invalidate_geldigheid_cache() -> None:
+    get_geldigheid_cache().set(VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+class GeldigheidCache:
+    """
+    The UUIDs of the objects valid today per model, shared by the threads of the
+    process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._key: Optional[Tuple[datetime.date, str]] = None
+        self._expires = 0.0
+        self._uuids: Dict[ModelBase, FrozenSet[uuid.UUID]] = {}
+
+    def get_uuids(self, model: ModelBase) -> FrozenSet[uuid.UUID]:
+        today = datetime.date.today()
+        key = (today, get_geldigheid_cache_version())
+        with self._lock:
+            if key != self._key or time.monotonic() >= self._expires:
+                self._key = key
+                self._expires = time.monotonic() + settings.GELDIGHEID_CACHE_TIMEOUT
+                self._uuids = {}
+            uuids = self._uuids.get(model)
+
+        if uuids is None:
+            # built outside the lock, another thread may build the same set
+            uuids = frozenset(
+                model._default_manager.filter(get_geldigheid_filter(today)).values_list(
+                    "uuid", flat=True
+                )
+            )
+            with self._lock:
+                if self._key == key:
+                    self._uuids[model] = uuids
+        return uuids
+
+
+geldigheid_cache = GeldigheidCache()
+
+
+def get_geldige_uuids(
+    model: ModelBase, date: Union[datetime.date, str, None] = None
+) -> Optional[FrozenSet[uuid.UUID]]:
+    """
+    Return the UUIDs of the objects of ``model`` valid on ``date`` (or today).
+
+    Returns ``None`` for other dates than today, or if the cache is disabled, in
+    which case the caller should query the database.
+    """
+    if not settings.GELDIGHEID_CACHE_TIMEOUT:
+        return None
+
+    if date:
+        today = datetime.date.today()
+        if date != today and date != today.isoformat():
+            return None
+
+    return geldigheid_cache.get_uuids(model)
@@ -0,0 +1,32 @@
+from django.core.management import BaseCommand
+
+from vng_api_common.caching.registry import MODEL_SERIALIZERS
+
+from ... import views  # noqa - registers the serializers used for the ETag values
+
+
+class Command(BaseCommand):
+    help = (
+        "Calculate the missing ETag values of existing objects, e.g. after loading "
+        "fixtures, so conditional requests never have to render the resource"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of objects fetched per query.",
+        )
+
+    def handle(self, **options):
+        for model in MODEL_SERIALIZERS:
+            self.stdout.write(f"Calculating ETag values of {model._meta.label}")
+
+            objects = model._default_manager.filter(_etag="")
+            count = 0
+            for obj in objects.iterator(chunk_size=options["batch_size"]):
+                obj.calculate_etag_value()
+                count += 1
+
+            self.stdout.write(f"  Updated {count} objects")
@@ -0,0 +1,99 @@
+"""
+Build the OpenAPI schema once per process instead of once per request.
+
+The schema is identical for a given deployment. Depending on the
+``OPENAPI_SCHEMA_SOURCE`` setting it is read from the checked-in
+``src/openapi.yaml`` (``"file"``) or generated from the code (``"generate"``).
+"""
+import gzip
+import hashlib
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Type
+
+from django.conf import settings
+
+import yaml
+from drf_spectacular.drainage import GENERATOR_STATS
+from drf_spectacular.renderers import OpenApiYamlRenderer
+from drf_spectacular.settings import spectacular_settings
+from rest_framework.renderers import BaseRenderer
+from vng_api_common.views import ERROR_CONTENT_TYPE
+
+SCHEMA_SOURCE_FILE = "file"
+SCHEMA_SOURCE_GENERATE = "generate"
+
+
+@dataclass(frozen=True)
+class SchemaDocument:
+    content: bytes
+    gzipped: bytes
+    etag: str
+
+
+def get_schema_path() -> Path:
+    return Path(settings.BASE_DIR) / "src" / "openapi.yaml"
+
+
+def _patch_error_responses(responses: dict) -> None:
+    for status, response in responses.items():
+        if not (400 <= int(status) < 600) or "content" not in response:
+            continue
+        response["content"] = {
+            ERROR_CONTENT_TYPE: _response for _response in response["content"].values()
+        }
+
+
+def generate_schema() -> dict:
+    """
+    Generate the schema from the code, like ``generate_schema`` does for the
+    checked-in file (including ``patch_error_contenttypes``).
+    """
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    with GENERATOR_STATS.silence():
+        schema = generator.get_schema(request=None, public=True)
+
+    for endpoint in schema["paths"].values():
+        for operation in endpoint.values():
+            if "responses" in operation:
+                _patch_error_responses(operation["responses"])
+    _patch_error_responses(schema["components"]["responses"])
+    return schema
+
+
+def load_schema() -> dict:
+    with open(get_schema_path(), "r", encoding="utf8") as infile:
+        return yaml.safe_load(infile)
+
+
+@lru_cache()
+def get_schema() -> dict:
+    if settings.OPENAPI_SCHEMA_SOURCE == SCHEMA_SOURCE_GENERATE:
+        return generate_schema()
+    return load_schema()
+
+
+@lru_cache()
+def get_schema_document(renderer_class: Type[BaseRenderer]) -> SchemaDocument:
+    """
+    Render the schema with the given renderer, at most once per renderer.
+
+    The checked-in file is served as-is when YAML is requested.
+    """
+    if settings.OPENAPI_SCHEMA_SOURCE == SCHEMA_SOURCE_FILE and issubclass(
+        renderer_class, OpenApiYamlRenderer
+    ):
+        content = get_schema_path().read_bytes()
+    else:
+        content = renderer_class().render(get_schema(), renderer_context={})
+
+    return SchemaDocument(
+        content=content,
+        gzipped=gzip.compress(content, mtime=0),
+        etag=hashlib.md5(content).hexdigest(),
+    )
+
+
+def preload_schema() -> None:
+    get_schema_document(OpenApiYamlRenderer)
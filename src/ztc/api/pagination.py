@@ -0,0 +1,64 @@
+from django.utils.translation import gettext as _
+
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class WijzigingenPagination(BasePagination):
+    """
+    Keyset pagination of the changes, in the order of their transactions.
+
+    The changes after the ``sinds`` cursor are selected by the filter, every page
+    returns the cursor of its last change to continue from.
+    """
+
+    cursor_query_param = "sinds"
+    page_size = api_settings.PAGE_SIZE
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.cursor = request.query_params.get(self.cursor_query_param, "")
+
+        page = list(queryset.order_by("transactie", "pk")[: self.page_size + 1])
+        self.has_next = len(page) > self.page_size
+        page = page[: self.page_size]
+        if page:
+            self.cursor = f"{page[-1].transactie}-{page[-1].pk}"
+        return page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.cursor)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {"next": self.get_next_link(), "cursor": self.cursor, "results": data}
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["cursor", "results"],
+            "properties": {
+                "next": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri",
+                    "description": _(
+                        "URL van de volgende wijzigingen, indien aanwezig."
+                    ),
+                },
+                "cursor": {
+                    "type": "string",
+                    "description": _(
+                        "De waarde voor de `sinds` parameter bij de volgende "
+                        "synchronisatie."
+                    ),
+                },
+                "results": schema,
+            },
+        }
@@ -5,5 +5,8 @@ from .informatieobjecttype import *  # noqa
 from .relatieklassen import *  # noqa
 from .resultaattype import *  # noqa
 from .roltype import *  # noqa
+from .snapshot import *  # noqa
 from .statustype import *  # noqa
+from .wijziging import *  # noqa
 from .zaken import *  # noqa
+from .zoek import *  # noqa
@@ -3,11 +3,14 @@ from django.utils.translation import gettext as _
 from rest_framework import serializers
 
 from ...datamodel.models import BesluitType
+from ..utils.serializers import CachedFieldsSerializerMixin
 from ..utils.validators import RelationCatalogValidator
 from ..validators import ConceptUpdateValidator
 
 
-class BesluitTypeSerializer(serializers.HyperlinkedModelSerializer):
+class BesluitTypeSerializer(
+    CachedFieldsSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     resultaattypen_omschrijving = serializers.SlugRelatedField(
         many=True,
         source="resultaattypen",
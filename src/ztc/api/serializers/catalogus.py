@@ -4,9 +4,12 @@ from rest_framework import serializers
 from vng_api_common.validators import validate_rsin
 
 from ...datamodel.models import Catalogus
+from ..utils.serializers import CachedFieldsSerializerMixin
 
 
-class CatalogusSerializer(serializers.HyperlinkedModelSerializer):
+class CatalogusSerializer(
+    CachedFieldsSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     zaaktypen = serializers.HyperlinkedRelatedField(
         many=True,
         read_only=True,
@@ -66,3 +69,12 @@ class CatalogusSerializer(serializers.HyperlinkedModelSerializer):
                 ),
             },
         }
+
+    def get_fields(self):
+        fields = super().get_fields()
+        # the reverse relations can be huge for large catalogi, clients can opt
+        # out and page through the types using the `catalogus` filter instead
+        if self.context.get("zonder_relaties"):
+            for name in ("zaaktypen", "besluittypen", "informatieobjecttypen"):
+                fields.pop(name)
+        return fields
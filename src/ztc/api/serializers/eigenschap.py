@@ -1,10 +1,13 @@
 from django.utils.translation import gettext as _
 
 from rest_framework import serializers
-from vng_api_common.serializers import add_choice_values_help_text
 
 from ...datamodel.choices import FormaatChoices
 from ...datamodel.models import Eigenschap, EigenschapSpecificatie
+from ..utils.serializers import (
+    CachedFieldsSerializerMixin,
+    ChoiceHelpTextSerializerMixin,
+)
 from ..validators import ZaakTypeConceptValidator
 
 # class EigenschapReferentieSerializer(SourceMappingSerializerMixin, ModelSerializer):
@@ -24,16 +27,15 @@ from ..validators import ZaakTypeConceptValidator
 #         )
 
 
-class EigenschapSpecificatieSerializer(serializers.ModelSerializer):
+class EigenschapSpecificatieSerializer(
+    CachedFieldsSerializerMixin,
+    ChoiceHelpTextSerializerMixin,
+    serializers.ModelSerializer,
+):
     class Meta:
         model = EigenschapSpecificatie
         fields = ("groep", "formaat", "lengte", "kardinaliteit", "waardenverzameling")
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        value_display_mapping = add_choice_values_help_text(FormaatChoices)
-        self.fields["formaat"].help_text += f"\n\n{value_display_mapping}"
+        choice_help_text = {"formaat": FormaatChoices}
 
     def validate(self, attrs):
         instance = EigenschapSpecificatie(**attrs)
@@ -41,7 +43,9 @@ class EigenschapSpecificatieSerializer(serializers.ModelSerializer):
         return attrs
 
 
-class EigenschapSerializer(serializers.HyperlinkedModelSerializer):
+class EigenschapSerializer(
+    CachedFieldsSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     specificatie = EigenschapSpecificatieSerializer(
         source="specificatie_van_eigenschap"
     )
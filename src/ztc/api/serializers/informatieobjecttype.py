@@ -2,14 +2,16 @@ from django.utils.translation import gettext as _
 
 from rest_framework import serializers
 from vng_api_common.constants import VertrouwelijkheidsAanduiding
-from vng_api_common.serializers import add_choice_values_help_text
 from vng_api_common.tests import reverse
 
 from ...datamodel.models import (
     InformatieObjectType,
     InformatieObjectTypeOmschrijvingGeneriek,
     ZaakInformatieobjectType,
-    ZaakType,
+)
+from ..utils.serializers import (
+    CachedFieldsSerializerMixin,
+    ChoiceHelpTextSerializerMixin,
 )
 from ..validators import ConceptUpdateValidator
 
@@ -26,13 +28,11 @@ class InformatieObjectTypeOmschrijvingGeneriekSerializer(serializers.ModelSerial
         )
 
 
-class ZaakInformatieobjectTypeSlugSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = ZaakInformatieobjectType
-        fields = ["zaaktype"]
-
-
-class InformatieObjectTypeSerializer(serializers.HyperlinkedModelSerializer):
+class InformatieObjectTypeSerializer(
+    CachedFieldsSerializerMixin,
+    ChoiceHelpTextSerializerMixin,
+    serializers.HyperlinkedModelSerializer,
+):
     """
     Serializer based on ``IOT-basis`` specified in XSD ``ztc0310_ent_basis.xsd``.
     """
@@ -44,21 +44,20 @@ class InformatieObjectTypeSerializer(serializers.HyperlinkedModelSerializer):
     zaaktypen = serializers.SerializerMethodField()
 
     def get_zaaktypen(self, obj):
-        q1 = ZaakInformatieobjectType.objects.filter(
-            informatieobjecttype=obj.omschrijving
-        )
-        serializer = ZaakInformatieobjectTypeSlugSerializer(q1, many=True)
+        # annotated by the viewset query plan
+        zaaktype_uuids = getattr(obj, "zaaktype_uuids", None)
+        if zaaktype_uuids is None:
+            zaaktype_uuids = ZaakInformatieobjectType.objects.filter(
+                informatieobjecttype=obj.omschrijving
+            ).values_list("zaaktype__uuid", flat=True)
+
         request = self.context.get("request")
-        return_list = []
-        for odict in serializer.data:
-            for key, value in odict.items():
-                related_model = ZaakType.objects.get(id=value)
-                return_list.append(
-                    request.build_absolute_uri(
-                        reverse("zaaktype-detail", kwargs={"uuid": related_model.uuid})
-                    )
-                )
-        return return_list
+        return [
+            request.build_absolute_uri(
+                reverse("zaaktype-detail", kwargs={"uuid": uuid})
+            )
+            for uuid in zaaktype_uuids
+        ]
 
     class Meta:
         model = InformatieObjectType
@@ -98,13 +97,4 @@ class InformatieObjectTypeSerializer(serializers.HyperlinkedModelSerializer):
         validators = [
             ConceptUpdateValidator(),
         ]
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        value_display_mapping = add_choice_values_help_text(
-            VertrouwelijkheidsAanduiding
-        )
-        self.fields[
-            "vertrouwelijkheidaanduiding"
-        ].help_text += f"\n\n{value_display_mapping}"
+        choice_help_text = {"vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding}
@@ -1,14 +1,21 @@
 from django.utils.translation import ugettext_lazy as _
 
 from rest_framework import serializers
-from vng_api_common.serializers import add_choice_values_help_text
 
 from ...datamodel.choices import RichtingChoices
 from ...datamodel.models import ZaakInformatieobjectType
+from ..utils.serializers import (
+    CachedFieldsSerializerMixin,
+    ChoiceHelpTextSerializerMixin,
+)
 from ..validators import ZaakInformatieObjectTypeCatalogusValidator
 
 
-class ZaakTypeInformatieObjectTypeSerializer(serializers.HyperlinkedModelSerializer):
+class ZaakTypeInformatieObjectTypeSerializer(
+    CachedFieldsSerializerMixin,
+    ChoiceHelpTextSerializerMixin,
+    serializers.HyperlinkedModelSerializer,
+):
     """
     Represent a ZaakTypeInformatieObjectType.
 
@@ -62,12 +69,7 @@ class ZaakTypeInformatieObjectTypeSerializer(serializers.HyperlinkedModelSeriali
         # validators = [
         #     ZaakInformatieObjectTypeCatalogusValidator(),
         # ]
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        value_display_mapping = add_choice_values_help_text(RichtingChoices)
-        self.fields["richting"].help_text += f"\n\n{value_display_mapping}"
+        choice_help_text = {"richting": RichtingChoices}
 
     def validate(self, attrs):
         validated_data = super().validate(attrs)
@@ -8,14 +8,14 @@ from vng_api_common.constants import (
     BrondatumArchiefprocedureAfleidingswijze as Afleidingswijze,
     ZaakobjectTypes,
 )
-from vng_api_common.serializers import (
-    GegevensGroepSerializer,
-    NestedGegevensGroepMixin,
-    add_choice_values_help_text,
-)
+from vng_api_common.serializers import GegevensGroepSerializer, NestedGegevensGroepMixin
 from vng_api_common.validators import ResourceValidator
 
 from ...datamodel.models import ResultaatType
+from ..utils.serializers import (
+    CachedFieldsSerializerMixin,
+    ChoiceHelpTextSerializerMixin,
+)
 from ..utils.validators import (
     BrondatumArchiefprocedureValidator,
     ProcestermijnAfleidingswijzeValidator,
@@ -24,27 +24,25 @@ from ..utils.validators import (
 from ..validators import ZaakTypeConceptValidator
 
 
-class BrondatumArchiefprocedureSerializer(GegevensGroepSerializer):
+class BrondatumArchiefprocedureSerializer(
+    CachedFieldsSerializerMixin, ChoiceHelpTextSerializerMixin, GegevensGroepSerializer
+):
     class Meta:
         model = ResultaatType
         gegevensgroep = "brondatum_archiefprocedure"
 
         extra_kwargs = {"procestermijn": {"allow_null": True}}
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        value_display_mapping = add_choice_values_help_text(Afleidingswijze)
-        self.fields["afleidingswijze"].help_text += "\n\n{}".format(
-            value_display_mapping
-        )
-
-        value_display_mapping = add_choice_values_help_text(ZaakobjectTypes)
-        self.fields["objecttype"].help_text += "\n\n{}".format(value_display_mapping)
+        choice_help_text = {
+            "afleidingswijze": Afleidingswijze,
+            "objecttype": ZaakobjectTypes,
+        }
 
 
 class ResultaatTypeSerializer(
-    NestedGegevensGroepMixin, serializers.HyperlinkedModelSerializer
+    CachedFieldsSerializerMixin,
+    ChoiceHelpTextSerializerMixin,
+    NestedGegevensGroepMixin,
+    serializers.HyperlinkedModelSerializer,
 ):
     brondatum_archiefprocedure = BrondatumArchiefprocedureSerializer(
         label=_("Brondatum archiefprocedure"),
@@ -159,14 +157,7 @@ class ResultaatTypeSerializer(
             BrondatumArchiefprocedureValidator(),
             ZaakTypeConceptValidator(),
         ]
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        value_display_mapping = add_choice_values_help_text(Archiefnominatie)
-        self.fields["archiefnominatie"].help_text += "\n\n{}".format(
-            value_display_mapping
-        )
+        choice_help_text = {"archiefnominatie": Archiefnominatie}
 
 
 class ResultaatTypeCreateSerializer(ResultaatTypeSerializer):
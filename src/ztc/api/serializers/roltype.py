@@ -3,13 +3,18 @@ from django.utils.translation import ugettext_lazy as _
 from drf_writable_nested import NestedCreateMixin
 from rest_framework import serializers
 from vng_api_common.constants import RolOmschrijving
-from vng_api_common.serializers import add_choice_values_help_text
 
 from ...datamodel.models import RolType
+from ..utils.serializers import (
+    CachedFieldsSerializerMixin,
+    ChoiceHelpTextSerializerMixin,
+)
 from ..validators import ZaakTypeConceptValidator
 
 
 class RolTypeSerializer(
+    CachedFieldsSerializerMixin,
+    ChoiceHelpTextSerializerMixin,
     NestedCreateMixin,
     serializers.HyperlinkedModelSerializer,
 ):
@@ -47,9 +52,4 @@ class RolTypeSerializer(
             "einde_object": {"source": "datum_einde_object"},
         }
         validators = [ZaakTypeConceptValidator()]
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        value_display_mapping = add_choice_values_help_text(RolOmschrijving)
-        self.fields["omschrijving_generiek"].help_text += f"\n\n{value_display_mapping}"
+        choice_help_text = {"omschrijving_generiek": RolOmschrijving}
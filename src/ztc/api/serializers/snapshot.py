@@ -0,0 +1,32 @@
+from django.utils.translation import ugettext_lazy as _
+
+from rest_framework import serializers
+
+from .besluittype import BesluitTypeSerializer
+from .catalogus import CatalogusSerializer
+from .eigenschap import EigenschapSerializer
+from .informatieobjecttype import InformatieObjectTypeSerializer
+from .relatieklassen import ZaakTypeInformatieObjectTypeSerializer
+from .resultaattype import ResultaatTypeSerializer
+from .roltype import RolTypeSerializer
+from .statustype import StatusTypeSerializer
+from .zaakobjecttype import ZaakObjectTypeSerializer
+from .zaken import ZaakTypeSerializer
+
+
+# Only documents the snapshot, which is rendered by `ztc.api.snapshot`
+class CatalogusSnapshotSerializer(serializers.Serializer):
+    catalogus = CatalogusSerializer(read_only=True)
+    zaaktypen = ZaakTypeSerializer(many=True, read_only=True)
+    statustypen = StatusTypeSerializer(many=True, read_only=True)
+    resultaattypen = ResultaatTypeSerializer(many=True, read_only=True)
+    roltypen = RolTypeSerializer(many=True, read_only=True)
+    eigenschappen = EigenschapSerializer(many=True, read_only=True)
+    zaakobjecttypen = ZaakObjectTypeSerializer(many=True, read_only=True)
+    zaaktype_informatieobjecttypen = ZaakTypeInformatieObjectTypeSerializer(
+        many=True,
+        read_only=True,
+        help_text=_("De relaties tussen de ZAAKTYPEn en INFORMATIEOBJECTTYPEn."),
+    )
+    besluittypen = BesluitTypeSerializer(many=True, read_only=True)
+    informatieobjecttypen = InformatieObjectTypeSerializer(many=True, read_only=True)
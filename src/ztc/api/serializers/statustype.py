@@ -4,6 +4,7 @@ from rest_framework import serializers
 from rest_framework.serializers import ModelSerializer
 
 from ...datamodel.models import CheckListItem, StatusType
+from ..utils.serializers import CachedFieldsSerializerMixin
 from ..validators import ZaakTypeConceptValidator
 
 
@@ -18,7 +19,9 @@ class CheckListItemSerializer(ModelSerializer):
         )
 
 
-class StatusTypeSerializer(serializers.HyperlinkedModelSerializer):
+class StatusTypeSerializer(
+    CachedFieldsSerializerMixin, serializers.HyperlinkedModelSerializer
+):
     catalogus = serializers.HyperlinkedRelatedField(
         source="zaaktype.catalogus",
         read_only=True,
@@ -0,0 +1,38 @@
+from django.utils.translation import ugettext_lazy as _
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema_field
+from rest_framework import serializers
+from vng_api_common.tests import reverse
+
+from ...datamodel.models import Wijziging
+
+
+class WijzigingSerializer(serializers.ModelSerializer):
+    url = serializers.SerializerMethodField(
+        help_text=_("URL-referentie naar het gewijzigde object.")
+    )
+    etag = serializers.CharField(
+        read_only=True,
+        allow_null=True,
+        help_text=_(
+            "De huidige ETag van het object. Leeg als het object verwijderd is of "
+            "de ETag nog niet berekend is."
+        ),
+    )
+
+    class Meta:
+        model = Wijziging
+        fields = ("resource", "url", "actie", "etag", "aangemaakt")
+        extra_kwargs = {
+            "resource": {"help_text": _("Het soort object, bijvoorbeeld `zaaktype`.")},
+            "actie": {"help_text": _("De actie waarmee het object gewijzigd is.")},
+            "aangemaakt": {"help_text": _("Het tijdstip van de wijziging.")},
+        }
+
+    @extend_schema_field(OpenApiTypes.URI)
+    def get_url(self, obj: Wijziging) -> str:
+        request = self.context.get("request")
+        return request.build_absolute_uri(
+            reverse(f"{obj.resource}-detail", kwargs={"uuid": obj.uuid})
+        )
@@ -5,11 +5,7 @@ from drf_writable_nested import NestedCreateMixin, NestedUpdateMixin
 from rest_framework import serializers
 from rest_framework.serializers import HyperlinkedModelSerializer, ModelSerializer
 from vng_api_common.constants import VertrouwelijkheidsAanduiding
-from vng_api_common.serializers import (
-    GegevensGroepSerializer,
-    NestedGegevensGroepMixin,
-    add_choice_values_help_text,
-)
+from vng_api_common.serializers import GegevensGroepSerializer, NestedGegevensGroepMixin
 from vng_api_common.tests import reverse
 from vng_api_common.validators import ResourceValidator
 
@@ -20,6 +16,10 @@ from ...datamodel.models import (
     ZaakType,
     ZaakTypenRelatie,
 )
+from ..utils.serializers import (
+    CachedFieldsSerializerMixin,
+    ChoiceHelpTextSerializerMixin,
+)
 from ..utils.validators import RelationCatalogValidator
 from ..validators import (
     ConceptUpdateValidator,
@@ -46,17 +46,14 @@ class BronZaaktypeSerializer(GegevensGroepSerializer):
         gegevensgroep = "bronzaaktype"
 
 
-class ZaakTypenRelatieSerializer(ModelSerializer):
+class ZaakTypenRelatieSerializer(
+    CachedFieldsSerializerMixin, ChoiceHelpTextSerializerMixin, ModelSerializer
+):
     class Meta:
         model = ZaakTypenRelatie
         fields = ("zaaktype", "aard_relatie", "toelichting")
         extra_kwargs = {"zaaktype": {"source": "gerelateerd_zaaktype"}}
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        value_display_mapping = add_choice_values_help_text(AardRelatieChoices)
-        self.fields["aard_relatie"].help_text += f"\n\n{value_display_mapping}"
+        choice_help_text = {"aard_relatie": AardRelatieChoices}
 
 
 class ZaakTypenRelatieCreateSerializer(ZaakTypenRelatieSerializer):
@@ -65,13 +62,9 @@ class ZaakTypenRelatieCreateSerializer(ZaakTypenRelatieSerializer):
     )
 
 
-class ZaakInformatieobjectTypeSlugSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = ZaakInformatieobjectType
-        fields = ["informatieobjecttype"]
-
-
 class ZaakTypeSerializer(
+    CachedFieldsSerializerMixin,
+    ChoiceHelpTextSerializerMixin,
     NestedGegevensGroepMixin,
     NestedCreateMixin,
     NestedUpdateMixin,
@@ -100,22 +93,22 @@ class ZaakTypeSerializer(
     informatieobjecttypen = serializers.SerializerMethodField()
 
     def get_informatieobjecttypen(self, obj):
+        # annotated by the viewset query plan
+        informatieobjecttype_uuids = getattr(obj, "informatieobjecttype_uuids", None)
+        if informatieobjecttype_uuids is None:
+            informatieobjecttype_uuids = InformatieObjectType.objects.filter(
+                omschrijving__in=ZaakInformatieobjectType.objects.filter(
+                    zaaktype=obj
+                ).values("informatieobjecttype")
+            ).values_list("uuid", flat=True)
+
         request = self.context.get("request")
-        q1 = ZaakInformatieobjectType.objects.filter(zaaktype=obj)
-        serializer = ZaakInformatieobjectTypeSlugSerializer(q1, many=True)
-        filter_list = []
-        return_list = []
-        for odict in serializer.data:
-            for key, value in odict.items():
-                filter_list.append(value)
-        q2 = InformatieObjectType.objects.filter(omschrijving__in=filter_list)
-        for obj in q2:
-            return_list.append(
-                request.build_absolute_uri(
-                    reverse("informatieobjecttype-detail", kwargs={"uuid": obj.uuid})
-                )
+        return [
+            request.build_absolute_uri(
+                reverse("informatieobjecttype-detail", kwargs={"uuid": uuid})
             )
-        return return_list
+            for uuid in informatieobjecttype_uuids
+        ]
 
     class Meta:
         model = ZaakType
@@ -241,20 +234,10 @@ class ZaakTypeSerializer(
             ConceptUpdateValidator(),
             DeelzaaktypeCatalogusValidator(),
         ]
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        value_display_mapping = add_choice_values_help_text(
-            VertrouwelijkheidsAanduiding
-        )
-        self.fields[
-            "vertrouwelijkheidaanduiding"
-        ].help_text += f"\n\n{value_display_mapping}"
-
-        value_display_mapping = add_choice_values_help_text(RichtingChoices)
-        self.fields[
-            "indicatie_intern_of_extern"
-        ].help_text += f"\n\n{value_display_mapping}"
+        choice_help_text = {
+            "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding,
+            "indicatie_intern_of_extern": RichtingChoices,
+        }
 
     def validate(self, attrs):
         verlenging_mogelijk = attrs.get("verlenging_mogelijk", {})
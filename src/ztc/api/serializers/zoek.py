@@ -0,0 +1,120 @@
+from django.utils.translation import ugettext_lazy as _
+
+from rest_framework import serializers
+from rest_framework.fields import empty
+
+from ..filters import DATUM_GELDIGHEID_HELP_TEXT, STATUS_HELP_TEXT
+from ..utils.urls import get_uuid_from_url
+
+
+class UUIDURLField(serializers.URLField):
+    """
+    URL-reference to an object of ``resource``, validated to the UUID in its path.
+
+    URLs of other resources are valid, but don't match any object.
+    """
+
+    def __init__(self, *, resource: str, **kwargs):
+        self.resource = resource
+        super().__init__(**kwargs)
+
+    def run_validation(self, data=empty):
+        # the validators of the field validate the URL, not the UUID
+        url = super().run_validation(data)
+        return get_uuid_from_url(url, self.resource)
+
+
+# The lists of values in `Meta.lookups` are applied to the queryset with the mapped
+# `__in` lookup, in one query for all values. The other fields are filters of the
+# list, which the filterset reads from the request body. No docstring, since
+# drf-spectacular would use it to describe the components of the subclasses.
+class ZoekSerializer(serializers.Serializer):
+    uuids = serializers.ListField(
+        child=serializers.UUIDField(),
+        required=False,
+        help_text=_("Lijst van UUIDs van de objecten."),
+    )
+    status = serializers.ChoiceField(
+        choices=["alles", "concept", "definitief"],
+        required=False,
+        help_text=STATUS_HELP_TEXT,
+    )
+    datum_geldigheid = serializers.DateField(
+        required=False, help_text=DATUM_GELDIGHEID_HELP_TEXT
+    )
+
+    class Meta:
+        lookups = {"uuids": "uuid__in"}
+
+
+class ZaakTypeZoekSerializer(ZoekSerializer):
+    urls = serializers.ListField(
+        child=UUIDURLField(resource="zaaktypen"),
+        required=False,
+        help_text=_("Lijst van URL-referenties naar ZAAKTYPEn."),
+    )
+    identificaties = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        help_text=_("Lijst van identificaties van ZAAKTYPEn."),
+    )
+
+    class Meta:
+        lookups = {
+            "uuids": "uuid__in",
+            "urls": "uuid__in",
+            "identificaties": "identificatie__in",
+        }
+
+
+class ZaakTypeObjectZoekSerializer(ZoekSerializer):
+    zaaktypen = serializers.ListField(
+        child=UUIDURLField(resource="zaaktypen"),
+        required=False,
+        help_text=_("Lijst van URL-referenties naar de ZAAKTYPEn van de objecten."),
+    )
+    zaaktype_identificaties = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        help_text=_("Lijst van identificaties van de ZAAKTYPEn van de objecten."),
+    )
+
+    class Meta:
+        lookups = {
+            "uuids": "uuid__in",
+            "urls": "uuid__in",
+            "zaaktypen": "zaaktype__uuid__in",
+            "zaaktype_identificaties": "zaaktype__identificatie__in",
+        }
+
+
+class StatusTypeZoekSerializer(ZaakTypeObjectZoekSerializer):
+    urls = serializers.ListField(
+        child=UUIDURLField(resource="statustypen"),
+        required=False,
+        help_text=_("Lijst van URL-referenties naar STATUSTYPEn."),
+    )
+
+
+class ResultaatTypeZoekSerializer(ZaakTypeObjectZoekSerializer):
+    urls = serializers.ListField(
+        child=UUIDURLField(resource="resultaattypen"),
+        required=False,
+        help_text=_("Lijst van URL-referenties naar RESULTAATTYPEn."),
+    )
+
+
+class RolTypeZoekSerializer(ZaakTypeObjectZoekSerializer):
+    urls = serializers.ListField(
+        child=UUIDURLField(resource="roltypen"),
+        required=False,
+        help_text=_("Lijst van URL-referenties naar ROLTYPEn."),
+    )
+
+
+class EigenschapZoekSerializer(ZaakTypeObjectZoekSerializer):
+    urls = serializers.ListField(
+        child=UUIDURLField(resource="eigenschappen"),
+        required=False,
+        help_text=_("Lijst van URL-referenties naar EIGENSCHAPpen."),
+    )
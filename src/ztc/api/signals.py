@@ -0,0 +1,236 @@
+"""
+Keep the relation versions used in the ETag values up to date.
+
+The detail responses of ZAAKTYPEn, BESLUITTYPEn, INFORMATIEOBJECTTYPEn and
+RESULTAATTYPEn only show the related objects which are valid on the requested
+date. Any change of a related object, or of the relation itself, bumps the
+``_relaties_versie`` of the objects showing it, which changes their ETag value.
+
+Deletes are handled before the relations are removed by the cascade.
+
+Changes of the authorizations invalidate the cached authorizations of the API
+clients, see :mod:`ztc.api.auth`. Changes of the objects filtered on their
+geldigheid invalidate the objects valid today, see :mod:`ztc.api.geldigheid`.
+
+All changes of the resources are registered for the change feed, see
+:mod:`ztc.api.wijzigingen`.
+
+Objects loaded from fixtures are saved without calling ``save()``, their search
+vector is updated here.
+"""
+from django.db import transaction
+from django.db.models import F, QuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from vng_api_common.authorizations.models import (
+    Applicatie,
+    AuthorizationsConfig,
+    Autorisatie,
+)
+from vng_api_common.models import JWTSecret
+
+from ztc.datamodel.constants import WijzigingActie
+from ztc.datamodel.models import (
+    BesluitType,
+    InformatieObjectType,
+    ResultaatType,
+    ZaakInformatieobjectType,
+    ZaakType,
+)
+from ztc.datamodel.models.mixins import ZoekvectorMixin
+
+from .auth import invalidate_auth_cache
+from .geldigheid import invalidate_geldigheid_cache
+from .wijzigingen import (
+    NESTED_MODELS,
+    registreer_nested_wijziging,
+    registreer_relatie_wijziging,
+    registreer_wijziging,
+)
+
+
+def bump_relaties_versie(queryset: QuerySet) -> None:
+    queryset.update(_relaties_versie=F("_relaties_versie") + 1)
+
+
+def _iot_omschrijvingen(zaaktype: ZaakType) -> QuerySet:
+    return ZaakInformatieobjectType.objects.filter(zaaktype=zaaktype).values(
+        "informatieobjecttype"
+    )
+
+
+@receiver([post_save, pre_delete], sender=ZaakType)
+def zaaktype_changed(sender, instance: ZaakType, **kwargs) -> None:
+    if kwargs.get("raw") or kwargs.get("update_fields") == {"_etag"}:
+        return
+
+    bump_relaties_versie(
+        ZaakType.objects.filter(deelzaaktypen=instance)
+        | ZaakType.objects.filter(
+            zaaktypenrelaties__gerelateerd_zaaktype__endswith=f"/{instance.uuid}"
+        )
+    )
+    bump_relaties_versie(BesluitType.objects.filter(zaaktypen=instance))
+    bump_relaties_versie(
+        InformatieObjectType.objects.filter(
+            omschrijving__in=_iot_omschrijvingen(instance)
+        )
+    )
+
+
+@receiver([post_save, pre_delete], sender=BesluitType)
+def besluittype_changed(sender, instance: BesluitType, **kwargs) -> None:
+    if kwargs.get("raw") or kwargs.get("update_fields") == {"_etag"}:
+        return
+
+    bump_relaties_versie(ZaakType.objects.filter(besluittypen=instance))
+    bump_relaties_versie(InformatieObjectType.objects.filter(besluittypen=instance))
+    bump_relaties_versie(ResultaatType.objects.filter(besluittype=instance))
+
+
+@receiver([post_save, pre_delete], sender=InformatieObjectType)
+def informatieobjecttype_changed(
+    sender, instance: InformatieObjectType, **kwargs
+) -> None:
+    if kwargs.get("raw") or kwargs.get("update_fields") == {"_etag"}:
+        return
+
+    bump_relaties_versie(
+        ZaakType.objects.filter(
+            zaakinformatieobjecttype__informatieobjecttype=instance.omschrijving
+        )
+    )
+    bump_relaties_versie(BesluitType.objects.filter(informatieobjecttypen=instance))
+
+
+@receiver([post_save, pre_delete], sender=ResultaatType)
+def resultaattype_changed(sender, instance: ResultaatType, **kwargs) -> None:
+    if kwargs.get("raw") or kwargs.get("update_fields") == {"_etag"}:
+        return
+
+    bump_relaties_versie(BesluitType.objects.filter(resultaattypen=instance))
+
+
+@receiver([post_save, post_delete], sender=ZaakInformatieobjectType)
+def zaakinformatieobjecttype_changed(
+    sender, instance: ZaakInformatieobjectType, **kwargs
+) -> None:
+    if kwargs.get("raw") or kwargs.get("update_fields") == {"_etag"}:
+        return
+
+    bump_relaties_versie(ZaakType.objects.filter(pk=instance.zaaktype_id))
+    bump_relaties_versie(
+        InformatieObjectType.objects.filter(omschrijving=instance.informatieobjecttype)
+    )
+
+
+M2M_RELATIONS = [
+    BesluitType.zaaktypen.field,
+    BesluitType.informatieobjecttypen.field,
+    BesluitType.resultaattypen.field,
+    ZaakType.deelzaaktypen.field,
+]
+
+
+@receiver(m2m_changed)
+def relation_changed(
+    sender, instance, action: str, reverse: bool, model, pk_set, **kwargs
+) -> None:
+    field = next(
+        (field for field in M2M_RELATIONS if field.remote_field.through is sender),
+        None,
+    )
+    if field is None or action not in ("post_add", "post_remove", "pre_clear"):
+        return
+
+    if action == "pre_clear":
+        # the removed objects are only known before the clear
+        lookup = field.name if reverse else field.related_query_name()
+        pk_set = model.objects.filter(**{lookup: instance}).values("pk")
+
+    bump_relaties_versie(type(instance).objects.filter(pk=instance.pk))
+    bump_relaties_versie(model.objects.filter(pk__in=pk_set))
+
+
+def is_datamodel(sender) -> bool:
+    # the receivers of the change feed are connected for all models
+    return sender._meta.app_label == "datamodel"
+
+
+@receiver(post_save)
+def wijziging_saved(sender, instance, created: bool, **kwargs) -> None:
+    if not is_datamodel(sender):
+        return
+    if kwargs.get("raw") or kwargs.get("update_fields") == {"_etag"}:
+        return
+
+    if sender in NESTED_MODELS:
+        registreer_nested_wijziging(instance)
+    else:
+        actie = WijzigingActie.create if created else WijzigingActie.update
+        registreer_wijziging(instance, actie)
+
+
+@receiver(pre_delete)
+def nested_wijziging_deleted(sender, instance, **kwargs) -> None:
+    if not is_datamodel(sender):
+        return
+    # the resources showing the object can't be found after the delete
+    registreer_nested_wijziging(instance)
+
+
+@receiver(post_delete)
+def wijziging_deleted(sender, instance, **kwargs) -> None:
+    if not is_datamodel(sender):
+        return
+    registreer_wijziging(instance, WijzigingActie.destroy)
+
+
+@receiver(m2m_changed)
+def wijziging_relation_changed(
+    sender, instance, action: str, reverse: bool, model, pk_set, **kwargs
+) -> None:
+    if not is_datamodel(sender):
+        return
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+
+    if action == "pre_clear":
+        # the removed objects are only known before the clear
+        field = next(
+            field
+            for field in (model if reverse else type(instance))._meta.many_to_many
+            if field.remote_field.through is sender
+        )
+        lookup = field.name if reverse else field.related_query_name()
+        pk_set = model._default_manager.filter(**{lookup: instance}).values("pk")
+
+    registreer_relatie_wijziging(type(instance), [instance.pk])
+    registreer_relatie_wijziging(model, pk_set)
+
+
+@receiver(post_save)
+def zoekvector_loaded(sender, instance, **kwargs) -> None:
+    if kwargs.get("raw") and isinstance(instance, ZoekvectorMixin):
+        instance.update_zoekvector()
+
+
+@receiver([post_save, post_delete], sender=Applicatie)
+@receiver([post_save, post_delete], sender=Autorisatie)
+@receiver([post_save, post_delete], sender=AuthorizationsConfig)
+@receiver([post_save, post_delete], sender=JWTSecret)
+def authorizations_changed(sender, **kwargs) -> None:
+    # other processes could otherwise cache the authorizations before the change
+    transaction.on_commit(invalidate_auth_cache)
+
+
+@receiver([post_save, post_delete], sender=ZaakType)
+@receiver([post_save, post_delete], sender=BesluitType)
+@receiver([post_save, post_delete], sender=InformatieObjectType)
+@receiver([post_save, post_delete], sender=ResultaatType)
+def geldigheid_changed(sender, **kwargs) -> None:
+    if kwargs.get("update_fields") == {"_etag"}:
+        return
+    # other processes could otherwise cache the objects before the change
+    transaction.on_commit(invalidate_geldigheid_cache)
@@ -0,0 +1,133 @@
+"""
+Build the snapshot of a complete catalogus, for clients which copy the catalogi.
+
+The snapshot contains the catalogus and all of its (sub)types as the list
+endpoints render them, filtered on ``datumGeldigheid`` like those endpoints. The
+gzipped document is cached in the ``SNAPSHOT_CACHE`` cache under its version,
+which changes with the stored ETag value or relation version of any of the
+objects, see :func:`get_snapshot_etag`.
+"""
+import gzip
+import hashlib
+from datetime import date
+from typing import Optional
+
+from django.conf import settings
+from django.contrib.postgres.aggregates import StringAgg
+from django.core.cache import caches
+from django.db.models import CharField, Value
+from django.db.models.functions import MD5, Cast, Concat
+
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+from rest_framework.request import Request
+
+from ztc.datamodel.models import Catalogus
+from ztc.datamodel.models.mixins import RelatiesVersieMixin
+
+from .geldigheid import get_geldigheid_cache_version
+from .views.besluittype import BesluitTypeViewSet
+from .views.eigenschap import EigenschapViewSet
+from .views.informatieobjecttype import InformatieObjectTypeViewSet
+from .views.relatieklassen import ZaakTypeInformatieObjectTypeViewSet
+from .views.resultaattype import ResultaatTypeViewSet
+from .views.roltype import RolTypeViewSet
+from .views.statustype import StatusTypeViewSet
+from .views.zaakobjecttype import ZaakObjectTypeViewSet
+from .views.zaken import ZaakTypeViewSet
+
+# the name in the snapshot, the viewset of the list and the lookup of the catalogus
+SNAPSHOT_RESOURCES = (
+    ("zaaktypen", ZaakTypeViewSet, "catalogus"),
+    ("statustypen", StatusTypeViewSet, "zaaktype__catalogus"),
+    ("resultaattypen", ResultaatTypeViewSet, "zaaktype__catalogus"),
+    ("roltypen", RolTypeViewSet, "zaaktype__catalogus"),
+    ("eigenschappen", EigenschapViewSet, "zaaktype__catalogus"),
+    ("zaakobjecttypen", ZaakObjectTypeViewSet, "catalogus"),
+    (
+        "zaaktype_informatieobjecttypen",
+        ZaakTypeInformatieObjectTypeViewSet,
+        "zaaktype__catalogus",
+    ),
+    ("besluittypen", BesluitTypeViewSet, "catalogus"),
+    ("informatieobjecttypen", InformatieObjectTypeViewSet, "catalogus"),
+)
+
+
+def get_snapshot_etag(
+    request: Request, catalogus: Catalogus, datum_geldigheid: Optional[str]
+) -> str:
+    """
+    Return the version of the snapshot, from a single hash per type.
+
+    The hashes are calculated by the database from the stored ETag values and
+    relation versions of the objects, the snapshot itself is not rendered. The
+    URLs in the snapshot depend on the host of the request, and without
+    ``datumGeldigheid`` the relations are filtered on their geldigheid today, with
+    the objects valid today from :mod:`ztc.api.geldigheid` if it's enabled.
+    """
+    values = [
+        request.build_absolute_uri("/"),
+        request.version,
+        datum_geldigheid or date.today().isoformat(),
+        catalogus._etag,
+    ]
+    if settings.GELDIGHEID_CACHE_TIMEOUT:
+        # a snapshot rendered before the invalidation of the objects valid today
+        # isn't used after it
+        values.append(get_geldigheid_cache_version())
+    for name, viewset, lookup in SNAPSHOT_RESOURCES:
+        model = viewset.queryset.model
+        parts = [Cast("pk", CharField()), Value(":"), "_etag"]
+        if issubclass(model, RelatiesVersieMixin):
+            parts += [Value(":"), Cast("_relaties_versie", CharField())]
+
+        queryset = model._default_manager.filter(**{lookup: catalogus}).order_by()
+        versie = queryset.aggregate(
+            versie=MD5(StringAgg(Concat(*parts), delimiter=",", ordering="pk"))
+        )["versie"]
+        values.append(versie or "")
+
+    return hashlib.md5("|".join(values).encode()).hexdigest()
+
+
+def build_snapshot(request: Request, catalogus_data: dict, catalogus: Catalogus):
+    """
+    Render the lists of all types of the catalogus, with a query per list.
+
+    The viewsets apply their filters (``datumGeldigheid``), query plans and the
+    filtering of the relations on their geldigheid, as for the list endpoints.
+    """
+    data = {"catalogus": catalogus_data}
+    for name, viewset_class, lookup in SNAPSHOT_RESOURCES:
+        viewset = viewset_class(
+            request=request,
+            action="list",
+            detail=False,
+            args=(),
+            kwargs={},
+            format_kwarg=None,
+        )
+        queryset = viewset.filter_queryset(viewset.get_queryset()).filter(
+            **{lookup: catalogus}
+        )
+        data[name] = viewset.get_serializer(queryset, many=True).data
+    return data
+
+
+def get_gzipped_snapshot(
+    request: Request, catalogus_data: dict, catalogus: Catalogus, versie: str
+) -> bytes:
+    """
+    Return the gzipped snapshot from the cache, or render and cache it.
+    """
+    cache = caches[settings.SNAPSHOT_CACHE]
+    key = f"catalogus-snapshot:{catalogus.uuid}:{versie}"
+
+    gzipped = cache.get(key)
+    if gzipped is None:
+        content = CamelCaseJSONRenderer().render(
+            build_snapshot(request, catalogus_data, catalogus)
+        )
+        gzipped = gzip.compress(content, compresslevel=6, mtime=0)
+        cache.set(key, gzipped, timeout=settings.SNAPSHOT_CACHE_TIMEOUT)
+    return gzipped
@@ -0,0 +1,33 @@
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+
+API_ONLY_MIDDLEWARE = [
+    "django.middleware.security.SecurityMiddleware",
+    "ztc.utils.middleware.CommonMiddleware",
+    "ztc.api.auth.AuthMiddleware",
+    "corsheaders.middleware.CorsMiddleware",
+    "vng_api_common.middleware.APIVersionHeaderMiddleware",
+]
+
+
+@override_settings(ROOT_URLCONF="ztc.api_urls", MIDDLEWARE=API_ONLY_MIDDLEWARE)
+class APIOnlyURLsTests(SimpleTestCase):
+    def test_schema(self):
+        response = self.client.get(reverse("schema", kwargs={"version": "1"}))
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_error_detail(self):
+        url = reverse(
+            "vng_api_common:error-detail",
+            kwargs={"exception_class": "ValidationError"},
+        )
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_no_admin(self):
+        response = self.client.get("/admin/")
+
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,78 @@
+import asyncio
+import threading
+
+from django.test import SimpleTestCase, override_settings
+
+from asgiref.sync import async_to_sync, sync_to_async
+from rest_framework import viewsets
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from ...utils.asgi import PooledThreadContext, ThreadPool
+from ..views import ZaakTypeViewSet
+from ..views.mixins import AsyncReadMixin
+
+
+class ThreadViewSet(AsyncReadMixin, viewsets.ViewSet):
+    authentication_classes = ()
+    permission_classes = ()
+
+    def list(self, request):
+        return Response({"thread": threading.get_ident()})
+
+    def create(self, request):
+        return Response({"thread": threading.get_ident()})
+
+
+class AsyncReadViewTests(SimpleTestCase):
+    actions = {"get": "list", "post": "create"}
+
+    def test_sync_view_by_default(self):
+        view = ZaakTypeViewSet.as_view(self.actions)
+
+        self.assertFalse(asyncio.iscoroutinefunction(view))
+
+    @override_settings(ASYNC_READ_VIEWS=True)
+    def test_async_view(self):
+        view = ZaakTypeViewSet.as_view(self.actions)
+
+        self.assertTrue(asyncio.iscoroutinefunction(view))
+        self.assertIs(view.cls, ZaakTypeViewSet)
+        self.assertEqual(view.actions, self.actions)
+        self.assertTrue(view.csrf_exempt)
+
+    @override_settings(ASYNC_READ_VIEWS=True)
+    def test_reads_run_in_thread_pool(self):
+        view = async_to_sync(ThreadViewSet.as_view(self.actions))
+        factory = APIRequestFactory()
+
+        read_response = view(factory.get("/"))
+        write_response = view(factory.post("/"))
+
+        self.assertNotEqual(read_response.data["thread"], threading.get_ident())
+        self.assertEqual(write_response.data["thread"], threading.get_ident())
+
+
+class PooledThreadContextTests(SimpleTestCase):
+    def test_threads_reused(self):
+        pool = ThreadPool(2)
+        get_thread = sync_to_async(threading.get_ident, thread_sensitive=True)
+
+        async def request():
+            async with PooledThreadContext(pool):
+                first = await get_thread()
+                # the same thread for the whole request
+                self.assertEqual(await get_thread(), first)
+                await asyncio.sleep(0.01)
+                return first
+
+        async def requests():
+            concurrent = await asyncio.gather(request(), request())
+            later = await asyncio.gather(request(), request())
+            return concurrent, later
+
+        concurrent, later = asyncio.run(requests())
+
+        self.assertEqual(len(set(concurrent)), 2)
+        self.assertEqual(set(later), set(concurrent))
+        self.assertNotIn(threading.get_ident(), concurrent)
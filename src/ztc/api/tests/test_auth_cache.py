@@ -0,0 +1,99 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.authorizations.models import Applicatie
+from vng_api_common.constants import CommonResourceAction
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from ..auth import get_auth_cache
+from ..checks import check_shared_caches
+from ..scopes import SCOPE_CATALOGI_READ
+
+
+@override_settings(JWT_AUTH_CACHE_TIMEOUT=300)
+class AuthCacheTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_CATALOGI_READ]
+
+    def setUp(self):
+        super().setUp()
+        get_auth_cache().clear()
+        self.url = reverse("catalogus-list")
+
+    def _count_queries(self) -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries)
+
+    def test_authorizations_cached(self):
+        uncached = self._count_queries()
+
+        cached = self._count_queries()
+
+        # the JWT secret, the config, the applicaties and the autorisaties
+        self.assertLessEqual(cached, uncached - 4)
+
+    def test_changed_autorisatie_invalidates_cache(self):
+        self._count_queries()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.autorisatie.scopes = []
+            self.autorisatie.save()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class WebhookTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_webhook_invalidates_cache(self):
+        applicatie = Applicatie.objects.create(client_ids=["id1"], label="delete")
+        applicatie_url = f"https://ac.example.com/api/v1/applicaties/{applicatie.uuid}"
+        data = {
+            "kanaal": "autorisaties",
+            "hoofdObject": applicatie_url,
+            "resource": "applicatie",
+            "resourceUrl": applicatie_url,
+            "actie": CommonResourceAction.destroy,
+            "aanmaakdatum": "2012-01-14T00:00:00Z",
+            "kenmerken": {},
+        }
+
+        with patch("ztc.api.signals.invalidate_auth_cache") as invalidate_auth_cache:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(reverse("notificaties-webhook"), data)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        invalidate_auth_cache.assert_called()
+
+
+class SharedCacheCheckTests(SimpleTestCase):
+    @override_settings(JWT_AUTH_CACHE_TIMEOUT=300)
+    def test_cache_per_process(self):
+        errors = check_shared_caches(None)
+
+        self.assertEqual([error.id for error in errors], ["api.W001"])
+
+    @override_settings(JWT_AUTH_CACHE_TIMEOUT=0)
+    def test_cache_disabled(self):
+        self.assertEqual(check_shared_caches(None), [])
+
+    @override_settings(
+        JWT_AUTH_CACHE_TIMEOUT=300,
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": "/tmp/ztc-cache",
+            }
+        },
+    )
+    def test_shared_cache(self):
+        self.assertEqual(check_shared_caches(None), [])
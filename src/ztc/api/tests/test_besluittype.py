@@ -1,4 +1,10 @@
+import tempfile
+import uuid
 from datetime import date
+from pathlib import Path
+
+from django.core import serializers
+from django.core.management import call_command
 
 from rest_framework import status
 from vng_api_common.tests import (
@@ -22,6 +28,7 @@ from ...datamodel.tests.factories import (
     InformatieObjectTypeFactory,
     ZaakTypeFactory,
 )
+from ..filters import BesluitTypeFilter
 from ..scopes import (
     SCOPE_CATALOGI_FORCED_WRITE,
     SCOPE_CATALOGI_READ,
@@ -535,6 +542,63 @@ class BesluitTypeFilterAPITests(APITestCase):
         self.assertEqual(len(data), 1)
         self.assertEqual(data[0]["url"], f"http://testserver{besluittype1_url}")
 
+    def test_filter_zaaktypen_in(self):
+        besluittype1 = BesluitTypeFactory.create(concept=False)
+        besluittype2 = BesluitTypeFactory.create(concept=False)
+        BesluitTypeFactory.create(concept=False)
+        zaaktype1 = besluittype1.zaaktypen.get()
+        zaaktype2 = besluittype2.zaaktypen.get()
+        besluittype2.zaaktypen.add(zaaktype1)
+        besluittype_list_url = reverse("besluittype-list")
+
+        response = self.client.get(
+            besluittype_list_url,
+            {
+                "zaaktypen__in": (
+                    f"http://testserver.com{reverse(zaaktype1)},"
+                    f"http://testserver.com{reverse(zaaktype2)}"
+                )
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+
+        urls = [besluittype["url"] for besluittype in response.json()["results"]]
+        self.assertEqual(
+            sorted(urls),
+            sorted(
+                [
+                    f"http://testserver{reverse(besluittype1)}",
+                    f"http://testserver{reverse(besluittype2)}",
+                ]
+            ),
+        )
+
+    def test_filter_zaaktypen_in_single_query(self):
+        zaaktype_urls = [
+            f"http://testserver.com/api/v1/zaaktypen/{uuid.uuid4()}" for _ in range(50)
+        ]
+        filterset = BesluitTypeFilter(
+            {"zaaktypen__in": ",".join(zaaktype_urls)},
+            queryset=BesluitType.objects.all(),
+        )
+
+        with self.assertNumQueries(1):
+            list(filterset.qs)
+
+    def test_filter_zaaktypen_other_resource(self):
+        besluittype = BesluitTypeFactory.create(concept=False)
+        zaaktype = besluittype.zaaktypen.get()
+        besluittype_list_url = reverse("besluittype-list")
+        catalogus_url = reverse(zaaktype.catalogus)
+
+        response = self.client.get(
+            besluittype_list_url, {"zaaktypen": f"http://testserver.com{catalogus_url}"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["results"], [])
+
     def test_filter_informatieobjecttypen(self):
         besluittype1 = BesluitTypeFactory.create(concept=False)
         besluittype2 = BesluitTypeFactory.create(concept=False)
@@ -573,6 +637,42 @@ class BesluitTypeFilterAPITests(APITestCase):
         self.assertEqual(len(data), 1)
         self.assertEqual(data[0]["url"], f"http://testserver{besluittype1_url}")
 
+    def test_filter_zoek(self):
+        besluittype1 = BesluitTypeFactory.create(
+            concept=False, toelichting="Besluit op bezwaar tegen een boete"
+        )
+        BesluitTypeFactory.create(concept=False, toelichting="Besluit op een aanvraag")
+        list_url = get_operation_url("besluittype_list")
+
+        response = self.client.get(list_url, {"zoek": "bezwaar -aanvraag"})
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()["results"]
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["url"], f"http://testserver{reverse(besluittype1)}")
+
+    def test_filter_zoek_fixture(self):
+        besluittype = BesluitTypeFactory.create(
+            concept=False, toelichting="Besluit op bezwaar tegen een boete"
+        )
+        BesluitType.objects.update(_zoekvector=None)
+        besluittype.refresh_from_db()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fixture = Path(tmpdir) / "besluittypen.json"
+            fixture.write_text(serializers.serialize("json", [besluittype]))
+
+            call_command("loaddata", str(fixture), verbosity=0)
+
+        response = self.client.get(
+            get_operation_url("besluittype_list"), {"zoek": "bezwaar"}
+        )
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()["results"]
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]["url"], f"http://testserver{reverse(besluittype)}")
+
     def test_filter_geldigheid_get_most_recent(self):
         besluittype1 = BesluitTypeFactory.create(
             concept=False,
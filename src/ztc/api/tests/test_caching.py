@@ -1,12 +1,22 @@
 """
 Test that the caching mechanisms are in place.
 """
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from rest_framework import status
 from rest_framework.test import APITestCase, APITransactionTestCase
 from vng_api_common.caching import calculate_etag
 from vng_api_common.tests import CacheMixin, JWTAuthMixin, reverse
 from vng_api_common.tests.schema import get_spec
 
+from ztc.api.caching import get_geldigheid_etag
+from ztc.datamodel.models import Catalogus
+from ztc.datamodel.models.mixins import RelatiesVersieMixin
 from ztc.datamodel.tests.factories import (
     BesluitTypeFactory,
     CatalogusFactory,
@@ -20,6 +30,21 @@ from ztc.datamodel.tests.factories import (
 )
 
 
+def get_etag(instance) -> str:
+    """
+    Return the ETag value the API emits for ``instance`` today.
+    """
+    if not isinstance(instance, RelatiesVersieMixin):
+        return instance._etag
+
+    relaties_versie = (
+        type(instance)
+        .objects.values_list("_relaties_versie", flat=True)
+        .get(pk=instance.pk)
+    )
+    return get_geldigheid_etag(instance._etag, relaties_versie)
+
+
 class BesluitTypeCacheTests(CacheMixin, JWTAuthMixin, APITestCase):
     heeft_alle_autorisaties = True
 
@@ -44,7 +69,7 @@ class BesluitTypeCacheTests(CacheMixin, JWTAuthMixin, APITestCase):
     def test_conditional_get_304(self):
         besluittype = BesluitTypeFactory.create(with_etag=True)
         response = self.client.get(
-            reverse(besluittype), HTTP_IF_NONE_MATCH=f'"{besluittype._etag}"'
+            reverse(besluittype), HTTP_IF_NONE_MATCH=f'"{get_etag(besluittype)}"'
         )
 
         self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
@@ -79,7 +104,7 @@ class BesluitTypeCacheTransactionTests(JWTAuthMixin, APITransactionTestCase):
         besluittype = BesluitTypeFactory.create(omschrijving="bla", with_etag=True)
         besluittype._etag = calculate_etag(besluittype)
         besluittype.save(update_fields=["_etag"])
-        etag = besluittype._etag
+        etag = get_etag(besluittype)
 
         besluittype.omschrijving = "same"
         besluittype.save()
@@ -95,7 +120,7 @@ class BesluitTypeCacheTransactionTests(JWTAuthMixin, APITransactionTestCase):
         besluittype = BesluitTypeFactory.create(omschrijving="bla")
         besluittype._etag = calculate_etag(besluittype)
         besluittype.save(update_fields=["_etag"])
-        etag = besluittype._etag
+        etag = get_etag(besluittype)
 
         response = self.client.get(reverse(besluittype), HTTP_IF_NONE_MATCH=f'"{etag}"')
         self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
@@ -291,7 +316,7 @@ class InformatieObjectTypeCacheTests(CacheMixin, JWTAuthMixin, APITestCase):
         informatieobjecttype = InformatieObjectTypeFactory.create(with_etag=True)
         response = self.client.get(
             reverse(informatieobjecttype),
-            HTTP_IF_NONE_MATCH=f'"{informatieobjecttype._etag}"',
+            HTTP_IF_NONE_MATCH=f'"{get_etag(informatieobjecttype)}"',
         )
 
         self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
@@ -328,7 +353,7 @@ class InformatieObjectTypeCacheTransactionTests(JWTAuthMixin, APITransactionTest
         )
         informatieobjecttype._etag = calculate_etag(informatieobjecttype)
         informatieobjecttype.save(update_fields=["_etag"])
-        etag = informatieobjecttype._etag
+        etag = get_etag(informatieobjecttype)
 
         informatieobjecttype.omschrijving = "same"
         informatieobjecttype.save()
@@ -346,7 +371,7 @@ class InformatieObjectTypeCacheTransactionTests(JWTAuthMixin, APITransactionTest
         informatieobjecttype = InformatieObjectTypeFactory.create(omschrijving="bla")
         informatieobjecttype._etag = calculate_etag(informatieobjecttype)
         informatieobjecttype.save(update_fields=["_etag"])
-        etag = informatieobjecttype._etag
+        etag = get_etag(informatieobjecttype)
 
         response = self.client.get(
             reverse(informatieobjecttype), HTTP_IF_NONE_MATCH=f'"{etag}"'
@@ -379,7 +404,7 @@ class ResultaatTypeCacheTests(CacheMixin, JWTAuthMixin, APITestCase):
     def test_conditional_get_304(self):
         resultaattype = ResultaatTypeFactory.create(with_etag=True)
         response = self.client.get(
-            reverse(resultaattype), HTTP_IF_NONE_MATCH=f'"{resultaattype._etag}"'
+            reverse(resultaattype), HTTP_IF_NONE_MATCH=f'"{get_etag(resultaattype)}"'
         )
 
         self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
@@ -414,7 +439,7 @@ class ResultaatTypeCacheTransactionTests(JWTAuthMixin, APITransactionTestCase):
         resultaattype = ResultaatTypeFactory.create(omschrijving="bla", with_etag=True)
         resultaattype._etag = calculate_etag(resultaattype)
         resultaattype.save(update_fields=["_etag"])
-        etag = resultaattype._etag
+        etag = get_etag(resultaattype)
 
         resultaattype.omschrijving = "same"
         resultaattype.save()
@@ -432,7 +457,7 @@ class ResultaatTypeCacheTransactionTests(JWTAuthMixin, APITransactionTestCase):
         resultaattype = ResultaatTypeFactory.create(omschrijving="bla")
         resultaattype._etag = calculate_etag(resultaattype)
         resultaattype.save(update_fields=["_etag"])
-        etag = resultaattype._etag
+        etag = get_etag(resultaattype)
 
         response = self.client.get(
             reverse(resultaattype), HTTP_IF_NONE_MATCH=f'"{etag}"'
@@ -721,7 +746,7 @@ class ZaakTypeCacheTests(CacheMixin, JWTAuthMixin, APITestCase):
     def test_conditional_get_304(self):
         zaaktype = ZaakTypeFactory.create(with_etag=True)
         response = self.client.get(
-            reverse(zaaktype), HTTP_IF_NONE_MATCH=f'"{zaaktype._etag}"'
+            reverse(zaaktype), HTTP_IF_NONE_MATCH=f'"{get_etag(zaaktype)}"'
         )
 
         self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
@@ -756,7 +781,7 @@ class ZaakTypeCacheTransactionTests(JWTAuthMixin, APITransactionTestCase):
         zaaktype = ZaakTypeFactory.create(toelichting="bla")
         zaaktype._etag = calculate_etag(zaaktype)
         zaaktype.save(update_fields=["_etag"])
-        etag = zaaktype._etag
+        etag = get_etag(zaaktype)
 
         zaaktype.toelichting = "same"
         zaaktype.save()
@@ -797,12 +822,12 @@ class M2MRelationCachingTests(JWTAuthMixin, APITransactionTestCase):
         besluittype = BesluitTypeFactory.create()
         besluittype._etag = calculate_etag(besluittype)
         besluittype.save(update_fields=["_etag"])
-        besluittype_etag = besluittype._etag
+        besluittype_etag = get_etag(besluittype)
 
         zaaktype = ZaakTypeFactory.create()
         zaaktype._etag = calculate_etag(zaaktype)
         zaaktype.save(update_fields=["_etag"])
-        zaaktype_etag = zaaktype._etag
+        zaaktype_etag = get_etag(zaaktype)
 
         besluittype.zaaktypen.set([zaaktype])
         besluittype.save()
@@ -825,12 +850,12 @@ class M2MRelationCachingTests(JWTAuthMixin, APITransactionTestCase):
         besluittype = BesluitTypeFactory.create()
         besluittype._etag = calculate_etag(besluittype)
         besluittype.save(update_fields=["_etag"])
-        besluittype_etag = besluittype._etag
+        besluittype_etag = get_etag(besluittype)
 
         zaaktype = ZaakTypeFactory.create()
         zaaktype._etag = calculate_etag(zaaktype)
         zaaktype.save(update_fields=["_etag"])
-        zaaktype_etag = zaaktype._etag
+        zaaktype_etag = get_etag(zaaktype)
 
         besluittype.zaaktypen.set([zaaktype])
         besluittype.save()
@@ -844,3 +869,172 @@ class M2MRelationCachingTests(JWTAuthMixin, APITransactionTestCase):
             reverse(zaaktype), HTTP_IF_NONE_MATCH=f'"{zaaktype_etag}"'
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class ConditionalRetrieveFastPathTests(JWTAuthMixin, APITestCase):
+    """
+    HEAD and 304 responses only select the stored ETag value.
+    """
+
+    heeft_alle_autorisaties = True
+
+    def _get_catalogus_queries(self, method, url, **extra):
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(self.client, method)(url, **extra)
+
+        queries = [
+            query["sql"]
+            for query in context.captured_queries
+            if '"datamodel_catalogus"' in query["sql"]
+        ]
+        return response, queries
+
+    def test_head_selects_etag_only(self):
+        catalogus = CatalogusFactory.create(with_etag=True)
+
+        response, queries = self._get_catalogus_queries("head", reverse(catalogus))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["ETag"], f'"{catalogus._etag}"')
+        self.assertEqual(response.content, b"")
+        self.assertEqual(len(queries), 1)
+        self.assertTrue(queries[0].startswith('SELECT "datamodel_catalogus"."_etag"'))
+
+    def test_conditional_get_304_selects_etag_only(self):
+        catalogus = CatalogusFactory.create(with_etag=True)
+
+        response, queries = self._get_catalogus_queries(
+            "get",
+            reverse(catalogus),
+            HTTP_IF_NONE_MATCH=f'"{catalogus._etag}"',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(len(queries), 1)
+
+    def test_head_unknown_resource(self):
+        catalogus = CatalogusFactory.create(with_etag=True)
+        url = reverse(catalogus)
+        catalogus.delete()
+
+        response = self.client.head(url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_head_with_query_params_uses_handler(self):
+        zaaktype = ZaakTypeFactory.create(
+            concept=False, datum_begin_geldigheid=date(2021, 1, 1), with_etag=True
+        )
+
+        response = self.client.head(
+            reverse(zaaktype), {"datumGeldigheid": "2020-01-01"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_missing_etag_is_calculated(self):
+        catalogus = CatalogusFactory.create()
+        Catalogus.objects.filter(pk=catalogus.pk).update(_etag="")
+
+        response = self.client.head(reverse(catalogus))
+
+        catalogus.refresh_from_db()
+        self.assertEqual(catalogus._etag, calculate_etag(catalogus))
+        self.assertEqual(response["ETag"], f'"{catalogus._etag}"')
+
+
+class GeldigheidETagTests(JWTAuthMixin, APITestCase):
+    """
+    ETag values of resources with relations filtered on their geldigheid.
+    """
+
+    heeft_alle_autorisaties = True
+
+    def _get_etag(self, instance, **params) -> str:
+        response = self.client.get(reverse(instance), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response["ETag"]
+
+    def test_etag_per_datum_geldigheid(self):
+        zaaktype = ZaakTypeFactory.create(
+            concept=False, datum_begin_geldigheid=date(2021, 1, 1), with_etag=True
+        )
+
+        etag = self._get_etag(zaaktype, datumGeldigheid="2022-01-01")
+
+        self.assertNotEqual(etag, self._get_etag(zaaktype))
+        self.assertNotEqual(
+            etag, self._get_etag(zaaktype, datumGeldigheid="2023-01-01")
+        )
+        response = self.client.get(
+            reverse(zaaktype),
+            {"datumGeldigheid": "2022-01-01"},
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_related_geldigheid_change(self):
+        zaaktype = ZaakTypeFactory.create(with_etag=True)
+        besluittype = BesluitTypeFactory.create(
+            catalogus=zaaktype.catalogus, zaaktypen=[zaaktype]
+        )
+        etag = self._get_etag(zaaktype)
+
+        besluittype.datum_einde_geldigheid = date(2020, 1, 1)
+        besluittype.save()
+
+        response = self.client.get(reverse(zaaktype), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_deelzaaktypen_change(self):
+        zaaktype = ZaakTypeFactory.create(with_etag=True)
+        deelzaaktype = ZaakTypeFactory.create(catalogus=zaaktype.catalogus)
+        etag = self._get_etag(zaaktype)
+
+        zaaktype.deelzaaktypen.add(deelzaaktype)
+        etag_added = self._get_etag(zaaktype)
+        zaaktype.deelzaaktypen.clear()
+
+        self.assertNotEqual(etag_added, etag)
+        self.assertNotEqual(self._get_etag(zaaktype), etag_added)
+
+    def test_besluittypen_change(self):
+        zaaktype = ZaakTypeFactory.create(with_etag=True)
+        besluittype = BesluitTypeFactory.create(
+            catalogus=zaaktype.catalogus, with_etag=True
+        )
+        etags = (self._get_etag(zaaktype), self._get_etag(besluittype))
+
+        zaaktype.besluittypen.add(besluittype)
+
+        self.assertNotEqual(self._get_etag(zaaktype), etags[0])
+        self.assertNotEqual(self._get_etag(besluittype), etags[1])
+
+    def test_zaakinformatieobjecttype_change(self):
+        zaaktype = ZaakTypeFactory.create(with_etag=True)
+        informatieobjecttype = InformatieObjectTypeFactory.create(
+            catalogus=zaaktype.catalogus, with_etag=True
+        )
+        etags = (self._get_etag(zaaktype), self._get_etag(informatieobjecttype))
+
+        ZaakInformatieobjectTypeFactory.create(
+            zaaktype=zaaktype, informatieobjecttype=informatieobjecttype.omschrijving
+        )
+
+        self.assertNotEqual(self._get_etag(zaaktype), etags[0])
+        self.assertNotEqual(self._get_etag(informatieobjecttype), etags[1])
+
+
+class FillETagsTests(APITestCase):
+    def test_fill_missing_etags(self):
+        besluittype = BesluitTypeFactory.create(with_etag=True)
+        catalogus = besluittype.catalogus
+        Catalogus.objects.filter(pk=catalogus.pk).update(_etag="")
+        etag = besluittype._etag
+
+        call_command("fill_etags", stdout=StringIO())
+
+        catalogus.refresh_from_db()
+        besluittype.refresh_from_db()
+        self.assertEqual(catalogus._etag, calculate_etag(catalogus))
+        self.assertEqual(besluittype._etag, etag)
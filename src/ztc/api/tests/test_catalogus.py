@@ -1,10 +1,21 @@
+import gzip
+import json
 from datetime import date
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from rest_framework import status
 from vng_api_common.tests import get_operation_url, get_validation_errors, reverse
 
-from ztc.datamodel.models import Catalogus
-from ztc.datamodel.tests.factories import CatalogusFactory
+from ztc.datamodel.models import Catalogus, StatusType
+from ztc.datamodel.tests.factories import (
+    BesluitTypeFactory,
+    CatalogusFactory,
+    InformatieObjectTypeFactory,
+    StatusTypeFactory,
+    ZaakTypeFactory,
+)
 
 from .base import APITestCase
 
@@ -185,6 +196,95 @@ class CatalogusFilterAPITests(APITestCase):
         self.assertEqual(data[0]["url"], f"http://testserver{reverse(catalogus1)}")
 
 
+class CatalogusRelatiesAPITests(APITestCase):
+    maxDiff = None
+
+    def _create_types(self, catalogus):
+        ZaakTypeFactory.create_batch(2, catalogus=catalogus)
+        BesluitTypeFactory.create_batch(2, catalogus=catalogus)
+        InformatieObjectTypeFactory.create_batch(2, catalogus=catalogus)
+
+    def _count_queries(self, url, params=None) -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries)
+
+    def test_list_number_of_queries_independent_of_size(self):
+        self._create_types(self.catalogus)
+        baseline = self._count_queries(self.catalogus_list_url)
+
+        for catalogus in CatalogusFactory.create_batch(3):
+            self._create_types(catalogus)
+
+        self.assertEqual(self._count_queries(self.catalogus_list_url), baseline)
+
+    def test_detail_number_of_queries_independent_of_size(self):
+        self._create_types(self.catalogus)
+        baseline = self._count_queries(self.catalogus_detail_url)
+
+        self._create_types(self.catalogus)
+
+        self.assertEqual(self._count_queries(self.catalogus_detail_url), baseline)
+
+    def test_detail_relaties(self):
+        zaaktype = ZaakTypeFactory.create(catalogus=self.catalogus)
+        besluittype = BesluitTypeFactory.create(catalogus=self.catalogus)
+        iotype = InformatieObjectTypeFactory.create(catalogus=self.catalogus)
+
+        response = self.client.get(self.catalogus_detail_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+        self.assertEqual(data["zaaktypen"], [f"http://testserver{reverse(zaaktype)}"])
+        self.assertEqual(
+            data["besluittypen"], [f"http://testserver{reverse(besluittype)}"]
+        )
+        self.assertEqual(
+            data["informatieobjecttypen"], [f"http://testserver{reverse(iotype)}"]
+        )
+
+    def test_list_zonder_relaties(self):
+        self._create_types(self.catalogus)
+
+        response = self.client.get(self.catalogus_list_url, {"zonderRelaties": "true"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()["results"]
+        self.assertEqual(len(data), 1)
+        self.assertNotIn("zaaktypen", data[0])
+        self.assertNotIn("besluittypen", data[0])
+        self.assertNotIn("informatieobjecttypen", data[0])
+
+    def test_detail_zonder_relaties(self):
+        self._create_types(self.catalogus)
+
+        response = self.client.get(
+            self.catalogus_detail_url, {"zonderRelaties": "true"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+        self.assertEqual(data["domein"], self.catalogus.domein)
+        self.assertNotIn("zaaktypen", data)
+        self.assertNotIn("besluittypen", data)
+        self.assertNotIn("informatieobjecttypen", data)
+
+    def test_zonder_relaties_false(self):
+        self._create_types(self.catalogus)
+
+        response = self.client.get(
+            self.catalogus_detail_url, {"zonderRelaties": "false"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["zaaktypen"]), 2)
+
+
 class CatalogusPaginationTestCase(APITestCase):
     maxDiff = None
 
@@ -207,3 +307,100 @@ class CatalogusPaginationTestCase(APITestCase):
         self.assertEqual(response_data["count"], 1)
         self.assertIsNone(response_data["previous"])
         self.assertIsNone(response_data["next"])
+
+
+class CatalogusSnapshotAPITests(APITestCase):
+    maxDiff = None
+
+    def setUp(self):
+        super().setUp()
+
+        self.zaaktype = ZaakTypeFactory.create(catalogus=self.catalogus, concept=False)
+        self.statustype = StatusTypeFactory.create(zaaktype=self.zaaktype)
+        self.snapshot_url = reverse(
+            "catalogus-snapshot", kwargs={"uuid": self.catalogus.uuid}
+        )
+
+    def test_snapshot(self):
+        ZaakTypeFactory.create(catalogus=self.catalogus, concept=True)
+        ZaakTypeFactory.create(concept=False)
+
+        response = self.client.get(self.snapshot_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("ETag", response)
+        data = response.json()
+        self.assertEqual(
+            data["catalogus"]["url"], f"http://testserver{self.catalogus_detail_url}"
+        )
+        self.assertEqual(
+            [zaaktype["url"] for zaaktype in data["zaaktypen"]],
+            [f"http://testserver{reverse(self.zaaktype)}"],
+        )
+        self.assertEqual(
+            [statustype["url"] for statustype in data["statustypen"]],
+            [f"http://testserver{reverse(self.statustype)}"],
+        )
+        self.assertEqual(data["besluittypen"], [])
+        self.assertEqual(data["informatieobjecttypen"], [])
+
+    def test_snapshot_gzip(self):
+        response = self.client.get(self.snapshot_url, HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertTrue(response["ETag"].endswith('-gzip"'))
+        self.assertEqual(
+            json.loads(gzip.decompress(response.content)),
+            self.client.get(self.snapshot_url).json(),
+        )
+
+    def test_snapshot_datum_geldigheid(self):
+        self.zaaktype.datum_einde_geldigheid = date(2019, 1, 1)
+        self.zaaktype.save()
+        ZaakTypeFactory.create(
+            catalogus=self.catalogus,
+            concept=False,
+            datum_begin_geldigheid=date(2019, 1, 2),
+        )
+
+        response = self.client.get(self.snapshot_url, {"datumGeldigheid": "2018-06-01"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [zaaktype["url"] for zaaktype in response.json()["zaaktypen"]],
+            [f"http://testserver{reverse(self.zaaktype)}"],
+        )
+
+    def test_snapshot_invalid_query_params(self):
+        for params in ({"datumGeldigheid": "gisteren"}, {"status": "alles"}):
+            with self.subTest(params=params):
+                response = self.client.get(self.snapshot_url, params)
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_snapshot_not_modified(self):
+        etag = self.client.get(self.snapshot_url)["ETag"]
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.snapshot_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        # the catalogus and a hash of the versions per type
+        self.assertLessEqual(len(context.captured_queries), 10)
+
+    def test_snapshot_etag_changes(self):
+        etag = self.client.get(self.snapshot_url)["ETag"]
+
+        StatusType.objects.filter(pk=self.statustype.pk).update(_etag="gewijzigd")
+        response = self.client.get(self.snapshot_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_snapshot_other_datum_geldigheid_other_etag(self):
+        etag = self.client.get(self.snapshot_url)["ETag"]
+
+        response = self.client.get(self.snapshot_url, {"datumGeldigheid": "2018-06-01"})
+
+        self.assertNotEqual(response["ETag"], etag)
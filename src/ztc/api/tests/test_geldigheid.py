@@ -0,0 +1,143 @@
+from datetime import date
+
+from django.test import TestCase, override_settings
+
+from freezegun import freeze_time
+from rest_framework import status
+from vng_api_common.tests import reverse
+
+from ztc.datamodel.models import ZaakType
+from ztc.datamodel.tests.factories import BesluitTypeFactory, ZaakTypeFactory
+
+from ..geldigheid import get_geldige_uuids, invalidate_geldigheid_cache
+from .base import APITestCase
+
+
+@override_settings(GELDIGHEID_CACHE_TIMEOUT=60)
+@freeze_time("2021-06-01")
+class GeldigheidCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        # the sets of the process would otherwise contain objects of other tests
+        invalidate_geldigheid_cache()
+
+        self.geldig = ZaakTypeFactory.create(datum_begin_geldigheid=date(2021, 1, 1))
+        self.verlopen = ZaakTypeFactory.create(
+            datum_begin_geldigheid=date(2020, 1, 1),
+            datum_einde_geldigheid=date(2020, 12, 31),
+        )
+        self.toekomstig = ZaakTypeFactory.create(
+            datum_begin_geldigheid=date(2021, 7, 1)
+        )
+
+    def test_geldig_today(self):
+        for datum in (None, date(2021, 6, 1), "2021-06-01"):
+            with self.subTest(datum=datum):
+                uuids = get_geldige_uuids(ZaakType, datum)
+
+                self.assertEqual(uuids, {self.geldig.uuid})
+
+    def test_other_dates_not_cached(self):
+        self.assertIsNone(get_geldige_uuids(ZaakType, "2020-06-01"))
+
+    def test_cached(self):
+        get_geldige_uuids(ZaakType)
+
+        with self.assertNumQueries(0):
+            uuids = get_geldige_uuids(ZaakType)
+
+        self.assertEqual(uuids, {self.geldig.uuid})
+
+    def test_invalidated_on_change(self):
+        get_geldige_uuids(ZaakType)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.toekomstig.datum_begin_geldigheid = date(2021, 5, 1)
+            self.toekomstig.save()
+
+        self.assertEqual(
+            get_geldige_uuids(ZaakType), {self.geldig.uuid, self.toekomstig.uuid}
+        )
+
+    def test_refreshed_next_day(self):
+        get_geldige_uuids(ZaakType)
+
+        with freeze_time("2021-07-01"):
+            uuids = get_geldige_uuids(ZaakType)
+
+        self.assertEqual(uuids, {self.geldig.uuid, self.toekomstig.uuid})
+
+    @override_settings(GELDIGHEID_CACHE_TIMEOUT=0)
+    def test_disabled(self):
+        self.assertIsNone(get_geldige_uuids(ZaakType))
+
+
+@override_settings(GELDIGHEID_CACHE_TIMEOUT=60)
+@freeze_time("2021-06-01")
+class GeldigheidCacheAPITests(APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        invalidate_geldigheid_cache()
+
+        self.zaaktype = ZaakTypeFactory.create(
+            catalogus=self.catalogus,
+            concept=False,
+            datum_begin_geldigheid=date(2021, 1, 1),
+        )
+        self.geldig = BesluitTypeFactory.create(
+            catalogus=self.catalogus,
+            concept=False,
+            datum_begin_geldigheid=date(2021, 1, 1),
+        )
+        self.toekomstig = BesluitTypeFactory.create(
+            catalogus=self.catalogus,
+            concept=False,
+            datum_begin_geldigheid=date(2021, 7, 1),
+        )
+        self.zaaktype.besluittypen.set([self.geldig, self.toekomstig])
+
+    def _get_besluittypen(self, url: str) -> list:
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json()["besluittypen"]
+
+    def test_relations_filtered(self):
+        besluittypen = self._get_besluittypen(reverse(self.zaaktype))
+
+        self.assertEqual(besluittypen, [f"http://testserver{reverse(self.geldig)}"])
+
+    def test_relations_refreshed_on_change(self):
+        self._get_besluittypen(reverse(self.zaaktype))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.toekomstig.datum_begin_geldigheid = date(2021, 5, 1)
+            self.toekomstig.save()
+
+        besluittypen = self._get_besluittypen(reverse(self.zaaktype))
+
+        self.assertCountEqual(
+            besluittypen,
+            [
+                f"http://testserver{reverse(self.geldig)}",
+                f"http://testserver{reverse(self.toekomstig)}",
+            ],
+        )
+
+    def test_snapshot_refreshed_on_change(self):
+        snapshot_url = reverse(
+            "catalogus-snapshot", kwargs={"uuid": self.catalogus.uuid}
+        )
+        (zaaktype,) = self.client.get(snapshot_url).json()["zaaktypen"]
+        self.assertEqual(
+            zaaktype["besluittypen"], [f"http://testserver{reverse(self.geldig)}"]
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.toekomstig.datum_begin_geldigheid = date(2021, 5, 1)
+            self.toekomstig.save()
+
+        (zaaktype,) = self.client.get(snapshot_url).json()["zaaktypen"]
+        self.assertEqual(len(zaaktype["besluittypen"]), 2)
@@ -531,6 +531,25 @@ class InformatieObjectTypeFilterAPITests(APITestCase):
             data[0]["url"], f"http://testserver{informatieobjecttype1_url}"
         )
 
+    def test_filter_zoek(self):
+        informatieobjecttype1 = InformatieObjectTypeFactory.create(
+            concept=False, trefwoord=["bouwtekening", "situatieschets"]
+        )
+        InformatieObjectTypeFactory.create(concept=False, trefwoord=["foto"])
+        list_url = get_operation_url("informatieobjecttype_list")
+        informatieobjecttype1_url = get_operation_url(
+            "informatieobjecttype_retrieve", uuid=informatieobjecttype1.uuid
+        )
+
+        response = self.client.get(list_url, {"zoek": "bouwtekeningen"})
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()["results"]
+        self.assertEqual(len(data), 1)
+        self.assertEqual(
+            data[0]["url"], f"http://testserver{informatieobjecttype1_url}"
+        )
+
     def test_filter_geldigheid_get_most_recent(self):
         informatieobjecttype1 = InformatieObjectTypeFactory.create(
             concept=False,
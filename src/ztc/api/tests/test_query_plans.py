@@ -0,0 +1,203 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from vng_api_common.tests import get_operation_url, reverse
+
+from ztc.datamodel.models import ZaakType
+from ztc.datamodel.tests.factories import (
+    BesluitTypeFactory,
+    CheckListItemFactory,
+    EigenschapFactory,
+    InformatieObjectTypeFactory,
+    ResultaatTypeFactory,
+    RolTypeFactory,
+    StatusTypeFactory,
+    ZaakTypeFactory,
+    ZaakTypenRelatieFactory,
+)
+from ztc.datamodel.tests.factories.relatieklassen import ZaakInformatieobjectTypeFactory
+from ztc.datamodel.tests.factories.zaakobjecttype import ZaakObjectTypeFactory
+
+from .base import APITestCase
+
+
+class QueryBudgetTests(APITestCase):
+    """
+    Check the query plans of the viewsets: the number of queries of an endpoint
+    may not depend on the number of (related) objects it renders.
+    """
+
+    def _count_queries(self, url, params=None) -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries)
+
+    def assertListQueryBudget(self, operation_id, create, params=None):
+        url = get_operation_url(operation_id)
+        create()
+        # warm up caches which are filled on the first request
+        self._count_queries(url, params)
+        expected = self._count_queries(url, params)
+
+        for i in range(3):
+            create()
+
+        self.assertEqual(self._count_queries(url, params), expected)
+
+    def assertDetailQueryBudget(self, operation_id, instance, create_related):
+        url = get_operation_url(operation_id, uuid=instance.uuid)
+        create_related()
+        self._count_queries(url)
+        expected = self._count_queries(url)
+
+        for i in range(3):
+            create_related()
+
+        self.assertEqual(self._count_queries(url), expected)
+
+    def _create_zaaktype(self):
+        zaaktype = ZaakTypeFactory.create(
+            catalogus=self.catalogus,
+            concept=False,
+            deelzaaktypen=[ZaakTypeFactory.create(catalogus=self.catalogus)],
+        )
+        self._create_zaaktype_relations(zaaktype)
+        return zaaktype
+
+    def _create_zaaktype_relations(self, zaaktype):
+        informatieobjecttype = InformatieObjectTypeFactory.create(
+            catalogus=self.catalogus, concept=False
+        )
+        ZaakInformatieobjectTypeFactory.create(
+            zaaktype=zaaktype, informatieobjecttype=informatieobjecttype.omschrijving
+        )
+        BesluitTypeFactory.create(
+            catalogus=self.catalogus,
+            concept=False,
+            zaaktypen=[zaaktype],
+            informatieobjecttypen=[informatieobjecttype],
+        )
+        ZaakTypenRelatieFactory.create(
+            zaaktype=zaaktype,
+            gerelateerd_zaaktype=f"http://testserver{reverse(zaaktype)}",
+        )
+        eigenschap = EigenschapFactory.create(zaaktype=zaaktype)
+        StatusTypeFactory.create(
+            zaaktype=zaaktype,
+            eigenschappen=[eigenschap],
+            checklistitems=[
+                CheckListItemFactory.create(itemnaam="item", vraagstelling="vraag")
+            ],
+        )
+        ZaakObjectTypeFactory.create(zaaktype=zaaktype)
+
+    def test_zaaktype_list(self):
+        self.assertListQueryBudget(
+            "zaaktype_list", self._create_zaaktype, {"status": "alles"}
+        )
+
+    def test_zaaktype_retrieve(self):
+        zaaktype = self._create_zaaktype()
+
+        self.assertDetailQueryBudget(
+            "zaaktype_retrieve",
+            zaaktype,
+            lambda: self._create_zaaktype_relations(zaaktype),
+        )
+
+    def test_zaaktype_retrieve_fetches_instance_once(self):
+        zaaktype = self._create_zaaktype()
+        url = get_operation_url("zaaktype_retrieve", uuid=zaaktype.uuid)
+        lookup = f'"{ZaakType._meta.db_table}"."uuid" = '
+
+        for params in (
+            {},
+            {"datumGeldigheid": zaaktype.datum_begin_geldigheid.isoformat()},
+        ):
+            with self.subTest(params=params):
+                with CaptureQueriesContext(connection) as context:
+                    response = self.client.get(url, params)
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                lookups = [
+                    query
+                    for query in context.captured_queries
+                    if lookup in query["sql"]
+                ]
+                # one lookup for the ETag, one for the response
+                self.assertEqual(len(lookups), 2)
+
+    def test_statustype_list(self):
+        self.assertListQueryBudget(
+            "statustype_list", self._create_zaaktype, {"status": "alles"}
+        )
+
+    def test_eigenschap_list(self):
+        self.assertListQueryBudget(
+            "eigenschap_list", self._create_zaaktype, {"status": "alles"}
+        )
+
+    def test_roltype_list(self):
+        self.assertListQueryBudget(
+            "roltype_list",
+            lambda: RolTypeFactory.create(zaaktype=self._create_zaaktype()),
+            {"status": "alles"},
+        )
+
+    def test_resultaattype_list(self):
+        self.assertListQueryBudget(
+            "resultaattype_list", self._create_zaaktype, {"status": "alles"}
+        )
+
+    def test_resultaattype_list_with_relations(self):
+        def create():
+            zaaktype = self._create_zaaktype()
+            ResultaatTypeFactory.create(
+                zaaktype=zaaktype,
+                besluittypen=zaaktype.besluittypen.all(),
+                informatieobjecttypen=[
+                    InformatieObjectTypeFactory.create(catalogus=self.catalogus)
+                ],
+            )
+
+        self.assertListQueryBudget("resultaattype_list", create, {"status": "alles"})
+
+    def test_besluittype_list(self):
+        self.assertListQueryBudget(
+            "besluittype_list", self._create_zaaktype, {"status": "alles"}
+        )
+
+    def test_besluittype_retrieve(self):
+        besluittype = BesluitTypeFactory.create(catalogus=self.catalogus)
+
+        def create_related():
+            zaaktype = self._create_zaaktype()
+            besluittype.zaaktypen.add(zaaktype)
+            besluittype.informatieobjecttypen.add(
+                InformatieObjectTypeFactory.create(catalogus=self.catalogus)
+            )
+
+        self.assertDetailQueryBudget(
+            "besluittype_retrieve", besluittype, create_related
+        )
+
+    def test_informatieobjecttype_list(self):
+        self.assertListQueryBudget(
+            "informatieobjecttype_list", self._create_zaaktype, {"status": "alles"}
+        )
+
+    def test_zaakinformatieobjecttype_list(self):
+        self.assertListQueryBudget(
+            "zaakinformatieobjecttype_list",
+            self._create_zaaktype,
+            {"status": "alles"},
+        )
+
+    def test_zaakobjecttype_list(self):
+        self.assertListQueryBudget("zaakobjecttype_list", self._create_zaaktype)
+
+    def test_catalogus_list(self):
+        self.assertListQueryBudget("catalogus_list", self._create_zaaktype)
@@ -722,6 +722,32 @@ class ResultaatTypeFilterAPITests(APITestCase):
             data[0]["beginGeldigheid"], resultaattype2.datum_begin_geldigheid
         )
 
+    def test_datum_geldigheid_filters_besluittypen(self):
+        besluittype_old = BesluitTypeFactory.create(
+            datum_begin_geldigheid="2020-01-01",
+            datum_einde_geldigheid="2020-02-01",
+        )
+        besluittype_new = BesluitTypeFactory.create(
+            datum_begin_geldigheid="2020-02-02",
+        )
+        ResultaatTypeFactory.create(
+            zaaktype__concept=False,
+            datum_begin_geldigheid="2020-01-01",
+            besluittypen=[besluittype_old, besluittype_new],
+        )
+        list_url = reverse("resultaattype-list")
+
+        response = self.client.get(list_url, {"datumGeldigheid": "2020-01-15"})
+
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()["results"]
+
+        self.assertEqual(len(data), 1)
+        self.assertEqual(
+            data[0]["besluittypen"], [f"http://testserver{reverse(besluittype_old)}"]
+        )
+
 
 class FilterValidationTests(APITestCase):
     def test_unknown_query_params_give_error(self):
@@ -1,8 +1,13 @@
+import gzip
+
+from django.test import SimpleTestCase, override_settings
 from django.urls import reverse
 
 import yaml
 from rest_framework.test import APITestCase
 
+from ..checks import check_openapi_schema, check_openapi_schema_source
+from ..openapi import get_schema_path
 from .base import ClientAPITestMixin
 
 
@@ -27,3 +32,42 @@ class DocumentationAPITests(ClientAPITestMixin, APITestCase):
         data = yaml.safe_load(response.content.decode("utf-8"))
 
         self.assertNotIn("DynamicFieldsModel", data)
+
+    def test_schema_served_from_file(self):
+        response = self.client.get(f"{self.schema_url}openapi.yaml")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, get_schema_path().read_bytes())
+        self.assertIn("ETag", response)
+
+    def test_schema_not_modified(self):
+        url = f"{self.schema_url}openapi.yaml"
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_schema_gzip(self):
+        url = f"{self.schema_url}openapi.yaml"
+
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(
+            gzip.decompress(response.content), get_schema_path().read_bytes()
+        )
+        self.assertNotEqual(response["ETag"], self.client.get(url)["ETag"])
+
+
+class SchemaCheckTests(SimpleTestCase):
+    def test_checked_in_schema_matches_code(self):
+        self.assertEqual(check_openapi_schema(None), [])
+
+    @override_settings(OPENAPI_SCHEMA_SOURCE="database")
+    def test_unknown_schema_source(self):
+        errors = check_openapi_schema_source(None)
+
+        self.assertEqual([error.id for error in errors], ["api.E001"])
@@ -0,0 +1,40 @@
+from django.test import SimpleTestCase
+
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+from ..serializers import ResultaatTypeSerializer, ZaakTypeSerializer
+from ..utils.serializers import get_choice_values_help_text
+
+
+class CachedFieldsSerializerTests(SimpleTestCase):
+    def test_choice_values_in_help_text(self):
+        field = ZaakTypeSerializer().fields["vertrouwelijkheidaanduiding"]
+
+        self.assertTrue(
+            str(field.help_text).endswith(
+                get_choice_values_help_text(VertrouwelijkheidsAanduiding)
+            )
+        )
+        self.assertIn("Aanduiding van de mate waarin", str(field.help_text))
+
+    def test_choice_values_in_help_text_gegevensgroep(self):
+        serializer = ResultaatTypeSerializer()
+        fields = serializer.fields["brondatum_archiefprocedure"].fields
+
+        self.assertIn("`afgehandeld`", str(fields["afleidingswijze"].help_text))
+        self.assertIn("`adres`", str(fields["objecttype"].help_text))
+        self.assertIn(
+            "Uitleg bij mogelijke waarden",
+            str(serializer.fields["archiefnominatie"].help_text),
+        )
+
+    def test_fields_not_shared_between_instances(self):
+        serializer1 = ZaakTypeSerializer()
+        serializer2 = ZaakTypeSerializer()
+
+        field1 = serializer1.fields["catalogus"]
+        field2 = serializer2.fields["catalogus"]
+
+        self.assertIsNot(field1, field2)
+        self.assertIs(field1.parent, serializer1)
+        self.assertIs(field2.parent, serializer2)
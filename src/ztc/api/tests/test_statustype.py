@@ -400,6 +400,32 @@ class StatusTypeFilterAPITests(APITestCase):
         self.assertEqual(data[0]["beginGeldigheid"], statustype2.datum_begin_geldigheid)
 
 
+class StatusTypeZoekTests(APITestCase):
+    def test_zoek_zaaktypen(self):
+        statustype1 = StatusTypeFactory.create(zaaktype__concept=False)
+        statustype2 = StatusTypeFactory.create(zaaktype__concept=False)
+        StatusTypeFactory.create(zaaktype__concept=False)
+        zaaktype_urls = [
+            f"http://testserver.com{reverse(statustype.zaaktype)}"
+            for statustype in (statustype1, statustype2)
+        ]
+
+        response = self.client.post(
+            reverse("statustype--zoek"), {"zaaktypen": zaaktype_urls}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["count"], 2)
+        self.assertEqual(
+            {statustype["url"] for statustype in data["results"]},
+            {
+                f"http://testserver{reverse(statustype)}"
+                for statustype in (statustype1, statustype2)
+            },
+        )
+
+
 class FilterValidationTests(APITestCase):
     def test_unknown_query_params_give_error(self):
         StatusTypeFactory.create_batch(2)
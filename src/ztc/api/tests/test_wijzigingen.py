@@ -0,0 +1,238 @@
+from contextlib import contextmanager
+from datetime import timedelta
+from io import StringIO
+from uuid import uuid4
+
+from django.core.management import call_command
+from django.db import connections
+from django.utils import timezone
+
+from rest_framework import status
+from rest_framework.test import APITestCase, APITransactionTestCase
+from vng_api_common.tests import (
+    JWTAuthMixin,
+    get_validation_errors,
+    reverse,
+    reverse_lazy,
+)
+
+from ztc.datamodel.models import Wijziging
+from ztc.datamodel.models.wijziging import WIJZIGINGEN_LOCK
+from ztc.datamodel.tests.factories import (
+    BesluitTypeFactory,
+    CatalogusFactory,
+    ZaakTypeFactory,
+    ZaakTypenRelatieFactory,
+)
+
+
+class WijzigingRegistrationTests(APITestCase):
+    def test_create_update_destroy(self):
+        catalogus = CatalogusFactory.create()
+        catalogus.save()
+        uuid = catalogus.uuid
+        catalogus.delete()
+
+        wijzigingen = Wijziging.objects.filter(resource="catalogus", uuid=uuid)
+
+        self.assertEqual(
+            list(wijzigingen.order_by("pk").values_list("actie", flat=True)),
+            ["create", "update", "destroy"],
+        )
+
+    def test_etag_update_not_registered(self):
+        catalogus = CatalogusFactory.create()
+
+        catalogus.calculate_etag_value()
+
+        self.assertEqual(Wijziging.objects.filter(actie="update").count(), 0)
+
+    def test_nested_object_registered_as_update(self):
+        relatie = ZaakTypenRelatieFactory.create()
+        Wijziging.objects.all().delete()
+
+        relatie.delete()
+
+        wijziging = Wijziging.objects.get()
+        self.assertEqual(wijziging.resource, "zaaktype")
+        self.assertEqual(wijziging.uuid, relatie.zaaktype.uuid)
+        self.assertEqual(wijziging.actie, "update")
+
+    def test_relation_registered_for_both_objects(self):
+        besluittype = BesluitTypeFactory.create()
+        zaaktype = ZaakTypeFactory.create(catalogus=besluittype.catalogus)
+        Wijziging.objects.all().delete()
+
+        besluittype.zaaktypen.add(zaaktype)
+
+        self.assertEqual(
+            set(Wijziging.objects.values_list("resource", "uuid", "actie")),
+            {
+                ("besluittype", besluittype.uuid, "update"),
+                ("zaaktype", zaaktype.uuid, "update"),
+            },
+        )
+
+
+class WijzigingenAPITests(JWTAuthMixin, APITransactionTestCase):
+    heeft_alle_autorisaties = True
+    url = reverse_lazy("wijziging-list")
+
+    def setUp(self):
+        super().setUp()
+        self._create_credentials(
+            self.client_id,
+            self.secret,
+            self.heeft_alle_autorisaties,
+            self.max_vertrouwelijkheidaanduiding,
+        )
+
+    @contextmanager
+    def _open_transaction(self, sql: str, params=()):
+        """
+        Keep a transaction with a transaction ID open in another connection.
+        """
+        connection = connections.create_connection("default")
+        try:
+            connection.set_autocommit(False)
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+            yield
+        finally:
+            connection.rollback()
+            connection.close()
+
+    def _get_catalogus_urls(self) -> list:
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [
+            wijziging["url"]
+            for wijziging in response.json()["results"]
+            if wijziging["resource"] == "catalogus"
+        ]
+
+    def test_list_wijzigingen(self):
+        catalogus = CatalogusFactory.create(with_etag=True)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertIsNone(data["next"])
+        self.assertEqual(
+            data["results"][-1],
+            {
+                "resource": "catalogus",
+                "url": f"http://testserver{reverse(catalogus)}",
+                "actie": "create",
+                "etag": catalogus._etag,
+                "aangemaakt": data["results"][-1]["aangemaakt"],
+            },
+        )
+
+    def test_sinds_cursor(self):
+        CatalogusFactory.create()
+        cursor = self.client.get(self.url).json()["cursor"]
+        catalogus = CatalogusFactory.create()
+        catalogus.save()
+        catalogus.delete()
+
+        response = self.client.get(self.url, {"sinds": cursor})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(
+            [
+                (wijziging["resource"], wijziging["actie"])
+                for wijziging in data["results"]
+            ],
+            [
+                ("catalogus", "create"),
+                ("catalogus", "update"),
+                ("catalogus", "destroy"),
+            ],
+        )
+        self.assertIsNone(data["results"][-1]["etag"])
+        self.assertNotEqual(data["cursor"], cursor)
+
+        response = self.client.get(self.url, {"sinds": data["cursor"]})
+
+        self.assertEqual(response.json()["results"], [])
+        self.assertEqual(response.json()["cursor"], data["cursor"])
+
+    def test_unrelated_transaction_in_progress(self):
+        with self._open_transaction("SELECT txid_current()"):
+            catalogus = CatalogusFactory.create()
+
+            urls = self._get_catalogus_urls()
+
+        self.assertEqual(urls, [f"http://testserver{reverse(catalogus)}"])
+
+    def test_writing_transaction_in_progress(self):
+        with self._open_transaction(
+            "SELECT pg_advisory_xact_lock_shared(%s), txid_current()",
+            [WIJZIGINGEN_LOCK],
+        ):
+            catalogus = CatalogusFactory.create()
+
+            # the other transaction can still write changes before this one
+            self.assertEqual(self._get_catalogus_urls(), [])
+
+        self.assertEqual(
+            self._get_catalogus_urls(), [f"http://testserver{reverse(catalogus)}"]
+        )
+
+    def test_next_page(self):
+        Wijziging.objects.registreer(
+            "zaaktype", [uuid4() for i in range(120)], "create"
+        )
+
+        response = self.client.get(self.url)
+
+        data = response.json()
+        self.assertEqual(len(data["results"]), 100)
+        self.assertEqual(
+            data["next"], f"http://testserver{self.url}?sinds={data['cursor']}"
+        )
+
+        response = self.client.get(data["next"])
+
+        self.assertEqual(len(response.json()["results"]), 20)
+        self.assertIsNone(response.json()["next"])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {"sinds": "10"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_cursor_before_deleted_changes(self):
+        oud = timezone.now() - timedelta(days=100)
+        CatalogusFactory.create()
+        expired = self.client.get(self.url).json()["cursor"]
+        CatalogusFactory.create()
+        Wijziging.objects.update(aangemaakt=oud)
+        catalogus = CatalogusFactory.create()
+
+        call_command("clean_wijzigingen", keep_days=90, stdout=StringIO())
+
+        self.assertEqual(
+            list(Wijziging.objects.values_list("uuid", flat=True)), [catalogus.uuid]
+        )
+        response = self.client.get(self.url, {"sinds": expired})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "sinds")
+        self.assertEqual(error["code"], "verlopen-cursor")
+
+    def test_newest_change_kept(self):
+        CatalogusFactory.create()
+        CatalogusFactory.create()
+        cursor = self.client.get(self.url).json()["cursor"]
+        Wijziging.objects.update(aangemaakt=timezone.now() - timedelta(days=100))
+
+        call_command("clean_wijzigingen", keep_days=90, stdout=StringIO())
+
+        self.assertEqual(Wijziging.objects.count(), 1)
+        response = self.client.get(self.url, {"sinds": cursor})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["results"], [])
@@ -1361,6 +1361,64 @@ class ZaakTypeFilterAPITests(APITestCase):
         self.assertEqual(len(data), 1)
         self.assertEqual(data[0]["url"], f"http://testserver{zaaktype1_url}")
 
+    def test_filter_trefwoorden_all_and_any(self):
+        zaaktype1 = ZaakTypeFactory.create(
+            concept=False, trefwoorden=["some", "key", "words"]
+        )
+        zaaktype2 = ZaakTypeFactory.create(
+            concept=False, trefwoorden=["other", "words"]
+        )
+        ZaakTypeFactory.create(concept=False, trefwoorden=["unrelated"])
+        zaaktypen_list_url = get_operation_url("zaaktype_list")
+        zaaktype1_url = get_operation_url("zaaktype_retrieve", uuid=zaaktype1.uuid)
+        zaaktype2_url = get_operation_url("zaaktype_retrieve", uuid=zaaktype2.uuid)
+
+        with self.subTest(mode="all"):
+            response = self.client.get(zaaktypen_list_url, {"trefwoorden": "key,other"})
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json()["results"], [])
+
+        with self.subTest(mode="any"):
+            response = self.client.get(
+                zaaktypen_list_url, {"trefwoorden__overlap": "key,other"}
+            )
+
+            self.assertEqual(response.status_code, 200)
+            urls = {zaaktype["url"] for zaaktype in response.json()["results"]}
+            self.assertEqual(
+                urls,
+                {
+                    f"http://testserver{zaaktype1_url}",
+                    f"http://testserver{zaaktype2_url}",
+                },
+            )
+
+    def test_filter_zoek(self):
+        zaaktype1 = ZaakTypeFactory.create(
+            concept=False, doel="Aanvragen van een parkeervergunning"
+        )
+        zaaktype2 = ZaakTypeFactory.create(
+            concept=False,
+            zaaktype_omschrijving="Parkeervergunning",
+            trefwoorden=["parkeren"],
+        )
+        ZaakTypeFactory.create(concept=False, zaaktype_omschrijving="Paspoort")
+        zaaktypen_list_url = get_operation_url("zaaktype_list")
+
+        response = self.client.get(zaaktypen_list_url, {"zoek": "parkeervergunningen"})
+
+        self.assertEqual(response.status_code, 200)
+        # matches in the omschrijving rank higher than matches in the doel
+        urls = [zaaktype["url"] for zaaktype in response.json()["results"]]
+        self.assertEqual(
+            urls,
+            [
+                f"http://testserver{reverse(zaaktype)}"
+                for zaaktype in (zaaktype2, zaaktype1)
+            ],
+        )
+
     def test_filter_invalid_resource_url(self):
         ZaakTypeFactory.create()
         url = get_operation_url("zaaktype_list")
@@ -1378,6 +1436,101 @@ class ZaakTypeFilterAPITests(APITestCase):
                 self.assertEqual(response.data["count"], 0)
 
 
+class ZaakTypeZoekTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.url = reverse("zaaktype--zoek")
+
+    def test_zoek_urls(self):
+        zaaktype1, zaaktype2, _ = ZaakTypeFactory.create_batch(3, concept=False)
+        zaaktype_urls = [
+            f"http://testserver.com{reverse(zaaktype)}"
+            for zaaktype in (zaaktype1, zaaktype2)
+        ]
+
+        response = self.client.post(self.url, {"urls": zaaktype_urls})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["count"], 2)
+        self.assertEqual(
+            {zaaktype["url"] for zaaktype in data["results"]},
+            {
+                f"http://testserver{reverse(zaaktype)}"
+                for zaaktype in (zaaktype1, zaaktype2)
+            },
+        )
+
+    def test_zoek_uuids_and_urls(self):
+        zaaktype1, zaaktype2, _ = ZaakTypeFactory.create_batch(3, concept=False)
+
+        response = self.client.post(
+            self.url,
+            {
+                "uuids": [str(zaaktype1.uuid)],
+                "urls": [f"http://testserver.com{reverse(zaaktype2)}"],
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {zaaktype["url"] for zaaktype in response.json()["results"]},
+            {
+                f"http://testserver{reverse(zaaktype)}"
+                for zaaktype in (zaaktype1, zaaktype2)
+            },
+        )
+
+    def test_zoek_identificaties_datum_geldigheid(self):
+        zaaktype_oud = ZaakTypeFactory.create(
+            concept=False,
+            identificatie="ZAAKTYPE1",
+            datum_begin_geldigheid=date(2020, 1, 1),
+            datum_einde_geldigheid=date(2020, 12, 31),
+        )
+        ZaakTypeFactory.create(
+            concept=False,
+            identificatie="ZAAKTYPE1",
+            datum_begin_geldigheid=date(2021, 1, 1),
+            catalogus=zaaktype_oud.catalogus,
+        )
+        ZaakTypeFactory.create(concept=False, identificatie="ZAAKTYPE2")
+
+        response = self.client.post(
+            self.url, {"identificaties": ["ZAAKTYPE1"], "datumGeldigheid": "2020-06-01"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["count"], 1)
+        self.assertEqual(
+            data["results"][0]["url"], f"http://testserver{reverse(zaaktype_oud)}"
+        )
+
+    def test_zoek_concepts_only_with_status(self):
+        zaaktype = ZaakTypeFactory.create(concept=True)
+        zaaktype_url = f"http://testserver.com{reverse(zaaktype)}"
+
+        with self.subTest(status="default"):
+            response = self.client.post(self.url, {"urls": [zaaktype_url]})
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.json()["count"], 0)
+
+        with self.subTest(status="alles"):
+            response = self.client.post(
+                self.url, {"urls": [zaaktype_url], "status": "alles"}
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.json()["count"], 1)
+
+    def test_zoek_invalid_url(self):
+        response = self.client.post(self.url, {"urls": ["not-a-url"]})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
 class FilterValidationTests(APITestCase):
     def test_unknown_query_params_give_error(self):
         ZaakTypeFactory.create_batch(2, concept=False)
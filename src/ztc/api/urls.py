@@ -2,7 +2,7 @@ from django.conf.urls import url
 from django.urls import include, path
 
 from vng_api_common import routers
-from vng_api_common.views import SchemaViewAPI, SchemaViewRedoc
+from vng_api_common.views import SchemaViewRedoc
 
 from .views import (
     BesluitTypeViewSet,
@@ -12,10 +12,12 @@ from .views import (
     ResultaatTypeViewSet,
     RolTypeViewSet,
     StatusTypeViewSet,
+    WijzigingViewSet,
     ZaakObjectTypeViewSet,
     ZaakTypeInformatieObjectTypeViewSet,
     ZaakTypeViewSet,
 )
+from .views.schema import SchemaViewAPI
 
 router = routers.DefaultRouter()
 router.register(r"catalogussen", CatalogusViewSet)
@@ -28,6 +30,7 @@ router.register(r"informatieobjecttypen", InformatieObjectTypeViewSet)
 router.register(r"besluittypen", BesluitTypeViewSet)
 router.register(r"resultaattypen", ResultaatTypeViewSet)
 router.register(r"zaaktype-informatieobjecttypen", ZaakTypeInformatieObjectTypeViewSet)
+router.register(r"wijzigingen", WijzigingViewSet)
 
 
 urlpatterns = [
@@ -1,4 +1,18 @@
+import copy
+from functools import lru_cache
+
+from django.utils.text import format_lazy
+
 from rest_framework import fields as drf_fields
+from vng_api_common.serializers import add_choice_values_help_text
+
+
+@lru_cache(maxsize=None)
+def get_choice_values_help_text(choices) -> str:
+    """
+    Cached variant of ``add_choice_values_help_text``, the choices are static.
+    """
+    return add_choice_values_help_text(choices)
 
 
 class SourceMappingSerializerMixin(object):
@@ -25,6 +39,54 @@ class SourceMappingSerializerMixin(object):
         return extra_kwargs
 
 
+# NOTE: the serializer mixins below deliberately have no docstring, since
+# drf-spectacular falls back on the docstrings of base classes to describe the
+# components in the API schema.
+
+
+# Read the `Meta.choice_help_text` attribute and append the explanation of the
+# possible choice values to the `help_text` of the fields.
+class ChoiceHelpTextSerializerMixin(object):
+    def get_extra_kwargs(self):
+        extra_kwargs = super().get_extra_kwargs()
+
+        choice_help_text = getattr(self.Meta, "choice_help_text", None)
+        if choice_help_text is not None:
+            if not isinstance(choice_help_text, dict):
+                raise TypeError(
+                    "The `choice_help_text` option must be a dict. "
+                    "Got %s." % type(choice_help_text).__name__
+                )
+            for field_name, choices in choice_help_text.items():
+                kwargs = extra_kwargs.get(field_name, {})
+                help_text = kwargs.get("help_text")
+                if help_text is None:
+                    source = kwargs.get("source", field_name)
+                    help_text = self.Meta.model._meta.get_field(source).help_text
+                kwargs["help_text"] = format_lazy(
+                    "{}\n\n{}", help_text, get_choice_values_help_text(choices)
+                )
+                extra_kwargs[field_name] = kwargs
+
+        return extra_kwargs
+
+
+# Build the serializer fields once per serializer class. Building the fields of
+# a model serializer requires introspection of the model, which would otherwise
+# be repeated for every (nested) serializer instance. The built fields are kept
+# on the class and every instance gets a deep copy, similar to what DRF does for
+# the declared fields.
+class CachedFieldsSerializerMixin(object):
+    def get_fields(self):
+        cls = type(self)
+        # look in the class itself, subclasses build their own fields
+        fields = cls.__dict__.get("_cached_fields")
+        if fields is None:
+            fields = super().get_fields()
+            cls._cached_fields = fields
+        return copy.deepcopy(fields)
+
+
 def get_from_serializer_data_or_instance(field, data, serializer):
     serializer_field = serializer.fields[field]
     # TODO: this won't work with source="*" or nested references
@@ -0,0 +1,24 @@
+import re
+from functools import lru_cache
+from typing import Optional, Pattern
+from urllib.parse import urlparse
+
+UUID_PATTERN = "[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+
+
+@lru_cache(maxsize=None)
+def get_detail_url_pattern(resource: str) -> Pattern:
+    return re.compile(
+        rf"/{re.escape(resource)}/(?P<uuid>{UUID_PATTERN})$", re.IGNORECASE
+    )
+
+
+def get_uuid_from_url(url: str, resource: str) -> Optional[str]:
+    """
+    Return the UUID of a detail URL of ``resource``, or ``None`` for other URLs.
+
+    Only the path is matched, the URL is not resolved and the object is not
+    fetched.
+    """
+    match = get_detail_url_pattern(resource).search(urlparse(url).path)
+    return match.group("uuid") if match else None
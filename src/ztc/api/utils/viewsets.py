@@ -2,7 +2,9 @@ import datetime
 import uuid
 from urllib.parse import urlparse
 
-from django.db.models import Q
+from django.contrib.postgres.fields import ArrayField
+from django.db.models import Q, Subquery
+from django.utils.functional import cached_property
 
 from vng_api_common.tests import reverse
 
@@ -13,6 +15,8 @@ from ztc.datamodel.models import (
     ZaakType,
 )
 
+from ..geldigheid import get_geldige_uuids, get_geldigheid_filter
+
 
 def is_valid_url(url):
     try:
@@ -78,6 +82,43 @@ class FilterSearchOrderingViewSetMixin(object):
         return self.get_model_option("search_fields")
 
 
+class ArraySubquery(Subquery):
+    """
+    Collect the single column of ``queryset`` into an array.
+
+    Backport of ``django.contrib.postgres.expressions.ArraySubquery`` (Django 4.0).
+    """
+
+    template = "ARRAY(%(subquery)s)"
+
+    @cached_property
+    def output_field(self):
+        return ArrayField(self.query.output_field)
+
+
+class QueryPlan:
+    """
+    Declare the relations a viewset action needs to render its serializer.
+
+    ``select_related`` and ``prefetch_related`` are passed on as-is, ``annotate``
+    maps annotation names to expressions.
+    """
+
+    def __init__(self, select_related=(), prefetch_related=(), annotate=None):
+        self.select_related = tuple(select_related)
+        self.prefetch_related = tuple(prefetch_related)
+        self.annotate = annotate or {}
+
+    def apply(self, queryset):
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        if self.annotate:
+            queryset = queryset.annotate(**self.annotate)
+        return queryset
+
+
 MAPPING_FIELD_TO_MODEL = {
     "zaaktypen": ZaakType,
     "deelzaaktypen": ZaakType,
@@ -131,56 +172,55 @@ def m2m_array_of_str_to_url(request, m2m_fields: list, action: str):
 
 def extract_relevant_m2m(serializer, m2m_fields: list, action: str, date=None):
     """ "filters down the m2m model fields array to show objects related to submitted `date` or datetime.now()"""
+    data = serializer.data if action == "list" else [serializer.data]
     for m2m_field in m2m_fields:
-        data = serializer.data if action == "list" else [serializer.data]
+        # collect the UUIDs of the whole page first, so the geldigheid check
+        # costs a single query per field instead of one per URL
+        uuids = {
+            get_uuid_from_m2m_object(m2m_object)
+            for query_object in data
+            for m2m_object in query_object[m2m_field]
+        }
+        if not uuids:
+            continue
+
+        # the objects valid today are kept in memory, other dates are queried
+        valid_uuids = get_geldige_uuids(MAPPING_FIELD_TO_MODEL[m2m_field], date)
+        if valid_uuids is None:
+            valid_uuids = set(
+                get_valid_m2m_objects(m2m_field, uuids, date).values_list(
+                    "uuid", flat=True
+                )
+            )
         for query_object in data:
-            valid_urls = []
-            for m2m_object in query_object[m2m_field]:
-                if isinstance(m2m_object, dict):
-                    for key, value in m2m_object.items():
-                        if is_valid_url(value):
-                            uuid_from_url = uuid.UUID(
-                                m2m_object[key].rsplit("/", 1)[1]
-                            ).hex
+            query_object[m2m_field][:] = [
+                m2m_object
+                for m2m_object in query_object[m2m_field]
+                if get_uuid_from_m2m_object(m2m_object) in valid_uuids
+            ]
 
-                else:
-                    uuid_from_url = uuid.UUID(m2m_object.rsplit("/", 1)[1]).hex
-                valid_m2m = get_valid_m2m_objects(m2m_field, uuid_from_url, date)
-                if valid_m2m:
-                    valid_urls.append(m2m_object)
+    return serializer
 
-            query_object[m2m_field].clear()
-            query_object[m2m_field].extend(valid_urls)
 
-    return serializer
+def get_uuid_from_m2m_object(m2m_object) -> uuid.UUID:
+    if isinstance(m2m_object, dict):
+        urls = [value for value in m2m_object.values() if is_valid_url(value)]
+        m2m_object = urls[-1]
+    return uuid.UUID(m2m_object.rsplit("/", 1)[1])
 
 
-def get_valid_m2m_objects(m2m_field: str, uuid_from_url, date=None):
+def get_valid_m2m_objects(m2m_field: str, uuids, date=None):
+    """
+    Return the objects of ``uuids`` which are valid on ``date`` (or today).
+
+    An object is valid if it started on or before the date and either ended on or
+    after it, or has no end date.
+    """
     relevant_date = date if date else datetime.datetime.now()
-    search_parameter = Q(
-        uuid=uuid_from_url,
-        datum_begin_geldigheid__lte=relevant_date,
-        datum_einde_geldigheid__gte=relevant_date,
+    return MAPPING_FIELD_TO_MODEL[m2m_field].objects.filter(
+        get_geldigheid_filter(relevant_date), uuid__in=uuids
     )
 
-    qs_old_version = MAPPING_FIELD_TO_MODEL[m2m_field].objects.filter(search_parameter)
-    if not qs_old_version:
-        if date:
-            search_parameter = Q(
-                datum_begin_geldigheid__lte=date,
-                datum_einde_geldigheid=None,
-                uuid=uuid_from_url,
-            )
-        else:
-            search_parameter = Q(
-                datum_einde_geldigheid=None,
-                datum_begin_geldigheid__lte=datetime.datetime.now(),
-                uuid=uuid_from_url,
-            )
-
-        return MAPPING_FIELD_TO_MODEL[m2m_field].objects.filter(search_parameter)
-    return qs_old_version
-
 
 def has_valid_non_concept_m2m_relations(instance, m2m):
     """
@@ -6,5 +6,6 @@ from .relatieklassen import *  # noqa
 from .resultaattype import *  # noqa
 from .roltype import *  # noqa
 from .statustype import *  # noqa
+from .wijziging import *  # noqa
 from .zaakobjecttype import *  # noqa
 from .zaken import *  # noqa
@@ -2,10 +2,10 @@ from django.utils.translation import gettext as _
 
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import viewsets
-from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from ...datamodel.models import BesluitType
+from ..caching import conditional_retrieve
 from ..filters import BesluitTypeFilter
 from ..kanalen import KANAAL_BESLUITTYPEN
 from ..scopes import (
@@ -19,11 +19,14 @@ from ..serializers import (
     BesluitTypeSerializer,
     BesluitTypeUpdateSerializer,
 )
-from ..utils.viewsets import extract_relevant_m2m, m2m_array_of_str_to_url
+from ..utils.viewsets import QueryPlan, extract_relevant_m2m, m2m_array_of_str_to_url
 from .mixins import (
+    AsyncReadMixin,
     ConceptMixin,
     ForcedCreateUpdateMixin,
     M2MConceptDestroyMixin,
+    NotificatieOutboxMixin,
+    QueryPlanMixin,
     swagger_publish_schema,
 )
 
@@ -70,7 +73,10 @@ from .mixins import (
     ),
 )
 class BesluitTypeViewSet(
+    AsyncReadMixin,
     CheckQueryParamsMixin,
+    QueryPlanMixin,
+    NotificatieOutboxMixin,
     ConceptMixin,
     M2MConceptDestroyMixin,
     ForcedCreateUpdateMixin,
@@ -83,6 +89,12 @@ class BesluitTypeViewSet(
     )
 
     queryset = BesluitType.objects.all().order_by("-pk")
+    query_plan = {
+        "read": QueryPlan(
+            select_related=["catalogus"],
+            prefetch_related=["zaaktypen", "informatieobjecttypen", "resultaattypen"],
+        ),
+    }
     serializer_class = BesluitTypeSerializer
     filterset_class = BesluitTypeFilter
     lookup_field = "uuid"
@@ -148,7 +160,8 @@ class BesluitTypeViewSet(
 
     def perform_create(self, serializer):
         """automatically create new zaaktype relations when creating a new version of a besluittype"""
-        new_besluittype = serializer.save()
+        super().perform_create(serializer)
+        new_besluittype = serializer.instance
         besluittypen = BesluitType.objects.filter(
             omschrijving=serializer.data.get("omschrijving", [])
         )
@@ -1,15 +1,34 @@
+import gzip
+
+from django.db.models import Prefetch
+from django.http import HttpResponse
+from django.middleware.gzip import re_accepts_gzip
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import quote_etag
 from django.utils.translation import gettext as _
 
 from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
-from rest_framework import mixins, viewsets
-from vng_api_common.caching import conditional_retrieve
+from rest_framework import mixins, serializers, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.settings import api_settings
+from vng_api_common.schema import COMMON_ERRORS
+from vng_api_common.serializers import FoutSerializer, ValidatieFoutSerializer
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
-from ztc.datamodel.models import Catalogus
+from ztc.datamodel.constants import (
+    DATUM_GELDIGHEID_QUERY_PARAM,
+    ZONDER_RELATIES_QUERY_PARAM,
+)
+from ztc.datamodel.models import BesluitType, Catalogus, InformatieObjectType, ZaakType
 
+from ..caching import conditional_retrieve
 from ..filters import CatalogusFilter
 from ..scopes import SCOPE_CATALOGI_READ, SCOPE_CATALOGI_WRITE
-from ..serializers import CatalogusSerializer
+from ..serializers import CatalogusSerializer, CatalogusSnapshotSerializer
+from ..snapshot import get_gzipped_snapshot, get_snapshot_etag
+from ..utils.viewsets import QueryPlan
+from .mixins import AsyncReadMixin, QueryPlanMixin
 
 
 @conditional_retrieve()
@@ -21,6 +40,7 @@ from ..serializers import CatalogusSerializer
     retrieve=extend_schema(
         summary=_("Een specifieke CATALOGUS opvragen."),
         description=_("Een specifieke CATALOGUS opvragen."),
+        parameters=[ZONDER_RELATIES_QUERY_PARAM],
     ),
     create=extend_schema(
         summary=_("Maak een CATALOGUS aan."),
@@ -43,7 +63,11 @@ from ..serializers import CatalogusSerializer
     ),
 )
 class CatalogusViewSet(
-    CheckQueryParamsMixin, mixins.CreateModelMixin, viewsets.ReadOnlyModelViewSet
+    AsyncReadMixin,
+    CheckQueryParamsMixin,
+    QueryPlanMixin,
+    mixins.CreateModelMixin,
+    viewsets.ReadOnlyModelViewSet,
 ):
     global_description = (
         "Opvragen en bewerken van CATALOGUSsen. De verzameling van ZAAKTYPEn, INFORMATIEOBJECTTYPEn en "
@@ -51,12 +75,111 @@ class CatalogusViewSet(
     )
 
     queryset = Catalogus.objects.all().order_by("-pk")
+    query_plan = {
+        # only the UUID is needed to build the URL-references
+        "read": QueryPlan(
+            prefetch_related=[
+                Prefetch(
+                    "zaaktype_set",
+                    queryset=ZaakType.objects.only("uuid", "catalogus_id"),
+                ),
+                Prefetch(
+                    "besluittype_set",
+                    queryset=BesluitType.objects.only("uuid", "catalogus_id"),
+                ),
+                Prefetch(
+                    "informatieobjecttype_set",
+                    queryset=InformatieObjectType.objects.only("uuid", "catalogus_id"),
+                ),
+            ]
+        ),
+    }
     serializer_class = CatalogusSerializer
-    filter_class = CatalogusFilter
+    filterset_class = CatalogusFilter
     lookup_field = "uuid"
     required_scopes = {
         "list": SCOPE_CATALOGI_READ,
         "retrieve": SCOPE_CATALOGI_READ,
         "create": SCOPE_CATALOGI_WRITE,
         "destroy": SCOPE_CATALOGI_WRITE,
+        "snapshot": SCOPE_CATALOGI_READ,
     }
+
+    def get_query_plan(self):
+        if self.zonder_relaties:
+            return None
+        if self.action == "snapshot":
+            return self.query_plan["read"]
+        return super().get_query_plan()
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["zonder_relaties"] = self.zonder_relaties
+        return context
+
+    @property
+    def zonder_relaties(self) -> bool:
+        """
+        Handled in the viewset, the filter only documents the query parameter.
+        """
+        query_params = getattr(getattr(self, "request", None), "query_params", None)
+        if query_params is None:
+            return False
+        value = query_params.get("zonderRelaties", "")
+        return value.lower() in ("true", "1")
+
+    @extend_schema(
+        summary=_("De volledige CATALOGUS in één document opvragen."),
+        description=_(
+            "De CATALOGUS met al zijn ZAAKTYPEn, INFORMATIEOBJECTTYPEn en "
+            "BESLUITTYPEn en de onderliggende objecten, zoals de lijst-endpoints "
+            "deze tonen. Het document wordt met gzip gecomprimeerd als de client "
+            "dit accepteert en heeft een ETag, die wijzigt zodra een van de objecten "
+            "wijzigt."
+        ),
+        parameters=[DATUM_GELDIGHEID_QUERY_PARAM],
+        responses={
+            status.HTTP_200_OK: CatalogusSnapshotSerializer,
+            status.HTTP_400_BAD_REQUEST: ValidatieFoutSerializer,
+            status.HTTP_404_NOT_FOUND: FoutSerializer,
+            **{exc.status_code: FoutSerializer for exc in COMMON_ERRORS},
+        },
+    )
+    @action(detail=True, methods=["get"])
+    def snapshot(self, request, *args, **kwargs):
+        unknown_params = set(request.query_params) - {"datumGeldigheid"}
+        if unknown_params:
+            msg = _("Onbekende query parameters: %s") % ", ".join(unknown_params)
+            raise ValidationError(
+                {api_settings.NON_FIELD_ERRORS_KEY: msg}, code="unknown-parameters"
+            )
+
+        datum_geldigheid = request.query_params.get("datumGeldigheid")
+        if datum_geldigheid is not None:
+            try:
+                serializers.DateField().run_validation(datum_geldigheid)
+            except ValidationError as exc:
+                raise ValidationError({"datumGeldigheid": exc.detail})
+
+        catalogus = self.get_object()
+        use_gzip = re_accepts_gzip.search(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        versie = get_snapshot_etag(request, catalogus, datum_geldigheid)
+        etag = quote_etag(f"{versie}-gzip" if use_gzip else versie)
+
+        # the stored versions suffice to answer a conditional request
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            patch_vary_headers(not_modified, ("Accept-Encoding",))
+            return not_modified
+
+        catalogus_data = self.get_serializer(catalogus).data
+        content = get_gzipped_snapshot(request, catalogus_data, catalogus, versie)
+        if not use_gzip:
+            content = gzip.decompress(content)
+
+        response = HttpResponse(content, content_type="application/json")
+        if use_gzip:
+            response["Content-Encoding"] = "gzip"
+        response["ETag"] = etag
+        patch_vary_headers(response, ("Accept-Encoding",))
+        return response
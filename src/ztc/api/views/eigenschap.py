@@ -2,11 +2,11 @@ from django.utils.translation import gettext as _
 
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import viewsets
-from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from ztc.datamodel.models import Eigenschap
 
+from ..caching import conditional_retrieve
 from ..filters import EigenschapFilter
 from ..scopes import (
     SCOPE_CATALOGI_FORCED_DELETE,
@@ -14,8 +14,15 @@ from ..scopes import (
     SCOPE_CATALOGI_READ,
     SCOPE_CATALOGI_WRITE,
 )
-from ..serializers import EigenschapSerializer
-from .mixins import ForcedCreateUpdateMixin, ZaakTypeConceptMixin
+from ..serializers import EigenschapSerializer, EigenschapZoekSerializer
+from ..utils.viewsets import QueryPlan
+from .mixins import (
+    AsyncReadMixin,
+    ForcedCreateUpdateMixin,
+    QueryPlanMixin,
+    ZaakTypeConceptMixin,
+    ZoekMixin,
+)
 
 
 @conditional_retrieve()
@@ -52,9 +59,20 @@ from .mixins import ForcedCreateUpdateMixin, ZaakTypeConceptMixin
             "Verwijder een EIGENSCHAP. Dit kan alleen als het bijbehorende ZAAKTYPE een concept betreft."
         ),
     ),
+    _zoek=extend_schema(
+        summary=_("Zoek EIGENSCHAPpen."),
+        description=_(
+            "Zoek EIGENSCHAPpen met lijsten van UUIDs, URL-referenties of identificaties, "
+            "die niet in de query-string passen. De filters van de lijst kunnen ook "
+            "in de body opgegeven worden."
+        ),
+    ),
 )
 class EigenschapViewSet(
+    AsyncReadMixin,
     CheckQueryParamsMixin,
+    QueryPlanMixin,
+    ZoekMixin,
     ZaakTypeConceptMixin,
     ForcedCreateUpdateMixin,
     viewsets.ModelViewSet,
@@ -67,11 +85,23 @@ class EigenschapViewSet(
     )
 
     queryset = Eigenschap.objects.all().order_by("-pk")
+    query_plan = {
+        "read": QueryPlan(
+            select_related=[
+                "zaaktype__catalogus",
+                "specificatie_van_eigenschap",
+                "statustype",
+            ]
+        ),
+        "write": QueryPlan(select_related=["zaaktype", "specificatie_van_eigenschap"]),
+    }
     serializer_class = EigenschapSerializer
     filterset_class = EigenschapFilter
+    search_input_serializer_class = EigenschapZoekSerializer
     lookup_field = "uuid"
     required_scopes = {
         "list": SCOPE_CATALOGI_READ,
+        "_zoek": SCOPE_CATALOGI_READ,
         "retrieve": SCOPE_CATALOGI_READ,
         "create": SCOPE_CATALOGI_WRITE | SCOPE_CATALOGI_FORCED_WRITE,
         "update": SCOPE_CATALOGI_WRITE | SCOPE_CATALOGI_FORCED_WRITE,
@@ -1,12 +1,13 @@
+from django.db.models import OuterRef
 from django.utils.translation import gettext as _
 
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import viewsets
 from rest_framework.response import Response
-from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
-from ...datamodel.models import InformatieObjectType
+from ...datamodel.models import InformatieObjectType, ZaakInformatieobjectType
+from ..caching import conditional_retrieve
 from ..filters import InformatieObjectTypeFilter
 from ..kanalen import KANAAL_INFORMATIEOBJECTTYPEN
 from ..scopes import (
@@ -16,11 +17,14 @@ from ..scopes import (
     SCOPE_CATALOGI_WRITE,
 )
 from ..serializers import InformatieObjectTypeSerializer
-from ..utils.viewsets import extract_relevant_m2m
+from ..utils.viewsets import ArraySubquery, QueryPlan, extract_relevant_m2m
 from .mixins import (
+    AsyncReadMixin,
     ConceptMixin,
     ForcedCreateUpdateMixin,
     M2MConceptDestroyMixin,
+    NotificatieOutboxMixin,
+    QueryPlanMixin,
     swagger_publish_schema,
 )
 
@@ -67,7 +71,10 @@ from .mixins import (
     ),
 )
 class InformatieObjectTypeViewSet(
+    AsyncReadMixin,
     CheckQueryParamsMixin,
+    QueryPlanMixin,
+    NotificatieOutboxMixin,
     ConceptMixin,
     M2MConceptDestroyMixin,
     ForcedCreateUpdateMixin,
@@ -80,6 +87,20 @@ class InformatieObjectTypeViewSet(
     )
 
     queryset = InformatieObjectType.objects.all().order_by("-pk")
+    query_plan = {
+        "read": QueryPlan(
+            select_related=["catalogus", "omschrijving_generiek"],
+            prefetch_related=["besluittypen"],
+            annotate={
+                # used by `InformatieObjectTypeSerializer.get_zaaktypen`
+                "zaaktype_uuids": ArraySubquery(
+                    ZaakInformatieobjectType.objects.filter(
+                        informatieobjecttype=OuterRef("omschrijving")
+                    ).values("zaaktype__uuid")
+                )
+            },
+        ),
+    }
     serializer_class = InformatieObjectTypeSerializer
     filterset_class = InformatieObjectTypeFilter
     lookup_field = "uuid"
@@ -1,19 +1,29 @@
-from functools import wraps
-from typing import Union
+from collections import defaultdict
+from functools import update_wrapper, wraps
+from typing import Optional, Union
 
-from django.db import models
+from django.conf import settings
+from django.db import close_old_connections, models, transaction
 from django.utils.translation import ugettext_lazy as _
 
+from asgiref.sync import sync_to_async
 from drf_spectacular.utils import extend_schema
+from notifications_api_common.settings import get_setting
+from notifications_api_common.viewsets import NotificationMixin
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.serializers import ValidationError
 from vng_api_common.schema import COMMON_ERRORS
+from vng_api_common.search import SearchMixin, is_search_view
 from vng_api_common.serializers import FoutSerializer, ValidatieFoutSerializer
 
+from ...notificaties.models import Notificatie
+from ...utils.db import check_connection_health
 from ..scopes import SCOPE_CATALOGI_FORCED_DELETE, SCOPE_CATALOGI_FORCED_WRITE
-from ..utils.viewsets import extract_relevant_m2m
+from ..utils.viewsets import QueryPlan
 
 
 def swagger_publish_schema(viewset_cls):
@@ -35,16 +45,130 @@ def swagger_publish_schema(viewset_cls):
     return _publish
 
 
+def _with_pooled_connection(view):
+    """
+    Manage the database connection of an executor thread like Django does for the
+    thread of a request.
+    """
+
+    @wraps(view)
+    def wrapped(request, *args, **kwargs):
+        close_old_connections()
+        check_connection_health()
+        try:
+            return view(request, *args, **kwargs)
+        finally:
+            close_old_connections()
+
+    return wrapped
+
+
+class AsyncReadMixin:
+    """
+    Handle the read requests in a thread pool when served by ``ztc.asgi``.
+
+    With ``ASYNC_READ_VIEWS`` enabled the view is a coroutine. Safe requests (list
+    and retrieve) run in the threads of the default executor, sized with
+    ``ASGI_THREADS``, which keep their database connection between requests. Other
+    requests run in the thread of the request, as Django does for sync views.
+    """
+
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        view = super().as_view(actions, **initkwargs)
+        if not settings.ASYNC_READ_VIEWS:
+            return view
+
+        read_view = sync_to_async(_with_pooled_connection(view), thread_sensitive=False)
+        write_view = sync_to_async(view, thread_sensitive=True)
+
+        async def async_view(request, *args, **kwargs):
+            if request.method in SAFE_METHODS:
+                return await read_view(request, *args, **kwargs)
+            return await write_view(request, *args, **kwargs)
+
+        # keeps the attributes used to resolve the viewset of a path
+        return update_wrapper(async_view, view)
+
+
+class QueryPlanMixin:
+    """
+    Apply the :class:`QueryPlan` declared for the current action.
+
+    ``query_plan`` maps actions to plans: ``"list"``, ``"retrieve"`` and the
+    ``"_zoek"`` search fall back to the ``"read"`` plan, all other actions use the
+    ``"write"`` plan. Write plans should not contain annotations, since the saved
+    instance is rendered again without being refetched.
+
+    Viewsets built by :func:`vng_api_common.utils.get_resource_for_path` (ETag
+    lookups, URL filters and validators) carry a plain ``HttpRequest`` and only
+    need the row itself, so no plan is applied for those.
+    """
+
+    query_plan = {}
+
+    def get_query_plan(self) -> Optional[QueryPlan]:
+        if not isinstance(getattr(self, "request", None), Request):
+            return None
+
+        action = getattr(self, "action", None)
+        if action in ("list", "retrieve", "_zoek"):
+            return self.query_plan.get(action, self.query_plan.get("read"))
+        return self.query_plan.get("write")
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        query_plan = self.get_query_plan()
+        if query_plan is None:
+            return queryset
+        return query_plan.apply(queryset)
+
+
+class ZoekMixin(SearchMixin):
+    """
+    Search the objects with ``POST <resource>/_zoek``, for lists of values which
+    don't fit in a query string.
+
+    The lists of the ``search_input_serializer_class`` are applied as ``__in``
+    lookups, one per lookup, before the filters of the list which are read from the request body.
+    The results are paginated like the list.
+    """
+
+    @action(methods=["post"], detail=False)
+    def _zoek(self, request, *args, **kwargs):
+        search_input = self.get_search_input()
+        lookups = self.get_search_input_serializer_class().Meta.lookups
+
+        # lists mapped to the same lookup (UUIDs and URLs) match any of their values
+        values_by_lookup = defaultdict(set)
+        for name, values in search_input.items():
+            if name in lookups:
+                values_by_lookup[lookups[name]].update(values)
+
+        queryset = self.get_queryset()
+        for lookup, values in values_by_lookup.items():
+            queryset = queryset.filter(**{lookup: values})
+
+        # the geldigheid filter picks the versions among the searched objects
+        queryset = self.filter_queryset(queryset)
+        return self.get_search_output(queryset)
+
+    _zoek.is_search_action = True
+
+
 class ConceptPublishMixin:
     @action(detail=True, methods=["post"])
     def publish(self, request, *args, **kwargs):
         instance = self.get_object()
+        serializer = self.perform_publish(instance)
+
+        return Response(serializer.data)
+
+    def perform_publish(self, instance):
         instance.concept = False
         instance.save()
 
-        serializer = self.get_serializer(instance)
-
-        return Response(serializer.data)
+        return self.get_serializer(instance)
 
 
 class ConceptDestroyMixin:
@@ -73,12 +197,15 @@ class ConceptFilterMixin:
     def get_queryset(self):
         qs = super().get_queryset()
 
-        if not hasattr(self, "action") or self.action != "list":
+        if not hasattr(self, "action") or self.action not in ("list", "_zoek"):
             return qs
 
-        # show only non-concepts by default
-        query_params = self.request.query_params or {}
-        if "status" in query_params:
+        # show only non-concepts by default, the search takes the filters from the body
+        if is_search_view(self):
+            filter_params = self.request.data or {}
+        else:
+            filter_params = self.request.query_params or {}
+        if "status" in filter_params:
             return qs
 
         filters = self.get_concept_filter()
@@ -150,3 +277,50 @@ class M2MConceptDestroyMixin:
                     )
 
         super().perform_destroy(instance)
+
+
+class NotificatieOutboxMixin(NotificationMixin):
+    """
+    Write the notifications of successful writes to the outbox, in the transaction
+    of the write. The ``send_notifications`` management command sends them to the
+    Notificaties API, so a slow Notificaties API doesn't slow down the writes.
+    """
+
+    @property
+    def notifications_enabled(self) -> bool:
+        return not get_setting("NOTIFICATIONS_DISABLED")
+
+    def notify(
+        self, status_code: int, data: dict, instance: models.Model = None
+    ) -> None:
+        if not self.notifications_enabled or not 200 <= status_code < 300:
+            return
+
+        Notificatie.objects.enqueue(self.construct_message(data, instance=instance))
+
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            super().perform_create(serializer)
+            self.notify(
+                status.HTTP_201_CREATED, serializer.data, instance=serializer.instance
+            )
+
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            super().perform_update(serializer)
+            self.notify(
+                status.HTTP_200_OK, serializer.data, instance=serializer.instance
+            )
+
+    def perform_destroy(self, instance):
+        # the message describes the resource as it was before the delete
+        data = self.get_serializer(instance).data if self.notifications_enabled else {}
+        with transaction.atomic():
+            super().perform_destroy(instance)
+            self.notify(status.HTTP_204_NO_CONTENT, data, instance=instance)
+
+    def perform_publish(self, instance):
+        with transaction.atomic():
+            serializer = super().perform_publish(instance)
+            self.notify(status.HTTP_200_OK, serializer.data, instance=instance)
+        return serializer
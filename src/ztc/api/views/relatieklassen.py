@@ -4,10 +4,10 @@ from django.utils.translation import gettext as _
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import viewsets
 from rest_framework.serializers import ValidationError
-from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from ...datamodel.models import ZaakInformatieobjectType
+from ..caching import conditional_retrieve
 from ..filters import ZaakInformatieobjectTypeFilter
 from ..scopes import (
     SCOPE_CATALOGI_FORCED_DELETE,
@@ -16,7 +16,13 @@ from ..scopes import (
     SCOPE_CATALOGI_WRITE,
 )
 from ..serializers import ZaakTypeInformatieObjectTypeSerializer
-from .mixins import ConceptFilterMixin, ForcedCreateUpdateMixin
+from ..utils.viewsets import QueryPlan
+from .mixins import (
+    AsyncReadMixin,
+    ConceptFilterMixin,
+    ForcedCreateUpdateMixin,
+    QueryPlanMixin,
+)
 
 
 @conditional_retrieve()
@@ -66,7 +72,9 @@ from .mixins import ConceptFilterMixin, ForcedCreateUpdateMixin
     ),
 )
 class ZaakTypeInformatieObjectTypeViewSet(
+    AsyncReadMixin,
     CheckQueryParamsMixin,
+    QueryPlanMixin,
     ConceptFilterMixin,
     ForcedCreateUpdateMixin,
     viewsets.ModelViewSet,
@@ -77,6 +85,10 @@ class ZaakTypeInformatieObjectTypeViewSet(
     )
 
     queryset = ZaakInformatieobjectType.objects.all().order_by("-pk")
+    query_plan = {
+        "read": QueryPlan(select_related=["zaaktype__catalogus", "statustype"]),
+        "write": QueryPlan(select_related=["zaaktype"]),
+    }
     serializer_class = ZaakTypeInformatieObjectTypeSerializer
     filterset_class = ZaakInformatieobjectTypeFilter
     lookup_field = "uuid"
@@ -2,11 +2,10 @@ from django.utils.translation import gettext as _
 
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import viewsets
-from rest_framework.response import Response
-from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from ...datamodel.models import ResultaatType
+from ..caching import conditional_retrieve
 from ..filters import ResultaatTypeFilter
 from ..scopes import (
     SCOPE_CATALOGI_FORCED_DELETE,
@@ -18,9 +17,16 @@ from ..serializers import (
     ResultaatTypeCreateSerializer,
     ResultaatTypeSerializer,
     ResultaatTypeUpdateSerializer,
+    ResultaatTypeZoekSerializer,
+)
+from ..utils.viewsets import QueryPlan, extract_relevant_m2m, m2m_array_of_str_to_url
+from .mixins import (
+    AsyncReadMixin,
+    ForcedCreateUpdateMixin,
+    QueryPlanMixin,
+    ZaakTypeConceptMixin,
+    ZoekMixin,
 )
-from ..utils.viewsets import extract_relevant_m2m, m2m_array_of_str_to_url
-from .mixins import ForcedCreateUpdateMixin, ZaakTypeConceptMixin
 
 
 @conditional_retrieve()
@@ -57,9 +63,20 @@ from .mixins import ForcedCreateUpdateMixin, ZaakTypeConceptMixin
             "Verwijder een RESULTAATTYPE. Dit kan alleen als het bijbehorende ZAAKTYPE een concept betreft."
         ),
     ),
+    _zoek=extend_schema(
+        summary=_("Zoek RESULTAATTYPEn."),
+        description=_(
+            "Zoek RESULTAATTYPEn met lijsten van UUIDs, URL-referenties of identificaties, "
+            "die niet in de query-string passen. De filters van de lijst kunnen ook "
+            "in de body opgegeven worden."
+        ),
+    ),
 )
 class ResultaatTypeViewSet(
+    AsyncReadMixin,
     CheckQueryParamsMixin,
+    QueryPlanMixin,
+    ZoekMixin,
     ZaakTypeConceptMixin,
     ForcedCreateUpdateMixin,
     viewsets.ModelViewSet,
@@ -71,11 +88,20 @@ class ResultaatTypeViewSet(
     )
 
     queryset = ResultaatType.objects.all().order_by("-pk")
+    query_plan = {
+        "read": QueryPlan(
+            select_related=["zaaktype", "catalogus"],
+            prefetch_related=["besluittype_set", "informatieobjecttypen"],
+        ),
+        "write": QueryPlan(select_related=["zaaktype"]),
+    }
     serializer_class = ResultaatTypeSerializer
     filter_class = ResultaatTypeFilter
+    search_input_serializer_class = ResultaatTypeZoekSerializer
     lookup_field = "uuid"
     required_scopes = {
         "list": SCOPE_CATALOGI_READ,
+        "_zoek": SCOPE_CATALOGI_READ,
         "retrieve": SCOPE_CATALOGI_READ,
         "create": SCOPE_CATALOGI_WRITE | SCOPE_CATALOGI_FORCED_WRITE,
         "update": SCOPE_CATALOGI_WRITE | SCOPE_CATALOGI_FORCED_WRITE,
@@ -91,13 +117,6 @@ class ResultaatTypeViewSet(
         request = m2m_array_of_str_to_url(request, ["besluittypen"], self.action)
         return super(viewsets.ModelViewSet, self).create(request, *args, **kwargs)
 
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        serializer = extract_relevant_m2m(
-            self.get_serializer(instance), ["besluittypen"], self.action
-        )
-        return Response(serializer.data)
-
     @extend_schema(
         request=ResultaatTypeCreateSerializer,
         responses={200: ResultaatTypeUpdateSerializer},
@@ -106,32 +125,30 @@ class ResultaatTypeViewSet(
         request = m2m_array_of_str_to_url(request, ["besluittypen"], self.action)
         return super(viewsets.ModelViewSet, self).update(request, *args, **kwargs)
 
-    def list(self, request, *args, **kwargs):
-        self._check_query_params(request)
-        queryset = self.filter_queryset(self.get_queryset())
-        filters = (
-            self.filter_backends[0]()
-            .get_filterset_kwargs(self.request, queryset, self)
-            .get("data", {})
-        )
+    def get_serializer(self, *args, **kwargs):
+        """
+        Filter the besluittypen on their geldigheid for the list, search and retrieve
+        operations. The list operation uses the `datumGeldigheid` query parameter,
+        the search the `datumGeldigheid` in the request body.
+        """
+        if getattr(self, "swagger_fake_view", False):
+            return self.get_serializer_class()(*args, **kwargs)
 
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
+        serializer = super().get_serializer(*args, **kwargs)
+        if self.action in ["list", "retrieve", "_zoek"]:
+            action = self.action
+            if action == "_zoek":
+                # the search returns a list, with the filters in the request body
+                action = "list"
+                filter_datum_geldigheid = self.request.data.get("datum_geldigheid")
+            else:
+                filter_datum_geldigheid = (
+                    self.request.query_params.get("datumGeldigheid", None)
+                    if self.action == "list"
+                    else None
+                )
             serializer = extract_relevant_m2m(
-                serializer,
-                ["besluittypen"],
-                self.action,
-                filters.get("datum_geldigheid", None),
+                serializer, ["besluittypen"], action, filter_datum_geldigheid
             )
-            return self.get_paginated_response(serializer.data)
-
-        serializer = self.get_serializer(queryset, many=True)
-        serializer = extract_relevant_m2m(
-            serializer,
-            ["besluittypen"],
-            self.action,
-            filters.get("datum_geldigheid", None),
-        )
 
-        return Response(serializer.data)
+        return serializer
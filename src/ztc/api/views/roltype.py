@@ -2,10 +2,10 @@ from django.utils.translation import gettext as _
 
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import viewsets
-from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from ...datamodel.models import RolType
+from ..caching import conditional_retrieve
 from ..filters import RolTypeFilter
 from ..scopes import (
     SCOPE_CATALOGI_FORCED_DELETE,
@@ -13,8 +13,15 @@ from ..scopes import (
     SCOPE_CATALOGI_READ,
     SCOPE_CATALOGI_WRITE,
 )
-from ..serializers import RolTypeSerializer
-from .mixins import ForcedCreateUpdateMixin, ZaakTypeConceptMixin
+from ..serializers import RolTypeSerializer, RolTypeZoekSerializer
+from ..utils.viewsets import QueryPlan
+from .mixins import (
+    AsyncReadMixin,
+    ForcedCreateUpdateMixin,
+    QueryPlanMixin,
+    ZaakTypeConceptMixin,
+    ZoekMixin,
+)
 
 
 @conditional_retrieve()
@@ -51,9 +58,20 @@ from .mixins import ForcedCreateUpdateMixin, ZaakTypeConceptMixin
             "Verwijder een ROLTYPE. Dit kan alleen als het een concept betreft."
         ),
     ),
+    _zoek=extend_schema(
+        summary=_("Zoek ROLTYPEn."),
+        description=_(
+            "Zoek ROLTYPEn met lijsten van UUIDs, URL-referenties of identificaties, "
+            "die niet in de query-string passen. De filters van de lijst kunnen ook "
+            "in de body opgegeven worden."
+        ),
+    ),
 )
 class RolTypeViewSet(
+    AsyncReadMixin,
     CheckQueryParamsMixin,
+    QueryPlanMixin,
+    ZoekMixin,
     ZaakTypeConceptMixin,
     ForcedCreateUpdateMixin,
     viewsets.ModelViewSet,
@@ -64,11 +82,17 @@ class RolTypeViewSet(
     )
 
     queryset = RolType.objects.order_by("-pk")
+    query_plan = {
+        "read": QueryPlan(select_related=["zaaktype", "catalogus"]),
+        "write": QueryPlan(select_related=["zaaktype"]),
+    }
     serializer_class = RolTypeSerializer
     filterset_class = RolTypeFilter
+    search_input_serializer_class = RolTypeZoekSerializer
     lookup_field = "uuid"
     required_scopes = {
         "list": SCOPE_CATALOGI_READ,
+        "_zoek": SCOPE_CATALOGI_READ,
         "retrieve": SCOPE_CATALOGI_READ,
         "create": SCOPE_CATALOGI_WRITE | SCOPE_CATALOGI_FORCED_WRITE,
         "update": SCOPE_CATALOGI_WRITE | SCOPE_CATALOGI_FORCED_WRITE,
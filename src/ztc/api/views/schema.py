@@ -0,0 +1,39 @@
+from django.http import HttpResponse
+from django.middleware.gzip import re_accepts_gzip
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import quote_etag
+
+from vng_api_common.views import SchemaViewAPI as _SchemaViewAPI
+
+from ..openapi import get_schema_document
+
+
+class SchemaViewAPI(_SchemaViewAPI):
+    """
+    Serve the OpenAPI schema from the per-process cache.
+
+    Responses carry an ETag, so clients can revalidate their copy, and are
+    gzipped if the client accepts it.
+    """
+
+    def get(self, request, *args, **kwargs):
+        renderer = request.accepted_renderer
+        document = get_schema_document(type(renderer))
+        use_gzip = re_accepts_gzip.search(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+
+        response = HttpResponse(
+            document.gzipped if use_gzip else document.content,
+            content_type=request.accepted_media_type,
+        )
+        filename = f"openapi.{renderer.format}"
+        response["Content-Disposition"] = f'inline; filename="{filename}"'
+        if use_gzip:
+            response["Content-Encoding"] = "gzip"
+            response["ETag"] = quote_etag(f"{document.etag}-gzip")
+        else:
+            response["ETag"] = quote_etag(document.etag)
+        patch_vary_headers(response, ("Accept", "Accept-Encoding"))
+
+        return get_conditional_response(
+            request, etag=response["ETag"], response=response
+        )
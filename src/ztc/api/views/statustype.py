@@ -1,11 +1,12 @@
+from django.db.models import Max, OuterRef, Subquery
 from django.utils.translation import gettext as _
 
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import viewsets
-from vng_api_common.caching import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from ...datamodel.models import StatusType
+from ..caching import conditional_retrieve
 from ..filters import StatusTypeFilter
 from ..scopes import (
     SCOPE_CATALOGI_FORCED_DELETE,
@@ -13,8 +14,15 @@ from ..scopes import (
     SCOPE_CATALOGI_READ,
     SCOPE_CATALOGI_WRITE,
 )
-from ..serializers import StatusTypeSerializer
-from .mixins import ForcedCreateUpdateMixin, ZaakTypeConceptMixin
+from ..serializers import StatusTypeSerializer, StatusTypeZoekSerializer
+from ..utils.viewsets import QueryPlan
+from .mixins import (
+    AsyncReadMixin,
+    ForcedCreateUpdateMixin,
+    QueryPlanMixin,
+    ZaakTypeConceptMixin,
+    ZoekMixin,
+)
 
 
 @conditional_retrieve()
@@ -51,9 +59,20 @@ from .mixins import ForcedCreateUpdateMixin, ZaakTypeConceptMixin
             "Verwijder een STATUSTYPE. Dit kan alleen als het bijbehorende ZAAKTYPE een concept betreft."
         ),
     ),
+    _zoek=extend_schema(
+        summary=_("Zoek STATUSTYPEn."),
+        description=_(
+            "Zoek STATUSTYPEn met lijsten van UUIDs, URL-referenties of identificaties, "
+            "die niet in de query-string passen. De filters van de lijst kunnen ook "
+            "in de body opgegeven worden."
+        ),
+    ),
 )
 class StatusTypeViewSet(
+    AsyncReadMixin,
     CheckQueryParamsMixin,
+    QueryPlanMixin,
+    ZoekMixin,
     ZaakTypeConceptMixin,
     ForcedCreateUpdateMixin,
     viewsets.ModelViewSet,
@@ -64,11 +83,30 @@ class StatusTypeViewSet(
     )
 
     queryset = StatusType.objects.all().order_by("-pk")
+    query_plan = {
+        "read": QueryPlan(
+            select_related=["zaaktype__catalogus"],
+            prefetch_related=["checklistitem", "eigenschappen"],
+            annotate={
+                # used by `StatusType.is_eindstatus`
+                "max_statustypevolgnummer": Subquery(
+                    StatusType.objects.filter(zaaktype=OuterRef("zaaktype"))
+                    .order_by()
+                    .values("zaaktype")
+                    .annotate(max_volgnummer=Max("statustypevolgnummer"))
+                    .values("max_volgnummer")
+                )
+            },
+        ),
+        "write": QueryPlan(select_related=["zaaktype"]),
+    }
     serializer_class = StatusTypeSerializer
     filterset_class = StatusTypeFilter
+    search_input_serializer_class = StatusTypeZoekSerializer
     lookup_field = "uuid"
     required_scopes = {
         "list": SCOPE_CATALOGI_READ,
+        "_zoek": SCOPE_CATALOGI_READ,
         "retrieve": SCOPE_CATALOGI_READ,
         "create": SCOPE_CATALOGI_WRITE | SCOPE_CATALOGI_FORCED_WRITE,
         "update": SCOPE_CATALOGI_WRITE | SCOPE_CATALOGI_FORCED_WRITE,
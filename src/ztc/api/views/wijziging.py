@@ -0,0 +1,44 @@
+from django.utils.translation import gettext as _
+
+from drf_spectacular.utils import extend_schema, extend_schema_view
+from rest_framework import mixins, viewsets
+
+from ...datamodel.models import Wijziging
+from ..filters import WijzigingFilter
+from ..pagination import WijzigingenPagination
+from ..scopes import SCOPE_CATALOGI_READ
+from ..serializers import WijzigingSerializer
+from ..wijzigingen import set_etags
+from .mixins import AsyncReadMixin
+
+
+@extend_schema_view(
+    list=extend_schema(
+        summary=_("Alle wijzigingen opvragen."),
+        description=_(
+            "De wijzigingen van alle objecten in de catalogi, in de volgorde "
+            "waarin ze zijn vastgelegd. Geef bij een synchronisatie de `cursor` "
+            "van het vorige antwoord mee als `sinds` parameter om alleen de "
+            "nieuwe wijzigingen op te vragen."
+        ),
+    ),
+)
+class WijzigingViewSet(AsyncReadMixin, mixins.ListModelMixin, viewsets.GenericViewSet):
+    global_description = _(
+        "Opvragen van de wijzigingen van de objecten in de catalogi, voor het "
+        "synchroniseren van een kopie van de catalogi."
+    )
+
+    # changes of transactions in progress are shown once they are finished
+    queryset = Wijziging.objects.afgerond()
+    serializer_class = WijzigingSerializer
+    filterset_class = WijzigingFilter
+    pagination_class = WijzigingenPagination
+    required_scopes = {
+        "list": SCOPE_CATALOGI_READ,
+    }
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        set_etags(page)
+        return page
@@ -2,20 +2,21 @@ from django.utils.translation import gettext as _
 
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import viewsets
-from vng_api_common.caching.decorators import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from ztc.api.filters import ZaakObjectTypeFilter
 from ztc.api.serializers.zaakobjecttype import ZaakObjectTypeSerializer
+from ztc.api.utils.viewsets import QueryPlan
 from ztc.datamodel.models import ZaakObjectType
 
+from ..caching import conditional_retrieve
 from ..scopes import (
     SCOPE_CATALOGI_FORCED_DELETE,
     SCOPE_CATALOGI_FORCED_WRITE,
     SCOPE_CATALOGI_READ,
     SCOPE_CATALOGI_WRITE,
 )
-from . import ForcedCreateUpdateMixin
+from .mixins import AsyncReadMixin, ForcedCreateUpdateMixin, QueryPlanMixin
 
 
 @conditional_retrieve()
@@ -46,20 +47,25 @@ from . import ForcedCreateUpdateMixin
     ),
 )
 class ZaakObjectTypeViewSet(
-    CheckQueryParamsMixin, ForcedCreateUpdateMixin, viewsets.ModelViewSet
+    AsyncReadMixin,
+    CheckQueryParamsMixin,
+    QueryPlanMixin,
+    ForcedCreateUpdateMixin,
+    viewsets.ModelViewSet,
 ):
     global_description = (
         "Opvragen en bewerken van ZAAKOBJECTTYPEn. Er wordt "
         "gevalideerd op:\n - `zaaktype` behoort tot dezelfde `catalogus`"
     )
 
-    queryset = ZaakObjectType.objects.select_related(
-        "zaaktype",
-        "catalogus",
-    ).prefetch_related(
-        "resultaattypen",
-        "statustypen",
-    )
+    queryset = ZaakObjectType.objects.all()
+    query_plan = {
+        "read": QueryPlan(
+            select_related=["zaaktype", "catalogus"],
+            prefetch_related=["resultaattypen", "statustypen"],
+        ),
+        "write": QueryPlan(select_related=["zaaktype", "catalogus"]),
+    }
     serializer_class = ZaakObjectTypeSerializer
     filterset_class = ZaakObjectTypeFilter
     lookup_field = "uuid"
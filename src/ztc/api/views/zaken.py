@@ -1,3 +1,4 @@
+from django.db.models import OuterRef
 from django.shortcuts import get_object_or_404
 from django.utils.translation import gettext as _
 
@@ -7,13 +8,19 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.serializers import ValidationError
 from rest_framework.settings import api_settings
-from vng_api_common.caching import conditional_retrieve
 from vng_api_common.schema import COMMON_ERRORS
 from vng_api_common.serializers import FoutSerializer, ValidatieFoutSerializer
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from ...datamodel.constants import DATUM_GELDIGHEID_QUERY_PARAM
-from ...datamodel.models import BesluitType, ZaakType, ZaakTypenRelatie
+from ...datamodel.models import (
+    BesluitType,
+    InformatieObjectType,
+    ZaakInformatieobjectType,
+    ZaakType,
+    ZaakTypenRelatie,
+)
+from ..caching import conditional_retrieve
 from ..filters import ZaakTypeDetailFilter, ZaakTypeFilter
 from ..kanalen import KANAAL_ZAAKTYPEN
 from ..scopes import (
@@ -28,15 +35,37 @@ from ..serializers import (
     ZaakTypeCreateSerializer,
     ZaakTypeSerializer,
     ZaakTypeUpdateSerializer,
+    ZaakTypeZoekSerializer,
 )
 from ..utils.validators import validate_detail_geldigheid
 from ..utils.viewsets import (
+    ArraySubquery,
+    QueryPlan,
     extract_relevant_m2m,
     has_valid_non_concept_m2m_relations,
     m2m_array_of_str_to_url,
 )
 from ..validators import ZaaktypeGeldigheidValidator
-from .mixins import ConceptMixin, ForcedCreateUpdateMixin, M2MConceptDestroyMixin
+from .mixins import (
+    AsyncReadMixin,
+    ConceptMixin,
+    ForcedCreateUpdateMixin,
+    M2MConceptDestroyMixin,
+    NotificatieOutboxMixin,
+    QueryPlanMixin,
+    ZoekMixin,
+)
+
+ZAAKTYPE_PREFETCH_RELATED = [
+    "statustypen",
+    "resultaattypen",
+    "eigenschap_set",
+    "roltype_set",
+    "besluittypen",
+    "objecttypen",
+    "deelzaaktypen",
+    "zaaktypenrelaties",
+]
 
 
 @extend_schema_view(
@@ -81,6 +110,16 @@ from .mixins import ConceptMixin, ForcedCreateUpdateMixin, M2MConceptDestroyMixi
             "Verwijder een ZAAKTYPE. Dit kan alleen als het een concept betreft."
         ),
     ),
+    _zoek=extend_schema(
+        summary=_("Zoek ZAAKTYPEn."),
+        description=_(
+            "Zoek ZAAKTYPEn met lijsten van UUIDs, URL-referenties of identificaties, "
+            "die niet in de query-string passen. De filters van de lijst kunnen ook "
+            "in de body opgegeven worden."
+        ),
+        # get_serializer doesn't return a serializer for the schema generation
+        responses={200: ZaakTypeSerializer(many=True)},
+    ),
     publish=extend_schema(
         summary=_("Publiceer het concept ZAAKTYPE."),
         description=_(
@@ -94,7 +133,11 @@ from .mixins import ConceptMixin, ForcedCreateUpdateMixin, M2MConceptDestroyMixi
 )
 @conditional_retrieve()
 class ZaakTypeViewSet(
+    AsyncReadMixin,
     CheckQueryParamsMixin,
+    QueryPlanMixin,
+    ZoekMixin,
+    NotificatieOutboxMixin,
     ConceptMixin,
     M2MConceptDestroyMixin,
     ForcedCreateUpdateMixin,
@@ -106,20 +149,33 @@ class ZaakTypeViewSet(
         "eigenschappen van zaken van eenzelfde soort."
     )
 
-    queryset = ZaakType.objects.prefetch_related(
-        "statustypen",
-        "statustypen",
-        "resultaattypen",
-        "eigenschap_set",
-        "roltype_set",
-        "besluittypen",
-        "objecttypen",
-    ).order_by("-pk")
+    queryset = ZaakType.objects.all().order_by("-pk")
+    query_plan = {
+        "read": QueryPlan(
+            select_related=["catalogus"],
+            prefetch_related=ZAAKTYPE_PREFETCH_RELATED,
+            annotate={
+                # used by `ZaakTypeSerializer.get_informatieobjecttypen`
+                "informatieobjecttype_uuids": ArraySubquery(
+                    InformatieObjectType.objects.filter(
+                        omschrijving__in=ZaakInformatieobjectType.objects.filter(
+                            zaaktype=OuterRef(OuterRef("pk"))
+                        ).values("informatieobjecttype")
+                    ).values("uuid")
+                )
+            },
+        ),
+        "write": QueryPlan(
+            select_related=["catalogus"], prefetch_related=ZAAKTYPE_PREFETCH_RELATED
+        ),
+    }
     serializer_class = ZaakTypeSerializer
     lookup_field = "uuid"
     filterset_class = ZaakTypeFilter
+    search_input_serializer_class = ZaakTypeZoekSerializer
     required_scopes = {
         "list": SCOPE_CATALOGI_READ | SCOPE_DOCUMENTEN_READ | SCOPE_ZAKEN_READ,
+        "_zoek": SCOPE_CATALOGI_READ | SCOPE_DOCUMENTEN_READ | SCOPE_ZAKEN_READ,
         "retrieve": SCOPE_CATALOGI_READ | SCOPE_DOCUMENTEN_READ | SCOPE_ZAKEN_READ,
         "create": SCOPE_CATALOGI_WRITE,
         "update": SCOPE_CATALOGI_WRITE | SCOPE_CATALOGI_FORCED_WRITE,
@@ -155,10 +211,7 @@ class ZaakTypeViewSet(
         geldigheid_validator.set_context(serializer=self.get_serializer(instance))
         geldigheid_validator()
 
-        instance.concept = False
-        instance.save()
-
-        serializer = self.get_serializer(instance)
+        serializer = self.perform_publish(instance)
 
         return Response(serializer.data)
 
@@ -176,7 +229,7 @@ class ZaakTypeViewSet(
 
     def perform_create(self, serializer):
         """automatically create new zaaktype relations when creating a new version of a zaaktype"""
-        serializer.save()
+        super().perform_create(serializer)
         if serializer.data.get("gerelateerde_zaaktypen", None):
             for rel_zaaktype in serializer.data["gerelateerde_zaaktypen"]:
                 if rel_zaaktype.get("zaaktype", None):
@@ -199,7 +252,15 @@ class ZaakTypeViewSet(
 
     @extend_schema(parameters=[DATUM_GELDIGHEID_QUERY_PARAM])
     def retrieve(self, request, *args, **kwargs):
-        return super(viewsets.ModelViewSet, self).retrieve(request, *args, **kwargs)
+        instance = self.get_object()
+        filter_datum_geldigheid = request.query_params.get("datumGeldigheid", None)
+        if filter_datum_geldigheid:
+            validate_detail_geldigheid(instance, filter_datum_geldigheid)
+
+        # get_serializer renders and filters the data once, serializer.data
+        # returns that cached result
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data)
 
     @property
     def filterset_class(self):
@@ -236,15 +297,16 @@ class ZaakTypeViewSet(
         if not self.request:
             return serializer
 
-        if self.action in ["list", "retrieve"]:
-            filter_datum_geldigheid = self.request.query_params.get(
-                "datumGeldigheid", None
-            )
-            if self.detail:
-                instance = self.get_object()
-            if filter_datum_geldigheid and self.detail:
-                validate_detail_geldigheid(instance, filter_datum_geldigheid)
-
+        if self.action in ["list", "retrieve", "_zoek"]:
+            action = self.action
+            if action == "_zoek":
+                # the search returns a list, with the filters in the request body
+                action = "list"
+                filter_datum_geldigheid = self.request.data.get("datum_geldigheid")
+            else:
+                filter_datum_geldigheid = self.request.query_params.get(
+                    "datumGeldigheid", None
+                )
             serializer = extract_relevant_m2m(
                 serializer,
                 [
@@ -253,7 +315,7 @@ class ZaakTypeViewSet(
                     "deelzaaktypen",
                     "gerelateerde_zaaktypen",
                 ],
-                self.action,
+                action,
                 filter_datum_geldigheid,
             )
 
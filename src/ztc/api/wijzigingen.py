@@ -0,0 +1,144 @@
+"""
+Register the changes of the resources for the change feed (``/wijzigingen``).
+
+Other APIs keep a copy of the catalogi and only need to fetch the resources which
+changed since their last synchronisation. The changes are registered by the
+signal receivers in :mod:`ztc.api.signals`. Changes of objects which are shown
+nested in a resource are registered as an update of that resource.
+"""
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import models
+from django.db.models.base import ModelBase
+
+from vng_api_common.caching.registry import MODEL_SERIALIZERS
+
+from ztc.datamodel.constants import WijzigingActie
+from ztc.datamodel.models import (
+    CheckListItem,
+    Eigenschap,
+    EigenschapSpecificatie,
+    InformatieObjectType,
+    InformatieObjectTypeOmschrijvingGeneriek,
+    StatusType,
+    Wijziging,
+    ZaakType,
+    ZaakTypenRelatie,
+)
+
+# the nested model with the resource showing it and the lookup from the resource
+NESTED_MODELS: Dict[ModelBase, Tuple[ModelBase, str]] = {
+    CheckListItem: (StatusType, "checklistitem"),
+    EigenschapSpecificatie: (Eigenschap, "specificatie_van_eigenschap"),
+    InformatieObjectTypeOmschrijvingGeneriek: (
+        InformatieObjectType,
+        "omschrijving_generiek",
+    ),
+    ZaakTypenRelatie: (ZaakType, "zaaktypenrelaties"),
+}
+
+
+@lru_cache()
+def get_resource_models() -> Dict[str, ModelBase]:
+    """
+    Return the models of the API resources by their resource name.
+
+    The serializers are registered when the viewsets are created, all viewsets
+    are imported before the mapping is built once.
+    """
+    from . import views  # noqa
+
+    return {
+        model._meta.model_name: model
+        for model in MODEL_SERIALIZERS
+        if model._meta.app_label == "datamodel"
+    }
+
+
+def get_resource_name(model: ModelBase) -> Optional[str]:
+    if model._meta.app_label != "datamodel":
+        return None
+
+    name = model._meta.model_name
+    return name if get_resource_models().get(name) is model else None
+
+
+def registreer_wijziging(instance: models.Model, actie: str) -> None:
+    resource = get_resource_name(type(instance))
+    if resource is not None:
+        Wijziging.objects.registreer(resource, [instance.uuid], actie)
+
+
+def registreer_nested_wijziging(instance: models.Model) -> None:
+    """
+    Register an update of the resources showing the nested ``instance``.
+    """
+    if type(instance) not in NESTED_MODELS:
+        return
+
+    model, lookup = NESTED_MODELS[type(instance)]
+    uuids = model._default_manager.filter(**{lookup: instance}).values_list(
+        "uuid", flat=True
+    )
+    Wijziging.objects.registreer(
+        get_resource_name(model), uuids.order_by(), WijzigingActie.update
+    )
+
+
+def registreer_relatie_wijziging(model: ModelBase, pks: Iterable) -> None:
+    """
+    Register an update of the objects of ``model`` of which a relation changed.
+    """
+    resource = get_resource_name(model)
+    if resource is None:
+        return
+
+    uuids = model._default_manager.filter(pk__in=pks).values_list("uuid", flat=True)
+    Wijziging.objects.registreer(resource, uuids.order_by(), WijzigingActie.update)
+
+
+def registreer_query_wijziging(queryset: models.QuerySet) -> None:
+    """
+    Register an update of the resources of the objects in ``queryset``, or of the
+    resources showing them if they are nested, with a single query.
+
+    For changes which bypass the signals, like :meth:`QuerySet.update`.
+    """
+    model = queryset.model
+    if model in NESTED_MODELS:
+        model, lookup = NESTED_MODELS[model]
+        queryset = model._default_manager.filter(
+            **{f"{lookup}__in": queryset.values("pk")}
+        ).distinct()
+
+    resource = get_resource_name(model)
+    if resource is None:
+        return
+
+    uuids = queryset.values_list("uuid", flat=True).order_by()
+    Wijziging.objects.registreer(resource, uuids, WijzigingActie.update)
+
+
+def set_etags(wijzigingen: List[Wijziging]) -> None:
+    """
+    Set the current ETag value of the resources of ``wijzigingen``.
+
+    The value is ``None`` for deleted resources and resources of which the ETag
+    value is not calculated yet.
+    """
+    uuids = defaultdict(set)
+    for wijziging in wijzigingen:
+        uuids[wijziging.resource].add(wijziging.uuid)
+
+    etags = {}
+    for resource, resource_uuids in uuids.items():
+        queryset = get_resource_models()[resource]._default_manager.filter(
+            uuid__in=resource_uuids
+        )
+        for uuid, etag in queryset.order_by().values_list("uuid", "_etag"):
+            etags[resource, uuid] = etag or None
+
+    for wijziging in wijzigingen:
+        wijziging.etag = etags.get((wijziging.resource, wijziging.uuid))
@@ -0,0 +1,10 @@
+"""
+URLs of processes that only serve the API, see ``ztc.conf.api_only``.
+"""
+from django.urls import include, path
+
+urlpatterns = [
+    path("api/", include("ztc.api.urls")),
+    path("ref/", include("vng_api_common.urls")),
+    path("ref/", include("notifications_api_common.urls")),
+]
@@ -0,0 +1,35 @@
+"""
+ASGI config for ztc project.
+
+It exposes the ASGI callable as a module-level variable named ``application``.
+
+Read requests are handled in a thread pool (see
+:class:`ztc.api.views.mixins.AsyncReadMixin`), the remaining sync code of a
+request runs in one of ``ASGI_SYNC_THREADS`` persistent threads (see
+:mod:`ztc.utils.asgi`), which keep their database connection.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/3.2/howto/deployment/asgi/
+"""
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault("ASYNC_READ_VIEWS", "1")
+
+django_application = get_asgi_application()
+
+# build the OpenAPI schema before the first request instead of during it
+from ztc.api.openapi import preload_schema  # noqa isort:skip
+from ztc.utils.asgi import PooledThreadContext, ThreadPool  # noqa isort:skip
+
+preload_schema()
+
+sync_threads = ThreadPool(int(os.getenv("ASGI_SYNC_THREADS", 10)))
+
+
+async def application(scope, receive, send):
+    # Django 3.2 runs the sync code of all requests in a single thread, a context
+    # per request lends every request a thread of its own
+    async with PooledThreadContext(sync_threads):
+        await django_application(scope, receive, send)
@@ -43,6 +43,10 @@ SPECTACULAR_EXTENSIONS = [
     "vng_api_common.extensions.serializers.gegevensgroep.GegevensGroepExtension",
 ]
 
+# Serve the checked-in OpenAPI schema ("file") or generate it from the code once per
+# process ("generate")
+OPENAPI_SCHEMA_SOURCE = os.getenv("OPENAPI_SCHEMA_SOURCE", "file")
+
 GEMMA_URL_INFORMATIEMODEL = "Imztc"
 GEMMA_URL_INFORMATIEMODEL_VERSIE = "2.1"
 
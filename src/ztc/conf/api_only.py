@@ -0,0 +1,42 @@
+"""
+Settings for processes that only serve the API.
+
+Builds on the docker settings and leaves out the admin and everything that only
+the admin and the HTML pages need, which makes the processes start faster and
+use less memory. Migrations, fixtures and the admin are handled by processes
+using the full settings (``ztc.conf.docker``).
+"""
+from .docker import *  # noqa isort:skip
+
+API_ONLY_EXCLUDED_APPS = [
+    "django.contrib.admin",
+    "django.contrib.messages",
+    "django.contrib.sessions",
+    "django.contrib.staticfiles",
+    "axes",
+    "django_better_admin_arrayfield.apps.DjangoBetterAdminArrayfieldConfig",
+]
+
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in API_ONLY_EXCLUDED_APPS]
+
+# The API authenticates with JWTs, there are no sessions, logins or forms
+MIDDLEWARE = [
+    "django.middleware.security.SecurityMiddleware",
+    "ztc.utils.middleware.CommonMiddleware",
+    "ztc.api.auth.AuthMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "corsheaders.middleware.CorsMiddleware",
+    "vng_api_common.middleware.APIVersionHeaderMiddleware",
+]
+
+AUTHENTICATION_BACKENDS = ["django.contrib.auth.backends.ModelBackend"]
+
+ROOT_URLCONF = "ztc.api_urls"
+
+# Only the schema documentation and the error pages are rendered as HTML
+TEMPLATES[0]["OPTIONS"]["context_processors"] = [
+    "django.template.context_processors.request",
+    "ztc.utils.context_processors.settings",
+]
+
+ENVIRONMENT = "api-only"
@@ -4,10 +4,13 @@ import os
 import django.db.models.options as options
 from django.urls import reverse_lazy
 
-import raven
-
 from .api import *  # noqa
 
+
+def getenv_bool(key: str, default: str = "0") -> bool:
+    return os.getenv(key, default).lower() in ["true", "1", "yes"]
+
+
 SITE_ID = int(os.getenv("SITE_ID", 1))
 
 # Build paths inside the project like this: os.path.join(BASE_DIR, ...)
@@ -37,6 +40,12 @@ DATABASES = {
         "PASSWORD": os.getenv("DB_PASSWORD", "ztc"),
         "HOST": os.getenv("DB_HOST", "localhost"),
         "PORT": os.getenv("DB_PORT", 5432),
+        # keep connections open between requests, see INSTALL.rst
+        "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", 60)),
+        # verify a persistent connection before a request reuses it
+        "CONN_HEALTH_CHECKS": getenv_bool("DB_CONN_HEALTH_CHECKS", "1"),
+        # PgBouncer in transaction pooling mode can't keep server side cursors open
+        "DISABLE_SERVER_SIDE_CURSORS": getenv_bool("DB_PGBOUNCER_TRANSACTION_POOLING"),
     }
 }
 
@@ -72,21 +81,24 @@ INSTALLED_APPS = [
     "ztc.accounts",
     "ztc.api",
     "ztc.datamodel",
+    "ztc.notificaties",
     "ztc.utils",
 ]
 
+# The middleware from ztc.utils.middleware skips API requests, see
+# ``API_PATH_PREFIXES``
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
-    "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "vng_api_common.middleware.AuthMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
+    "ztc.utils.middleware.SessionMiddleware",
+    "ztc.utils.middleware.CommonMiddleware",
+    "ztc.utils.middleware.CsrfViewMiddleware",
+    "ztc.utils.middleware.AuthenticationMiddleware",
+    "ztc.api.auth.AuthMiddleware",
+    "ztc.utils.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "vng_api_common.middleware.APIVersionHeaderMiddleware",
-    "axes.middleware.AxesMiddleware",
+    "ztc.utils.middleware.AxesMiddleware",
 ]
 
 ROOT_URLCONF = "ztc.urls"
@@ -260,7 +272,11 @@ DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
 #
 # Silenced checks
 #
-SILENCED_SYSTEM_CHECKS = ["rest_framework.W001"]
+SILENCED_SYSTEM_CHECKS = [
+    "rest_framework.W001",
+    # the subclass ztc.utils.middleware.AxesMiddleware is used
+    "axes.W002",
+]
 
 #
 # Custom settings
@@ -271,6 +287,33 @@ SITE_TITLE = "Zaaktypecatalogus (ZTC)"
 ENVIRONMENT = None
 SHOW_ALERT = True
 
+# Requests for these paths authenticate with a JWT only, they skip the
+# middleware for sessions, CSRF protection, messages, axes and slash redirects
+API_PATH_PREFIXES = ["/api/"]
+
+# Handle read requests in a thread pool, enabled by ``ztc.asgi``
+ASYNC_READ_VIEWS = getenv_bool("ASYNC_READ_VIEWS")
+
+# Cache the verified JWT claims and the scopes of the API clients, see
+# ``ztc.api.auth``. The cache must be shared by all processes.
+JWT_AUTH_CACHE = "default"
+JWT_AUTH_CACHE_TIMEOUT = int(os.getenv("JWT_AUTH_CACHE_TIMEOUT", 300))
+
+# Keep the objects valid today in memory, see ``ztc.api.geldigheid``. The cache
+# holds the version of these objects and must be shared by all processes.
+GELDIGHEID_CACHE = "default"
+GELDIGHEID_CACHE_TIMEOUT = int(os.getenv("GELDIGHEID_CACHE_TIMEOUT", 60 * 60))
+
+# Fetching the referentielijsten resources validated by the admin forms, see
+# ``ztc.datamodel.admin.referentielijsten``
+REFERENTIELIJSTEN_TIMEOUT = float(os.getenv("REFERENTIELIJSTEN_TIMEOUT", 10))
+REFERENTIELIJSTEN_WORKERS = int(os.getenv("REFERENTIELIJSTEN_WORKERS", 4))
+
+# Cache the gzipped snapshots of the catalogi under their version, see
+# ``ztc.api.snapshot``
+SNAPSHOT_CACHE = "default"
+SNAPSHOT_CACHE_TIMEOUT = int(os.getenv("SNAPSHOT_CACHE_TIMEOUT", 24 * 60 * 60))
+
 #
 # Library settings
 #
@@ -304,6 +347,9 @@ CORS_ORIGIN_ALLOW_ALL = True
 if "GIT_SHA" in os.environ:
     GIT_SHA = os.getenv("GIT_SHA")
 else:
+    # only import raven (and its dependencies) when it is needed
+    import raven
+
     GIT_SHA = raven.fetch_git_sha(BASE_DIR)
 
 # Raven
@@ -326,7 +372,7 @@ if SENTRY_DSN:
 #
 # SSL or not?
 #
-IS_HTTPS = os.getenv("IS_HTTPS", "1").lower() in ["true", "1", "yes"]
+IS_HTTPS = getenv_bool("IS_HTTPS", "1")
 
 
 options.DEFAULT_NAMES = options.DEFAULT_NAMES + (
@@ -30,6 +30,11 @@ NOTIFICATIONS_DISABLED = True  # During dev unable to create 'notifications_api_
 # Show active environment in admin.
 ENVIRONMENT = "CI"
 
+# The test database is rolled back without signals, which would leave stale
+# authorizations and objects in the caches
+JWT_AUTH_CACHE_TIMEOUT = 0
+GELDIGHEID_CACHE_TIMEOUT = 0
+
 #
 # Django-axes
 #
@@ -40,6 +40,28 @@ CACHES = {
     "axes_cache": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
 }
 
+# Share the cache between the processes (and containers), e.g. "redis:6379/0"
+cache_default = getenv("CACHE_DEFAULT")
+if cache_default:
+    CACHES["default"] = {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": f"redis://{cache_default}",
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            # the cache is an optimization, fall back to the database if it's down
+            "IGNORE_EXCEPTIONS": True,
+        },
+    }
+
+# Caches that are invalidated across processes are disabled by default without a
+# shared cache, see the ``caches`` system check
+JWT_AUTH_CACHE_TIMEOUT = int(
+    getenv("JWT_AUTH_CACHE_TIMEOUT", JWT_AUTH_CACHE_TIMEOUT if cache_default else 0)
+)
+GELDIGHEID_CACHE_TIMEOUT = int(
+    getenv("GELDIGHEID_CACHE_TIMEOUT", GELDIGHEID_CACHE_TIMEOUT if cache_default else 0)
+)
+
 # Deal with being hosted on a subpath
 subpath = getenv("SUBPATH")
 if subpath:
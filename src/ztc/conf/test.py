@@ -53,6 +53,11 @@ LOGGING["loggers"].update(
 # Show active environment in admin.
 ENVIRONMENT = "test"
 
+# The test database is rolled back without signals, which would leave stale
+# authorizations and objects in the caches
+JWT_AUTH_CACHE_TIMEOUT = 0
+GELDIGHEID_CACHE_TIMEOUT = 0
+
 #
 # Django-axes
 #
@@ -9,6 +9,7 @@ from .mixins import ConceptAdminMixin, GeldigheidAdminMixin
 class BesluitTypeAdmin(GeldigheidAdminMixin, ConceptAdminMixin, admin.ModelAdmin):
     # List
     list_display = ("catalogus", "omschrijving", "besluitcategorie")
+    list_select_related = ("catalogus",)
 
     # Details
     fieldsets = (
@@ -1,7 +1,11 @@
 from django.contrib import admin
 from django.utils.translation import ugettext_lazy as _
 
-from ...utils.admin import EditInlineAdminMixin, ListObjectActionsAdminMixin
+from ...utils.admin import (
+    APIURLAdminMixin,
+    EditInlineAdminMixin,
+    ListObjectActionsAdminMixin,
+)
 from ..models import BesluitType, Catalogus, InformatieObjectType, ZaakType
 from .besluittype import BesluitTypeAdmin
 from .informatieobjecttype import InformatieObjectTypeAdmin
@@ -9,7 +13,7 @@ from .mixins import FilterSearchOrderingAdminMixin
 from .zaken import ZaakTypeAdmin
 
 
-class ZaakTypeInline(EditInlineAdminMixin, admin.TabularInline):
+class ZaakTypeInline(APIURLAdminMixin, EditInlineAdminMixin, admin.TabularInline):
     model = ZaakType
     fields = ZaakTypeAdmin.list_display
     fk_name = "catalogus"
@@ -20,7 +24,9 @@ class BesluitTypeInline(EditInlineAdminMixin, admin.TabularInline):
     fields = BesluitTypeAdmin.list_display
 
 
-class InformatieObjectTypeInline(EditInlineAdminMixin, admin.TabularInline):
+class InformatieObjectTypeInline(
+    APIURLAdminMixin, EditInlineAdminMixin, admin.TabularInline
+):
     model = InformatieObjectType
     fields = InformatieObjectTypeAdmin.list_display
     fk_name = "catalogus"
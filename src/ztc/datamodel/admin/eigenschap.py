@@ -11,6 +11,7 @@ class EigenschapAdmin(FilterSearchOrderingAdminMixin, admin.ModelAdmin):
 
     # List
     list_display = ("eigenschapnaam", "zaaktype", "statustype")
+    list_select_related = ("zaaktype", "statustype__zaaktype")
 
     # Details
     fieldsets = (
@@ -38,6 +39,7 @@ class EigenschapAdmin(FilterSearchOrderingAdminMixin, admin.ModelAdmin):
             },
         ),
     )
+    raw_id_fields = ("zaaktype", "statustype")
 
 
 @admin.register(EigenschapReferentie)
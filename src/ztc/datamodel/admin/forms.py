@@ -1,19 +1,21 @@
+from concurrent.futures import CancelledError, TimeoutError as FuturesTimeoutError
+
 from django import forms
 from django.utils.translation import ugettext_lazy as _
 
 import requests
 from dateutil.relativedelta import relativedelta
 from relativedeltafield.utils import format_relativedelta
-from rest_framework.exceptions import ValidationError
+from vng_api_common import validators
 from vng_api_common.constants import (
     BrondatumArchiefprocedureAfleidingswijze as Afleidingswijze,
 )
-from vng_api_common.validators import ResourceValidator
 
 from ztc.datamodel.models.zaakobjecttype import ZaakObjectType
 
 from ..constants import SelectielijstKlasseProcestermijn as Procestermijn
 from ..models import ResultaatType, ZaakType
+from .referentielijsten import fetch_resource, fetch_schema, wait_for
 
 API_SPEC = "https://ref.tst.vng.cloud/referentielijsten/api/v1/schema/openapi.yaml?v=3"
 
@@ -76,6 +78,7 @@ class ResultaatTypeForm(forms.ModelForm):
     def clean(self):
         super().clean()
 
+        self._fetch_selectielijstklasse()
         self._clean_selectielijstklasse()
         self._clean_brondatum_archiefprocedure_afleidingswijze()
         self._clean_brondatum_archiefprocedure()
@@ -83,21 +86,40 @@ class ResultaatTypeForm(forms.ModelForm):
     def _get_field_label(self, field: str) -> str:
         return self.fields[field].label
 
-    def _clean_selectielijstklasse(self):
+    def _fetch_selectielijstklasse(self):
         """
-        Validate that the selectielijstklasse is relevant for the zaaktype.procestype
+        Fetch the selectielijstklasse for the other clean methods.
+
+        The schema of the referentielijsten API, to validate the selectielijstklasse
+        of the zaaktype with, is fetched at the same time.
         """
+        self._selectielijstklasse = None
+        self._referentielijsten_schema = None
+
         selectielijstklasse = self.cleaned_data.get("selectielijstklasse")
         zaaktype = self.cleaned_data.get("zaaktype")
-
-        if not selectielijstklasse or not zaaktype:
+        afleidingswijze = self.cleaned_data.get(
+            "brondatum_archiefprocedure_afleidingswijze"
+        )
+        if not selectielijstklasse or not (zaaktype or afleidingswijze):
             # nothing to do
             return
 
-        response = requests.get(selectielijstklasse)
+        resource = fetch_resource(selectielijstklasse)
+        schema = fetch_schema(API_SPEC) if zaaktype else None
+        wait_for([future for future in (resource, schema) if future])
+
         try:
+            response = resource.result(timeout=0)
             response.raise_for_status()
-        except requests.HTTPError as exc:
+        except (FuturesTimeoutError, CancelledError, requests.Timeout) as exc:
+            msg = (
+                _("URL %s for selectielijstklasse did not respond in time")
+                % selectielijstklasse
+            )
+            err = forms.ValidationError(msg, code="invalid")
+            raise forms.ValidationError({"selectielijstklasse": err}) from exc
+        except requests.RequestException as exc:
             msg = (
                 _("URL %s for selectielijstklasse did not resolve")
                 % selectielijstklasse
@@ -106,13 +128,48 @@ class ResultaatTypeForm(forms.ModelForm):
             raise forms.ValidationError({"selectielijstklasse": err}) from exc
 
         try:
-            # Check whether the url points to a Resultaat
-            ResourceValidator("Resultaat", API_SPEC)(selectielijstklasse)
-        except ValidationError as exc:
-            err = forms.ValidationError(exc.detail[0], code=exc.detail[0].code)
-            raise forms.ValidationError({"selectielijstklasse": err}) from exc
+            self._selectielijstklasse = response.json()
+        except ValueError as exc:
+            raise self._get_invalid_resource_error(selectielijstklasse) from exc
+
+        if schema is not None:
+            try:
+                self._referentielijsten_schema = schema.result(timeout=0)
+            except Exception as exc:
+                msg = _(
+                    "Het schema van de referentielijsten API kon niet opgehaald worden"
+                )
+                err = forms.ValidationError(msg, code="invalid")
+                raise forms.ValidationError({"selectielijstklasse": err}) from exc
+
+        # spares the model fetching it again when it's saved
+        self.instance._selectielijstklasse = self._selectielijstklasse
+
+    def _get_invalid_resource_error(self, url: str) -> forms.ValidationError:
+        msg = _(
+            "The URL {url} resource did not look like a(n) `{resource}`. Please provide a valid URL."
+        ).format(url=url, resource="Resultaat")
+        err = forms.ValidationError(msg, code="invalid-resource")
+        return forms.ValidationError({"selectielijstklasse": err})
+
+    def _clean_selectielijstklasse(self):
+        """
+        Validate that the selectielijstklasse is relevant for the zaaktype.procestype
+        """
+        selectielijstklasse = self.cleaned_data.get("selectielijstklasse")
+        zaaktype = self.cleaned_data.get("zaaktype")
+
+        if not selectielijstklasse or not zaaktype:
+            # nothing to do
+            return
+
+        # Check whether the url points to a Resultaat
+        if not validators.obj_has_shape(
+            self._selectielijstklasse, self._referentielijsten_schema, "Resultaat"
+        ):
+            raise self._get_invalid_resource_error(selectielijstklasse)
 
-        procestype = response.json()["procesType"]
+        procestype = self._selectielijstklasse["procesType"]
         if procestype != zaaktype.selectielijst_procestype:
             msg = _(
                 "De selectielijstklasse hoort niet bij het selectielijst procestype van het zaaktype"
@@ -148,8 +205,7 @@ class ResultaatTypeForm(forms.ModelForm):
         if not selectielijstklasse or not afleidingswijze:
             return
 
-        response = requests.get(selectielijstklasse)
-        procestermijn = response.json()["procestermijn"]
+        procestermijn = self._selectielijstklasse["procestermijn"]
 
         # mapping selectielijst -> ZTC
         forward_not_ok = (
@@ -2,6 +2,7 @@ from django.contrib import admin
 from django.utils.translation import ugettext_lazy as _
 
 from ztc.datamodel.models.besluittype import BesluitType
+from ztc.utils.admin import APIURLAdminMixin
 
 from ..models import (
     InformatieObjectType,
@@ -55,7 +56,7 @@ class InformatieObjectTypeOmschrijvingGeneriekAdmin(
 
 @admin.register(InformatieObjectType)
 class InformatieObjectTypeAdmin(
-    GeldigheidAdminMixin, ConceptAdminMixin, admin.ModelAdmin
+    APIURLAdminMixin, GeldigheidAdminMixin, ConceptAdminMixin, admin.ModelAdmin
 ):
     list_display = (
         "catalogus",
@@ -64,6 +65,7 @@ class InformatieObjectTypeAdmin(
         "uuid",
         "get_absolute_api_url",
     )
+    list_select_related = ("catalogus",)
     list_filter = ("catalogus", "informatieobjectcategorie")
     search_fields = (
         "omschrijving",
@@ -0,0 +1,60 @@
+"""
+Fetch the referentielijsten resources validated by the admin forms.
+
+The resources and the OpenAPI schema of the referentielijsten API are fetched
+concurrently in a thread pool, with a session shared by the threads so the
+connections are reused. Fetching times out after ``REFERENTIELIJSTEN_TIMEOUT``
+seconds. The parsed schema is cached per process by
+:data:`vng_api_common.validators.fetcher`.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import Iterable
+
+from django.conf import settings
+
+import requests
+from vng_api_common import validators
+
+
+@lru_cache()
+def get_session() -> requests.Session:
+    return requests.Session()
+
+
+@lru_cache()
+def get_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=settings.REFERENTIELIJSTEN_WORKERS,
+        thread_name_prefix="referentielijsten",
+    )
+
+
+def _get(url: str) -> requests.Response:
+    return get_session().get(url, timeout=settings.REFERENTIELIJSTEN_TIMEOUT)
+
+
+def _fetch_schema(url: str) -> dict:
+    # looked up on every call, the fetcher is replaced in the tests
+    return validators.fetcher.fetch(url)
+
+
+def fetch_resource(url: str) -> "Future[requests.Response]":
+    return get_executor().submit(_get, url)
+
+
+def fetch_schema(url: str) -> "Future[dict]":
+    return get_executor().submit(_fetch_schema, url)
+
+
+def wait_for(futures: Iterable[Future]) -> None:
+    """
+    Wait until the ``futures`` are done or the timeout expires.
+
+    Futures which are not done by then are cancelled if they didn't start yet.
+    Read the results with ``future.result(timeout=0)``, which raises
+    :class:`TimeoutError` for the futures still running.
+    """
+    _, not_done = wait(futures, timeout=settings.REFERENTIELIJSTEN_TIMEOUT)
+    for future in not_done:
+        future.cancel()
@@ -85,7 +85,7 @@ class ResultaatTypeAdmin(admin.ModelAdmin):
             },
         ),
     )
-    raw_id_fields = ("zaaktype",)
+    raw_id_fields = ("zaaktype", "catalogus")
     filter_horizontal = (
         "zaakobjecttypen",
         "informatieobjecttypen",
@@ -16,6 +16,7 @@ class RolTypeAdmin(FilterSearchOrderingAdminMixin, admin.ModelAdmin):
         "uuid",
         "catalogus",
     )
+    list_select_related = ("zaaktype", "catalogus")
 
     # Details
     fieldsets = (
@@ -41,4 +42,4 @@ class RolTypeAdmin(FilterSearchOrderingAdminMixin, admin.ModelAdmin):
             },
         ),
     )
-    raw_id_fields = ("zaaktype",)
+    raw_id_fields = ("zaaktype", "catalogus")
@@ -17,6 +17,7 @@ class StatusTypeAdmin(FilterSearchOrderingAdminMixin, admin.ModelAdmin):
 
     # List
     list_display = ("statustype_omschrijving", "statustypevolgnummer", "zaaktype")
+    list_select_related = ("zaaktype",)
 
     # Details
     fieldsets = (
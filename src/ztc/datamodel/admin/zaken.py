@@ -4,7 +4,11 @@ from django.utils.translation import ugettext_lazy as _
 from django_better_admin_arrayfield.admin.mixins import DynamicArrayMixin
 
 from ztc.datamodel.models.zaakobjecttype import ZaakObjectType
-from ztc.utils.admin import EditInlineAdminMixin, ListObjectActionsAdminMixin
+from ztc.utils.admin import (
+    APIURLAdminMixin,
+    EditInlineAdminMixin,
+    ListObjectActionsAdminMixin,
+)
 
 from ..models import (
     Eigenschap,
@@ -31,12 +35,14 @@ class StatusTypeInline(EditInlineAdminMixin, admin.TabularInline):
 class RolTypeInline(EditInlineAdminMixin, admin.TabularInline):
     model = RolType
     fields = RolTypeAdmin.list_display
+    list_select_related = ("catalogus",)
 
 
 class EigenschapInline(EditInlineAdminMixin, admin.TabularInline):
     model = Eigenschap
     fields = EigenschapAdmin.list_display
     fk_name = "zaaktype"
+    list_select_related = ("statustype__zaaktype",)
 
 
 class ResultaatTypeInline(EditInlineAdminMixin, admin.TabularInline):
@@ -57,6 +63,7 @@ class ZaakObjectTypeInline(admin.TabularInline):
 
 @admin.register(ZaakType)
 class ZaakTypeAdmin(
+    APIURLAdminMixin,
     ListObjectActionsAdminMixin,
     GeldigheidAdminMixin,
     ConceptAdminMixin,
@@ -75,6 +82,7 @@ class ZaakTypeAdmin(
         "uuid",
         "get_absolute_api_url",
     )
+    list_select_related = ("catalogus",)
     list_filter = ("catalogus", "concept", "vertrouwelijkheidaanduiding")
     search_fields = (
         "identificatie",
@@ -175,20 +183,26 @@ class ZaakTypeAdmin(
         return (
             (
                 _("Toon {}").format(StatusType._meta.verbose_name_plural),
-                self._build_changelist_url(StatusType, query={"is_van": obj.pk}),
+                self._build_changelist_url(
+                    StatusType, query={"zaaktype__id__exact": obj.pk}
+                ),
             ),
             (
                 _("Toon {}").format(RolType._meta.verbose_name_plural),
-                self._build_changelist_url(RolType, query={"is_van": obj.pk}),
+                self._build_changelist_url(
+                    RolType, query={"zaaktype__id__exact": obj.pk}
+                ),
             ),
             (
                 _("Toon {}").format(Eigenschap._meta.verbose_name_plural),
-                self._build_changelist_url(Eigenschap, query={"is_van": obj.pk}),
+                self._build_changelist_url(
+                    Eigenschap, query={"zaaktype__id__exact": obj.pk}
+                ),
             ),
             (
                 _("Toon {}").format(ResultaatType._meta.verbose_name_plural),
                 self._build_changelist_url(
-                    ResultaatType, query={"is_relevant_voor": obj.pk}
+                    ResultaatType, query={"zaaktype__id__exact": obj.pk}
                 ),
             ),
         )
@@ -22,9 +22,26 @@ class SelectielijstKlasseProcestermijn(DjangoChoices):
     )
 
 
+class WijzigingActie(DjangoChoices):
+    create = ChoiceItem("create", _("Aangemaakt"))
+    update = ChoiceItem("update", _("Gewijzigd"))
+    destroy = ChoiceItem("destroy", _("Verwijderd"))
+
+
 DATUM_GELDIGHEID_QUERY_PARAM = OpenApiParameter(
     name="datumGeldigheid",
     location=OpenApiParameter.QUERY,
     description="filter op datumGeldigheid voor het zelf en alle onderliggende objecten",
     type=OpenApiTypes.STR,
 )
+
+ZONDER_RELATIES_QUERY_PARAM = OpenApiParameter(
+    name="zonderRelaties",
+    location=OpenApiParameter.QUERY,
+    description=(
+        "Laat de attributen `zaaktypen`, `besluittypen` en `informatieobjecttypen` "
+        "weg uit het antwoord. Gebruik voor grote catalogi de (gepagineerde) "
+        "lijst-endpoints met de `catalogus` query parameter om deze op te vragen."
+    ),
+    type=OpenApiTypes.BOOL,
+)
@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+from django.core.management import BaseCommand
+from django.utils import timezone
+
+from ...models import Wijziging
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete the changes of the change feed (/wijzigingen) which are older than "
+        "the retention period. Clients with a cursor before the oldest kept change "
+        "get an error and have to synchronise all objects again."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--keep-days",
+            type=int,
+            default=90,
+            help="Number of days the changes are kept.",
+        )
+
+    def handle(self, **options):
+        count = Wijziging.objects.opruimen(
+            timezone.now() - timedelta(days=options["keep_days"])
+        )
+        self.stdout.write(f"Deleted {count} changes")
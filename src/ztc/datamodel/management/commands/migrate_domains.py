@@ -1,5 +1,14 @@
 from django.apps import apps
-from django.core.management import BaseCommand
+from django.core.management import BaseCommand, call_command
+from django.db import transaction
+from django.db.models import Value
+from django.db.models.functions import Concat, Substr
+
+from vng_api_common.caching.registry import DEPENDENCY_REGISTRY
+from vng_api_common.caching.signals import is_etag_model
+
+from ztc.api import views  # noqa - registers the ETag models and their dependencies
+from ztc.api.wijzigingen import registreer_query_wijziging
 
 ZRC = ("https://ref.tst.vng.cloud/zrc/", "https://zaken-api.vng.cloud/")
 DRC = ("https://ref.tst.vng.cloud/drc/", "https://documenten-api.vng.cloud/")
@@ -38,17 +47,84 @@ MAPPING = BASE_MAPPING + (
     ("datamodel.ZaakType", "selectielijst_procestype", *VRL),
 )
 
+# models shown nested in the resource of the related object, which the ETag
+# dependencies don't track
+NESTED_IN = {
+    "datamodel.ZaakTypenRelatie": "zaaktype",
+}
+
+
+def clear_etags(model, queryset) -> int:
+    """
+    Clear the ETag values of the objects affected by changes in ``queryset``.
+
+    Only the objects themselves and the objects showing them through a relation
+    are affected, the ETag values are recalculated by ``fill_etags``.
+    """
+    count = 0
+    if is_etag_model(model):
+        count += queryset.exclude(_etag="").update(_etag="")
+
+    if model._meta.label in NESTED_IN:
+        field = model._meta.get_field(NESTED_IN[model._meta.label])
+        parents = field.related_model._default_manager.filter(
+            pk__in=queryset.values(field.attname)
+        )
+        count += parents.exclude(_etag="").update(_etag="")
+
+    for dependency in DEPENDENCY_REGISTRY.get(model, ()):
+        if not is_etag_model(dependency.affected_model):
+            continue
+
+        affected = dependency.affected_model._default_manager.filter(
+            **{f"{dependency.field.name}__in": queryset.values("pk")}
+        )
+        count += affected.exclude(_etag="").update(_etag="")
+    return count
+
 
 class Command(BaseCommand):
-    help = "Update data references from old to new domains"
+    help = (
+        "Update data references from old to new domains, with one UPDATE query "
+        "per mapping, register the changes for the change feed and recalculate "
+        "the ETag values of the updated objects"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the number of objects to update.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of objects fetched per query to recalculate the ETags.",
+        )
 
     def handle(self, **options):
-        for model, field, old, new in MAPPING:
-            self.stdout.write(f"Migrating {model}.{field}")
-            model = apps.get_model(model)
-
-            objects = model.objects.filter(**{f"{field}__startswith": old})
-            self.stdout.write(f"  Updating {objects.count()} objects...\n\n")
-            for obj in objects:
-                setattr(obj, field, getattr(obj, field).replace(old, new, 1))
-                obj.save()
+        with transaction.atomic():
+            for model, field, old, new in MAPPING:
+                self.stdout.write(f"Migrating {model}.{field}")
+                model = apps.get_model(model)
+
+                objects = model._default_manager.filter(**{f"{field}__startswith": old})
+                if options["dry_run"]:
+                    self.stdout.write(f"  {objects.count()} objects to update\n\n")
+                    continue
+
+                # the ETags are cleared and the changes registered first, while
+                # the old values still match
+                clear_etags(model, objects)
+                registreer_query_wijziging(objects)
+                # replace the prefix in the database, without fetching the objects
+                count = objects.update(
+                    **{field: Concat(Value(new), Substr(field, len(old) + 1))}
+                )
+                self.stdout.write(f"  Updated {count} objects\n\n")
+
+        if not options["dry_run"]:
+            call_command(
+                "fill_etags", batch_size=options["batch_size"], stdout=self.stdout
+            )
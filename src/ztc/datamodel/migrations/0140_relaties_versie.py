@@ -0,0 +1,53 @@
+# Generated by Django 3.2.14 on 2026-10-19 07:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0139_auto_20230531_1039"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="besluittype",
+            name="_relaties_versie",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Wordt opgehoogd bij elke wijziging van de gerelateerde objecten.",
+                verbose_name="versie relaties",
+            ),
+        ),
+        migrations.AddField(
+            model_name="informatieobjecttype",
+            name="_relaties_versie",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Wordt opgehoogd bij elke wijziging van de gerelateerde objecten.",
+                verbose_name="versie relaties",
+            ),
+        ),
+        migrations.AddField(
+            model_name="resultaattype",
+            name="_relaties_versie",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Wordt opgehoogd bij elke wijziging van de gerelateerde objecten.",
+                verbose_name="versie relaties",
+            ),
+        ),
+        migrations.AddField(
+            model_name="zaaktype",
+            name="_relaties_versie",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Wordt opgehoogd bij elke wijziging van de gerelateerde objecten.",
+                verbose_name="versie relaties",
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 3.2.14 on 2026-10-19 08:08
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0140_relaties_versie"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="zaaktype",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["trefwoorden"], name="zaaktype_trefwoorden_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="zaaktype",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["verantwoordingsrelatie"], name="zaaktype_verantw_relatie_gin"
+            ),
+        ),
+    ]
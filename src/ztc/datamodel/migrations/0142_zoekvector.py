@@ -0,0 +1,98 @@
+# Generated by Django 3.2.14 on 2026-10-19 08:11
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+ZOEKVECTOR_VELDEN = {
+    "ZaakType": (
+        ("zaaktype_omschrijving", "A"),
+        ("trefwoorden", "A"),
+        ("onderwerp", "B"),
+        ("doel", "C"),
+        ("aanleiding", "C"),
+    ),
+    "BesluitType": (
+        ("omschrijving", "A"),
+        ("omschrijving_generiek", "B"),
+        ("toelichting", "C"),
+    ),
+    "InformatieObjectType": (
+        ("omschrijving", "A"),
+        ("trefwoord", "A"),
+        ("toelichting", "C"),
+    ),
+}
+
+
+def set_zoekvector(apps, _):
+    for model_name, velden in ZOEKVECTOR_VELDEN.items():
+        model = apps.get_model("datamodel", model_name)
+        vectors = [
+            SearchVector(field, weight=weight, config="dutch")
+            for field, weight in velden
+        ]
+        zoekvector = vectors[0]
+        for vector in vectors[1:]:
+            zoekvector += vector
+        model.objects.update(_zoekvector=zoekvector)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0141_zaaktype_array_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="besluittype",
+            name="_zoekvector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False,
+                help_text="Full-text zoekvector van de beschrijvende velden.",
+                null=True,
+                verbose_name="zoekvector",
+            ),
+        ),
+        migrations.AddField(
+            model_name="informatieobjecttype",
+            name="_zoekvector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False,
+                help_text="Full-text zoekvector van de beschrijvende velden.",
+                null=True,
+                verbose_name="zoekvector",
+            ),
+        ),
+        migrations.AddField(
+            model_name="zaaktype",
+            name="_zoekvector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False,
+                help_text="Full-text zoekvector van de beschrijvende velden.",
+                null=True,
+                verbose_name="zoekvector",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="besluittype",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["_zoekvector"], name="besluittype_zoekvector_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="informatieobjecttype",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["_zoekvector"], name="iotype_zoekvector_gin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="zaaktype",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["_zoekvector"], name="zaaktype_zoekvector_gin"
+            ),
+        ),
+        migrations.RunPython(set_zoekvector, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 3.2.14 on 2026-10-19 08:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0142_zoekvector"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Wijziging",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "transactie",
+                    models.BigIntegerField(
+                        editable=False,
+                        help_text="ID van de database-transactie van de wijziging.",
+                        verbose_name="transactie",
+                    ),
+                ),
+                ("resource", models.CharField(max_length=50, verbose_name="resource")),
+                ("uuid", models.UUIDField(verbose_name="UUID")),
+                (
+                    "actie",
+                    models.CharField(
+                        choices=[
+                            ("create", "Aangemaakt"),
+                            ("update", "Gewijzigd"),
+                            ("destroy", "Verwijderd"),
+                        ],
+                        max_length=10,
+                        verbose_name="actie",
+                    ),
+                ),
+                (
+                    "aangemaakt",
+                    models.DateTimeField(auto_now_add=True, verbose_name="aangemaakt"),
+                ),
+            ],
+            options={
+                "verbose_name": "wijziging",
+                "verbose_name_plural": "wijzigingen",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="wijziging",
+            index=models.Index(
+                fields=["transactie", "id"], name="wijziging_cursor_idx"
+            ),
+        ),
+    ]
@@ -1,16 +1,29 @@
 import uuid as _uuid
 
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
 
 from vng_api_common.caching import ETagMixin
 from vng_api_common.fields import DaysDurationField
 
-from .mixins import ConceptMixin, DatumObjectMixin, GeldigheidMixin
+from .mixins import (
+    ConceptMixin,
+    DatumObjectMixin,
+    GeldigheidMixin,
+    RelatiesVersieMixin,
+    ZoekvectorMixin,
+)
 
 
 class BesluitType(
-    ETagMixin, GeldigheidMixin, DatumObjectMixin, ConceptMixin, models.Model
+    ETagMixin,
+    RelatiesVersieMixin,
+    ZoekvectorMixin,
+    GeldigheidMixin,
+    DatumObjectMixin,
+    ConceptMixin,
+    models.Model,
 ):
     """
     Generieke aanduiding van de aard van een besluit.
@@ -135,10 +148,19 @@ class BesluitType(
         ),
     )
 
+    ZOEKVECTOR_VELDEN = (
+        ("omschrijving", "A"),
+        ("omschrijving_generiek", "B"),
+        ("toelichting", "C"),
+    )
+
     class Meta:
         verbose_name = _("besluittype")
         verbose_name_plural = _("besluittypen")
         # unique_together = ("catalogus", "omschrijving")
+        indexes = [
+            GinIndex(fields=["_zoekvector"], name="besluittype_zoekvector_gin"),
+        ]
 
     def __str__(self):
         """
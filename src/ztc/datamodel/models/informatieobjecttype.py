@@ -1,6 +1,7 @@
 import uuid as _uuid
 
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.utils.html import format_html
 from django.utils.translation import ugettext_lazy as _
@@ -9,7 +10,13 @@ from vng_api_common.caching import ETagMixin
 from vng_api_common.fields import VertrouwelijkheidsAanduidingField
 from vng_api_common.models import APIMixin
 
-from .mixins import ConceptMixin, DatumObjectMixin, GeldigheidMixin
+from .mixins import (
+    ConceptMixin,
+    DatumObjectMixin,
+    GeldigheidMixin,
+    RelatiesVersieMixin,
+    ZoekvectorMixin,
+)
 
 
 class InformatieObjectTypeOmschrijvingGeneriek(
@@ -77,7 +84,14 @@ class InformatieObjectTypeOmschrijvingGeneriek(
 
 
 class InformatieObjectType(
-    APIMixin, ETagMixin, GeldigheidMixin, DatumObjectMixin, ConceptMixin, models.Model
+    APIMixin,
+    ETagMixin,
+    RelatiesVersieMixin,
+    ZoekvectorMixin,
+    GeldigheidMixin,
+    DatumObjectMixin,
+    ConceptMixin,
+    models.Model,
 ):
     """
     Aanduiding van de aard van INFORMATIEOBJECTen zoals gehanteerd door de zaakbehandelende organisatie.
@@ -163,10 +177,19 @@ class InformatieObjectType(
     #     ),
     # )
 
+    ZOEKVECTOR_VELDEN = (
+        ("omschrijving", "A"),
+        ("trefwoord", "A"),
+        ("toelichting", "C"),
+    )
+
     class Meta:
         # unique_together = ("catalogus", "omschrijving")
         verbose_name = _("Informatieobjecttype")
         verbose_name_plural = _("Informatieobjecttypen")
+        indexes = [
+            GinIndex(fields=["_zoekvector"], name="iotype_zoekvector_gin"),
+        ]
 
     def __str__(self):
         return "{} - {}".format(self.catalogus, self.omschrijving)
@@ -1,5 +1,9 @@
+import operator
 from datetime import timedelta
+from functools import reduce
+from typing import Tuple
 
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
@@ -123,3 +127,74 @@ class ConceptMixin(models.Model):
 
     class Meta:
         abstract = True
+
+
+class RelatiesVersieMixin(models.Model):
+    """
+    Track changes of the relations which are filtered on their geldigheid.
+
+    The API only shows the related objects which are valid on the requested date,
+    so changes of those objects change the response without changing the stored
+    ETag value. The version is part of the ETag value instead.
+    """
+
+    _relaties_versie = models.PositiveIntegerField(
+        _("versie relaties"),
+        default=0,
+        editable=False,
+        help_text=_("Wordt opgehoogd bij elke wijziging van de gerelateerde objecten."),
+    )
+
+    class Meta:
+        abstract = True
+
+
+class ZoekvectorMixin(models.Model):
+    """
+    Store the full-text search vector of the descriptive fields of the object.
+
+    The vector is built from the fields in ``ZOEKVECTOR_VELDEN`` (pairs of the
+    field name and the weight, ``"A"`` to ``"D"``) with the Dutch text search
+    configuration, and is updated in the same transaction on every save. Objects
+    loaded from fixtures are updated by :mod:`ztc.api.signals`.
+    """
+
+    ZOEKVECTOR_CONFIG = "dutch"
+    ZOEKVECTOR_VELDEN: Tuple[Tuple[str, str], ...] = ()
+
+    _zoekvector = SearchVectorField(
+        _("zoekvector"),
+        null=True,
+        editable=False,
+        help_text=_("Full-text zoekvector van de beschrijvende velden."),
+    )
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def get_zoekvector(cls) -> SearchVector:
+        return reduce(
+            operator.add,
+            (
+                SearchVector(field, weight=weight, config=cls.ZOEKVECTOR_CONFIG)
+                for field, weight in cls.ZOEKVECTOR_VELDEN
+            ),
+        )
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and not {
+            field for field, weight in self.ZOEKVECTOR_VELDEN
+        }.intersection(update_fields):
+            return
+
+        self.update_zoekvector()
+
+    def update_zoekvector(self) -> None:
+        # the vector is computed by the database, from the saved values
+        type(self)._default_manager.filter(pk=self.pk).update(
+            _zoekvector=self.get_zoekvector()
+        )
@@ -14,10 +14,14 @@ from vng_api_common.constants import (
 )
 from vng_api_common.descriptors import GegevensGroepType
 
-from ztc.datamodel.models.mixins import DatumObjectMixin, GeldigheidMixin
+from ztc.datamodel.models.mixins import (
+    DatumObjectMixin,
+    GeldigheidMixin,
+    RelatiesVersieMixin,
+)
 
 
-class ResultaatType(ETagMixin, GeldigheidMixin, DatumObjectMixin):
+class ResultaatType(ETagMixin, RelatiesVersieMixin, GeldigheidMixin, DatumObjectMixin):
     """
     Het betreft de indeling of groepering van resultaten van zaken van hetzelfde
     ZAAKTYPE naar hun aard, zoals 'verleend', 'geweigerd', 'verwerkt', et cetera.
@@ -207,11 +207,14 @@ class StatusType(ETagMixin, GeldigheidMixin, DatumObjectMixin):
         Een `StatusType` betreft een eindstatus als het volgnummer van het
         `StatusType` de hoogste is binnen het `ZaakType`.
 
-        # TODO: Can be cached on the model.
+        The API annotates the highest volgnummer on the queryset as
+        ``max_statustypevolgnummer``, to avoid a query per `StatusType`.
         """
-        max_statustypevolgnummer = self.zaaktype.statustypen.aggregate(
-            result=Max("statustypevolgnummer")
-        )["result"]
+        max_statustypevolgnummer = getattr(self, "max_statustypevolgnummer", None)
+        if max_statustypevolgnummer is None:
+            max_statustypevolgnummer = self.zaaktype.statustypen.aggregate(
+                result=Max("statustypevolgnummer")
+            )["result"]
 
         return max_statustypevolgnummer == self.statustypevolgnummer
 
@@ -0,0 +1,168 @@
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+from uuid import UUID
+
+from django.db import connections, models, transaction
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+from ..constants import WijzigingActie
+
+# the key of the advisory lock held by the transactions writing changes
+WIJZIGINGEN_LOCK = 0x7A7463
+
+# the changes are final below the lowest transaction ID in progress of the
+# snapshot, ignoring the transactions which don't hold the lock. A transaction
+# taking the lock later writes its changes above the current snapshot, see
+# ``WijzigingQuerySet.reserveer_transactie``.
+AFGEROND_SQL = """(
+    SELECT coalesce(min(xip.txid), txid_snapshot_xmax(txid_current_snapshot()))
+    FROM txid_snapshot_xip(txid_current_snapshot()) AS xip(txid)
+    WHERE xip.txid %% 4294967296 NOT IN (
+        SELECT running.transactionid::text::bigint
+        FROM pg_locks AS running
+        WHERE running.locktype = 'transactionid'
+        AND running.pid NOT IN (
+            SELECT writer.pid
+            FROM pg_locks AS writer
+            WHERE writer.locktype = 'advisory'
+            AND writer.classid = 0
+            AND writer.objid = %s
+            AND writer.objsubid = 1
+            AND writer.granted
+        )
+    )
+)"""
+
+
+class WijzigingQuerySet(models.QuerySet):
+    def reserveer_transactie(self) -> int:
+        """
+        Take the lock for writing changes, and return their transactie value.
+
+        Must be called in the transaction writing the changes. The lock is held
+        until the end of the transaction. The value is above the snapshot of any
+        reader which didn't see the transaction holding the lock.
+        """
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_advisory_xact_lock_shared(%s), txid_current()",
+                [WIJZIGINGEN_LOCK],
+            )
+            # a new snapshot, taken after the lock and the own transaction ID
+            cursor.execute("SELECT txid_snapshot_xmax(txid_current_snapshot())")
+            return cursor.fetchone()[0]
+
+    def registreer(self, resource: str, uuids: Iterable[UUID], actie: str) -> None:
+        """
+        Register the changes of the objects of ``resource`` with the ``uuids``.
+
+        The UUIDs of a queryset (``values_list("uuid", flat=True)``) are inserted
+        by the database, without fetching them.
+        """
+        with transaction.atomic(using=self.db):
+            transactie = self.reserveer_transactie()
+            if isinstance(uuids, models.QuerySet):
+                self._registreer_query(transactie, resource, uuids, actie)
+                return
+
+            self.bulk_create(
+                [
+                    self.model(
+                        transactie=transactie,
+                        resource=resource,
+                        uuid=uuid,
+                        actie=actie,
+                    )
+                    for uuid in uuids
+                ]
+            )
+
+    def _registreer_query(
+        self, transactie: int, resource: str, uuids: models.QuerySet, actie: str
+    ) -> None:
+        connection = connections[self.db]
+        quote_name = connection.ops.quote_name
+        columns = ", ".join(
+            quote_name(self.model._meta.get_field(name).column)
+            for name in ("transactie", "resource", "uuid", "actie", "aangemaakt")
+        )
+        query, params = uuids.query.get_compiler(self.db).as_sql()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {quote_name(self.model._meta.db_table)} ({columns}) "
+                f"SELECT %s, %s, uuids.uuid, %s, %s FROM ({query}) AS uuids(uuid)",
+                [transactie, resource, actie, timezone.now(), *params],
+            )
+
+    def afgerond(self):
+        """
+        Only the changes of the transactions which are no longer in progress.
+
+        A transaction in progress can commit its changes after a client has read
+        the changes of later transactions, which the client would then skip. Only
+        the transactions writing changes hold back the others, so a long running
+        transaction which doesn't change the catalogi doesn't stall the changes.
+        """
+        return self.filter(transactie__lt=RawSQL(AFGEROND_SQL, [WIJZIGINGEN_LOCK]))
+
+    def oudste_cursor(self) -> Optional[Tuple[int, int]]:
+        """
+        The ``(transactie, id)`` of the oldest change, which is kept by
+        :meth:`opruimen`.
+        """
+        return self.order_by("transactie", "pk").values_list("transactie", "pk").first()
+
+    def opruimen(self, voor: datetime) -> int:
+        """
+        Delete the changes created before ``voor``.
+
+        Only the changes before the first change which is kept are deleted, so a
+        cursor is valid as long as it's not before :meth:`oudste_cursor`. The
+        newest change is always kept for the cursors of the up to date clients.
+        """
+        afgerond = self.afgerond().order_by("transactie", "pk")
+        grens = afgerond.filter(aangemaakt__gte=voor).first() or afgerond.last()
+        if grens is None:
+            return 0
+
+        count, _ = self.filter(
+            Q(transactie__lt=grens.transactie)
+            | Q(transactie=grens.transactie, pk__lt=grens.pk)
+        ).delete()
+        return count
+
+
+class Wijziging(models.Model):
+    """
+    A change of a resource, for the synchronisation of copies of the catalogi.
+
+    The changes are written in the transaction of the change by the signals in
+    :mod:`ztc.api.signals`, and are ordered by the transactie value reserved by
+    the transaction.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    transactie = models.BigIntegerField(
+        _("transactie"),
+        editable=False,
+        help_text=_("ID van de database-transactie van de wijziging."),
+    )
+    resource = models.CharField(_("resource"), max_length=50)
+    uuid = models.UUIDField(_("UUID"))
+    actie = models.CharField(_("actie"), max_length=10, choices=WijzigingActie.choices)
+    aangemaakt = models.DateTimeField(_("aangemaakt"), auto_now_add=True)
+
+    objects = WijzigingQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("wijziging")
+        verbose_name_plural = _("wijzigingen")
+        indexes = [
+            models.Index(fields=["transactie", "id"], name="wijziging_cursor_idx")
+        ]
+
+    def __str__(self):
+        return f"{self.actie} {self.resource} {self.uuid}"
@@ -1,5 +1,6 @@
 import uuid
 
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
@@ -18,11 +19,24 @@ from vng_api_common.validators import alphanumeric_excluding_diacritic
 
 from ..choices import InternExtern
 from ..validators import validate_uppercase
-from .mixins import ConceptMixin, DatumObjectMixin, GeldigheidMixin
+from .mixins import (
+    ConceptMixin,
+    DatumObjectMixin,
+    GeldigheidMixin,
+    RelatiesVersieMixin,
+    ZoekvectorMixin,
+)
 
 
 class ZaakType(
-    ETagMixin, APIMixin, ConceptMixin, GeldigheidMixin, DatumObjectMixin, models.Model
+    ETagMixin,
+    RelatiesVersieMixin,
+    ZoekvectorMixin,
+    APIMixin,
+    ConceptMixin,
+    GeldigheidMixin,
+    DatumObjectMixin,
+    models.Model,
 ):
     """
     Het geheel van karakteristieke eigenschappen van zaken van eenzelfde soort
@@ -378,10 +392,27 @@ class ZaakType(
 
     IDENTIFICATIE_PREFIX = "ZAAKTYPE"
 
+    ZOEKVECTOR_VELDEN = (
+        ("zaaktype_omschrijving", "A"),
+        ("trefwoorden", "A"),
+        ("onderwerp", "B"),
+        ("doel", "C"),
+        ("aanleiding", "C"),
+    )
+
     class Meta:
         verbose_name = _("Zaaktype")
         verbose_name_plural = _("Zaaktypen")
         ordering = ("catalogus", "identificatie")
+        indexes = [
+            # for the array lookups (contains, overlap) of the filters
+            GinIndex(fields=["trefwoorden"], name="zaaktype_trefwoorden_gin"),
+            GinIndex(
+                fields=["verantwoordingsrelatie"],
+                name="zaaktype_verantw_relatie_gin",
+            ),
+            GinIndex(fields=["_zoekvector"], name="zaaktype_zoekvector_gin"),
+        ]
 
     def __str__(self) -> str:
         return self.identificatie
@@ -0,0 +1,59 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ztc.accounts.models import User
+
+from .factories import CatalogusFactory, StatusTypeFactory, ZaakTypeFactory
+
+
+class ZaakTypeAdminTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser("admin", "admin@example.com", "x")
+        cls.catalogus = CatalogusFactory.create()
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.user)
+
+    def _count_queries(self, url) -> int:
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def test_changelist_queries(self):
+        url = reverse("admin:datamodel_zaaktype_changelist")
+        ZaakTypeFactory.create(catalogus=self.catalogus)
+        expected = self._count_queries(url)
+
+        ZaakTypeFactory.create_batch(3, catalogus=CatalogusFactory.create())
+
+        self.assertEqual(self._count_queries(url), expected)
+
+    def test_change_page_limits_statustypen(self):
+        zaaktype = ZaakTypeFactory.create(catalogus=self.catalogus)
+        StatusTypeFactory.create_batch(40, zaaktype=zaaktype)
+        url = reverse("admin:datamodel_zaaktype_change", args=(zaaktype.pk,))
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        formset = response.context["inline_admin_formsets"][1].formset
+        self.assertEqual(len(formset.forms), 20)
+        self.assertEqual(formset.total_count, 40)
+        self.assertContains(response, formset.changelist_url)
+
+    def test_change_page_queries(self):
+        zaaktype = ZaakTypeFactory.create(catalogus=self.catalogus)
+        StatusTypeFactory.create_batch(10, zaaktype=zaaktype)
+        url = reverse("admin:datamodel_zaaktype_change", args=(zaaktype.pk,))
+        expected = self._count_queries(url)
+
+        StatusTypeFactory.create_batch(30, zaaktype=zaaktype)
+
+        # one additional query to count all statustypen
+        self.assertEqual(self._count_queries(url), expected + 1)
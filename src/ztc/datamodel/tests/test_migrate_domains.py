@@ -0,0 +1,64 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from ..models import ResultaatType, Wijziging, ZaakType
+from .factories import ResultaatTypeFactory, ZaakTypenRelatieFactory
+
+OLD_RESULTAAT = "https://ref.tst.vng.cloud/referentielijsten/api/v1/resultaten/1"
+NEW_RESULTAAT = "https://referentielijsten-api.vng.cloud/api/v1/resultaten/1"
+
+
+class MigrateDomainsTests(TestCase):
+    def test_migrate_domains(self):
+        resultaattype = ResultaatTypeFactory.create(selectielijstklasse=OLD_RESULTAAT)
+        relatie = ZaakTypenRelatieFactory.create(
+            gerelateerd_zaaktype="https://ref.tst.vng.cloud/ztc/api/v1/zaaktypen/1"
+        )
+        ZaakType.objects.update(_etag="stale")
+        ResultaatType.objects.update(_etag="stale")
+
+        call_command("migrate_domains", stdout=StringIO())
+
+        resultaattype.refresh_from_db()
+        relatie.refresh_from_db()
+        self.assertEqual(resultaattype.selectielijstklasse, NEW_RESULTAAT)
+        self.assertEqual(
+            relatie.gerelateerd_zaaktype,
+            "https://catalogi-api.vng.cloud/api/v1/zaaktypen/1",
+        )
+        self.assertNotEqual(resultaattype._etag, "stale")
+        self.assertFalse(ZaakType.objects.filter(_etag__in=["", "stale"]).exists())
+
+    def test_wijzigingen_registered(self):
+        resultaattype = ResultaatTypeFactory.create(selectielijstklasse=OLD_RESULTAAT)
+        relatie = ZaakTypenRelatieFactory.create(
+            gerelateerd_zaaktype="https://ref.tst.vng.cloud/ztc/api/v1/zaaktypen/1"
+        )
+        ZaakTypenRelatieFactory.create(
+            zaaktype=relatie.zaaktype,
+            gerelateerd_zaaktype="https://ref.tst.vng.cloud/ztc/api/v1/zaaktypen/2",
+        )
+        ResultaatTypeFactory.create(selectielijstklasse=NEW_RESULTAAT)
+        Wijziging.objects.all().delete()
+
+        call_command("migrate_domains", stdout=StringIO())
+
+        self.assertCountEqual(
+            Wijziging.objects.values_list("resource", "uuid", "actie"),
+            [
+                ("resultaattype", resultaattype.uuid, "update"),
+                ("zaaktype", relatie.zaaktype.uuid, "update"),
+            ],
+        )
+
+    def test_dry_run(self):
+        resultaattype = ResultaatTypeFactory.create(selectielijstklasse=OLD_RESULTAAT)
+        stdout = StringIO()
+
+        call_command("migrate_domains", dry_run=True, stdout=stdout)
+
+        resultaattype.refresh_from_db()
+        self.assertEqual(resultaattype.selectielijstklasse, OLD_RESULTAAT)
+        self.assertIn("1 objects to update", stdout.getvalue())
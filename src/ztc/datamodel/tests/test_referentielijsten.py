@@ -0,0 +1,148 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings, tag
+
+from vng_api_common.oas import SchemaFetcher
+
+from ..admin.forms import ResultaatTypeForm
+from .factories import ZaakTypeFactory
+
+PROCESTYPE_URL = "https://referentielijsten-api.vng.cloud/api/v1/procestypen/1"
+
+STUB_SCHEMA = """
+openapi: 3.0.0
+info:
+  title: Referentielijsten API stub
+  version: "1"
+paths: {}
+components:
+  schemas:
+    Resultaat:
+      type: object
+      required:
+        - url
+        - procesType
+      properties:
+        url:
+          type: string
+        procesType:
+          type: string
+        procestermijn:
+          type: string
+"""
+
+RESULTAAT = {"procesType": PROCESTYPE_URL, "procestermijn": "nihil"}
+
+
+class StubReferentielijstenHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requested.append(self.path)
+        if self.path == "/schema":
+            self.send_response(200)
+            self.send_header("Content-Type", "application/yaml")
+            self.end_headers()
+            self.wfile.write(STUB_SCHEMA.encode())
+            return
+
+        if self.path == "/resultaten/traag":
+            time.sleep(1)
+
+        if not self.path.startswith("/resultaten/"):
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        url = f"http://{self.headers['Host']}{self.path}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(json.dumps({"url": url, **RESULTAAT}).encode())
+
+    def log_message(self, *args):
+        pass
+
+
+@tag("resultaattype")
+class ResultaatTypeFormReferentielijstenTests(TestCase):
+    """
+    Fetch the selectielijstklasse and the schema from a local referentielijsten API.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubReferentielijstenHandler)
+        cls.server.requested = []
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = "http://127.0.0.1:{}".format(cls.server.server_address[1])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        super().setUp()
+
+        self.server.requested.clear()
+        self.zaaktype = ZaakTypeFactory.create(selectielijst_procestype=PROCESTYPE_URL)
+
+        patcher = patch("ztc.datamodel.admin.forms.API_SPEC", f"{self.base_url}/schema")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # the parsed schemas are cached per process
+        patcher = patch("vng_api_common.validators.fetcher", SchemaFetcher())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_form(self, selectielijstklasse: str, **data) -> ResultaatTypeForm:
+        return ResultaatTypeForm(
+            data={
+                "selectielijstklasse": selectielijstklasse,
+                "zaaktype": self.zaaktype.id,
+                **data,
+            }
+        )
+
+    def test_fetched_once(self):
+        form = self.get_form(
+            f"{self.base_url}/resultaten/1",
+            brondatum_archiefprocedure_afleidingswijze="afgehandeld",
+        )
+
+        form.is_valid()
+
+        self.assertNotIn("selectielijstklasse", form.errors)
+        self.assertNotIn("brondatum_archiefprocedure_afleidingswijze", form.errors)
+        self.assertEqual(sorted(self.server.requested), ["/resultaten/1", "/schema"])
+        self.assertEqual(
+            form.instance.get_selectielijstklasse()["procestermijn"], "nihil"
+        )
+
+    def test_schema_cached(self):
+        for i in range(2):
+            self.get_form(f"{self.base_url}/resultaten/{i}").is_valid()
+
+        self.assertEqual(self.server.requested.count("/schema"), 1)
+
+    def test_not_found(self):
+        form = self.get_form(f"{self.base_url}/procestypen/1")
+
+        self.assertFalse(form.is_valid())
+        error = form.errors.as_data()["selectielijstklasse"][0]
+        self.assertEqual(error.code, "invalid")
+
+    @override_settings(REFERENTIELIJSTEN_TIMEOUT=0.1)
+    def test_timeout(self):
+        form = self.get_form(f"{self.base_url}/resultaten/traag")
+
+        self.assertFalse(form.is_valid())
+        error = form.errors.as_data()["selectielijstklasse"][0]
+        self.assertEqual(error.code, "invalid")
+        self.assertIn("did not respond in time", error.message)
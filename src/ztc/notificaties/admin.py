@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from .models import Notificatie
+
+
+@admin.register(Notificatie)
+class NotificatieAdmin(admin.ModelAdmin):
+    list_display = ("kanaal", "actie", "resource_url", "aangemaakt", "verzonden")
+    list_filter = ("kanaal", "actie", ("verzonden", admin.EmptyFieldListFilter))
+    search_fields = ("resource_url",)
+    readonly_fields = ("aangemaakt",)
@@ -0,0 +1,146 @@
+import time
+from datetime import timedelta
+
+from django.core.management import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+import requests
+from notifications_api_common.models import NotificationsConfig
+from zds_client import ClientError
+
+from ...models import Notificatie
+
+# seconds between the cleanups of the outbox when running with --interval
+CLEANUP_INTERVAL = 60 * 60
+
+
+class Command(BaseCommand):
+    help = "Send the notifications in the outbox to the Notificaties API"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of notifications sent per transaction.",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=10,
+            help="Number of attempts after which a notification is given up.",
+        )
+        parser.add_argument(
+            "--backoff",
+            type=int,
+            default=30,
+            help="Seconds to wait after the first failed attempt, doubled each attempt.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=0,
+            help="Keep running and check the outbox every INTERVAL seconds.",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=int,
+            default=10,
+            help="Seconds to wait for the Notificaties API per notification.",
+        )
+        parser.add_argument(
+            "--keep-days",
+            type=int,
+            default=30,
+            help=(
+                "Delete the sent and given up notifications after KEEP_DAYS days, "
+                "0 keeps them."
+            ),
+        )
+
+    def handle(self, **options):
+        warned = False
+        next_cleanup = 0.0
+        while True:
+            if options["keep_days"] and time.monotonic() >= next_cleanup:
+                self.cleanup(options["max_attempts"], options["keep_days"])
+                next_cleanup = time.monotonic() + CLEANUP_INTERVAL
+
+            client = NotificationsConfig.get_client()
+            if client is not None:
+                while self.send_batch(client, **options):
+                    pass
+            elif not warned:
+                # a fresh install has no configuration yet, which is not an error
+                self.stderr.write(
+                    "The Notificaties API is not configured, no notifications are sent"
+                )
+                warned = True
+
+            if not options["interval"]:
+                break
+            time.sleep(options["interval"])
+
+    def cleanup(self, max_attempts: int, keep_days: int) -> None:
+        count = Notificatie.objects.opruimen(
+            max_attempts, timezone.now() - timedelta(days=keep_days)
+        )
+        if count:
+            self.stdout.write(f"Deleted {count} old notifications")
+
+    def claim_batch(self, batch_size, max_attempts, lease: timedelta) -> list:
+        """
+        Reserve the next batch of notifications for this worker.
+
+        The batch is postponed by ``lease``, so other workers skip it while it's
+        sent, and retry it if this worker stops before recording the results.
+        """
+        with transaction.atomic():
+            # concurrent workers skip each other's batches
+            batch = list(
+                Notificatie.objects.te_verzenden(max_attempts).select_for_update(
+                    skip_locked=True
+                )[:batch_size]
+            )
+            Notificatie.objects.filter(pk__in=[n.pk for n in batch]).update(
+                volgende_poging=timezone.now() + lease
+            )
+        return batch
+
+    def send_batch(
+        self, client, batch_size, max_attempts, backoff, timeout, **options
+    ) -> int:
+        """
+        Send the next batch of notifications, returns the number of notifications
+        that were sent.
+
+        No transaction is open while the notifications are sent.
+        """
+        batch = self.claim_batch(
+            batch_size, max_attempts, timedelta(seconds=batch_size * timeout)
+        )
+        if not batch:
+            return 0
+
+        sent = 0
+        for notificatie in batch:
+            try:
+                client.create(
+                    "notificaties",
+                    notificatie.bericht,
+                    request_kwargs={"timeout": timeout},
+                )
+            except (ClientError, requests.RequestException) as exc:
+                notificatie.mislukt(repr(exc), timedelta(seconds=backoff))
+            else:
+                notificatie.verzonden = timezone.now()
+                sent += 1
+
+        with transaction.atomic():
+            Notificatie.objects.bulk_update(
+                batch, ["pogingen", "volgende_poging", "verzonden", "laatste_fout"]
+            )
+
+        self.stdout.write(f"Sent {sent} of {len(batch)} notifications")
+        return sent
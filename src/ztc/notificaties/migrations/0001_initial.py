@@ -0,0 +1,73 @@
+# Generated by Django 3.2.14 on 2026-10-19 07:45
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Notificatie",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("kanaal", models.CharField(max_length=50, verbose_name="kanaal")),
+                (
+                    "resource_url",
+                    models.URLField(max_length=1000, verbose_name="resource URL"),
+                ),
+                ("actie", models.CharField(max_length=100, verbose_name="actie")),
+                (
+                    "bericht",
+                    models.JSONField(
+                        help_text="Het bericht voor de Notificaties API.",
+                        verbose_name="bericht",
+                    ),
+                ),
+                (
+                    "aangemaakt",
+                    models.DateTimeField(auto_now_add=True, verbose_name="aangemaakt"),
+                ),
+                (
+                    "pogingen",
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name="pogingen"
+                    ),
+                ),
+                (
+                    "volgende_poging",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        verbose_name="volgende poging",
+                    ),
+                ),
+                (
+                    "verzonden",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="verzonden"
+                    ),
+                ),
+                (
+                    "laatste_fout",
+                    models.TextField(blank=True, verbose_name="laatste fout"),
+                ),
+            ],
+            options={
+                "verbose_name": "notificatie",
+                "verbose_name_plural": "notificaties",
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 3.2.14 on 2026-10-19 09:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notificaties", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notificatie",
+            index=models.Index(
+                condition=models.Q(("verzonden__isnull", True)),
+                fields=["kanaal", "resource_url"],
+                name="notificatie_wachtend_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notificatie",
+            index=models.Index(
+                condition=models.Q(("verzonden__isnull", True)),
+                fields=["id"],
+                name="notificatie_te_verzenden_idx",
+            ),
+        ),
+    ]
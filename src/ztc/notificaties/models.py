@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta
+
+from django.db import models, transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+# updates of the same resource replace each other while they wait in the outbox
+COALESCED_ACTIES = ("update", "partial_update")
+
+
+class NotificatieQuerySet(models.QuerySet):
+    def enqueue(self, bericht: dict) -> "Notificatie":
+        """
+        Add a notification message to the outbox.
+
+        A pending update notification of the same resource with the same kenmerken
+        is replaced by the new message instead, so subscribers receive a single
+        notification for a series of writes.
+        """
+        with transaction.atomic():
+            if bericht["actie"] in COALESCED_ACTIES:
+                pending = (
+                    self.filter(
+                        kanaal=bericht["kanaal"],
+                        resource_url=bericht["resourceUrl"],
+                        actie__in=COALESCED_ACTIES,
+                        bericht__kenmerken=bericht["kenmerken"],
+                        verzonden__isnull=True,
+                        pogingen=0,
+                        # not claimed by a worker which is sending it
+                        volgende_poging__lte=timezone.now(),
+                    )
+                    .select_for_update()
+                    .order_by("-pk")
+                    .first()
+                )
+                if pending is not None:
+                    pending.actie = bericht["actie"]
+                    pending.bericht = bericht
+                    pending.save(update_fields=["actie", "bericht"])
+                    return pending
+
+            return self.create(
+                kanaal=bericht["kanaal"],
+                resource_url=bericht["resourceUrl"],
+                actie=bericht["actie"],
+                bericht=bericht,
+            )
+
+    def te_verzenden(self, max_pogingen: int):
+        # ``verzonden__isnull`` matches the condition of the partial indexes, so
+        # the sent notifications are skipped
+        return self.filter(
+            verzonden__isnull=True,
+            pogingen__lt=max_pogingen,
+            volgende_poging__lte=timezone.now(),
+        ).order_by("pk")
+
+    def opruimen(self, max_pogingen: int, voor: datetime) -> int:
+        """
+        Delete the notifications sent before ``voor``, and the notifications
+        created before it which were given up after ``max_pogingen`` attempts.
+        """
+        count, _ = self.filter(
+            Q(verzonden__lt=voor)
+            | Q(verzonden__isnull=True, pogingen__gte=max_pogingen, aangemaakt__lt=voor)
+        ).delete()
+        return count
+
+
+class Notificatie(models.Model):
+    """
+    A notification waiting to be sent to the Notificaties API.
+
+    Notifications are written in the transaction of the change that causes them and
+    sent by the ``send_notifications`` management command.
+    """
+
+    kanaal = models.CharField(_("kanaal"), max_length=50)
+    resource_url = models.URLField(_("resource URL"), max_length=1000)
+    actie = models.CharField(_("actie"), max_length=100)
+    bericht = models.JSONField(
+        _("bericht"), help_text=_("Het bericht voor de Notificaties API.")
+    )
+    aangemaakt = models.DateTimeField(_("aangemaakt"), auto_now_add=True)
+
+    pogingen = models.PositiveSmallIntegerField(_("pogingen"), default=0)
+    volgende_poging = models.DateTimeField(
+        _("volgende poging"), default=timezone.now, db_index=True
+    )
+    verzonden = models.DateTimeField(_("verzonden"), blank=True, null=True)
+    laatste_fout = models.TextField(_("laatste fout"), blank=True)
+
+    objects = NotificatieQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("notificatie")
+        verbose_name_plural = _("notificaties")
+        # the sent notifications stay in the table until they are cleaned up,
+        # the queries of the outbox only use the notifications waiting to be sent
+        indexes = [
+            models.Index(
+                fields=["kanaal", "resource_url"],
+                name="notificatie_wachtend_idx",
+                condition=Q(verzonden__isnull=True),
+            ),
+            models.Index(
+                fields=["id"],
+                name="notificatie_te_verzenden_idx",
+                condition=Q(verzonden__isnull=True),
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.kanaal} {self.actie} {self.resource_url}"
+
+    def mislukt(self, fout: str, backoff: timedelta) -> None:
+        """
+        Register a failed attempt, the next attempt waits twice as long each time.
+        """
+        self.pogingen += 1
+        self.volgende_poging = timezone.now() + backoff * 2 ** (self.pogingen - 1)
+        self.laatste_fout = fout
@@ -0,0 +1,308 @@
+import json
+import threading
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from notifications_api_common.models import NotificationsConfig
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, get_operation_url, reverse
+from zgw_consumers.constants import APITypes, AuthTypes
+from zgw_consumers.models import Service
+
+from ztc.api.scopes import SCOPE_CATALOGI_READ, SCOPE_CATALOGI_WRITE
+from ztc.datamodel.tests.factories import BesluitTypeFactory, ZaakTypeFactory
+
+from ..management.commands.send_notifications import Command
+from ..models import Notificatie
+
+STUB_SCHEMA = """
+openapi: 3.0.0
+info:
+  title: Notificaties API stub
+  version: "1"
+paths:
+  /notificaties:
+    post:
+      operationId: notificaties_create
+      responses:
+        "201":
+          description: Created
+"""
+
+
+class StubNotificatiesHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/yaml")
+        self.end_headers()
+        self.wfile.write(STUB_SCHEMA.encode())
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.server.failures:
+            self.server.failures -= 1
+            self.send_response(500)
+            self.end_headers()
+            return
+
+        self.server.received.append(json.loads(body))
+        self.send_response(201)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def get_bericht(resource_url: str, actie: str = "update", **kenmerken) -> dict:
+    return {
+        "kanaal": "zaaktypen",
+        "hoofdObject": resource_url,
+        "resource": "zaaktype",
+        "resourceUrl": resource_url,
+        "actie": actie,
+        "aanmaakdatum": timezone.now().isoformat(),
+        "kenmerken": kenmerken,
+    }
+
+
+class EnqueueTests(TestCase):
+    def test_coalesce_updates(self):
+        url = "http://testserver/api/v1/zaaktypen/1"
+        Notificatie.objects.enqueue(get_bericht(url, "update", catalogus="a"))
+        Notificatie.objects.enqueue(get_bericht(url, "partial_update", catalogus="a"))
+
+        notificatie = Notificatie.objects.get()
+        self.assertEqual(notificatie.actie, "partial_update")
+        self.assertEqual(notificatie.bericht["actie"], "partial_update")
+
+    def test_no_coalescing_across_kenmerken_or_actions(self):
+        url = "http://testserver/api/v1/zaaktypen/1"
+        Notificatie.objects.enqueue(get_bericht(url, "update", catalogus="a"))
+        Notificatie.objects.enqueue(get_bericht(url, "update", catalogus="b"))
+        Notificatie.objects.enqueue(get_bericht(url, "destroy", catalogus="b"))
+        Notificatie.objects.enqueue(get_bericht(url, "destroy", catalogus="b"))
+
+        self.assertEqual(Notificatie.objects.count(), 4)
+
+    def test_no_coalescing_with_attempted_notifications(self):
+        url = "http://testserver/api/v1/zaaktypen/1"
+        Notificatie.objects.enqueue(get_bericht(url, catalogus="a"))
+        Notificatie.objects.update(pogingen=1)
+        Notificatie.objects.enqueue(get_bericht(url, catalogus="a"))
+
+        self.assertEqual(Notificatie.objects.count(), 2)
+
+    def test_no_coalescing_with_claimed_notifications(self):
+        url = "http://testserver/api/v1/zaaktypen/1"
+        Notificatie.objects.enqueue(get_bericht(url, catalogus="a"))
+        Command().claim_batch(10, 10, timedelta(minutes=5))
+        Notificatie.objects.enqueue(get_bericht(url, catalogus="a"))
+
+        self.assertEqual(Notificatie.objects.count(), 2)
+
+
+@override_settings(NOTIFICATIONS_DISABLED=False)
+class OutboxAPITests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_destroy_writes_outbox(self):
+        zaaktype = ZaakTypeFactory.create(concept=True)
+        url = f"http://testserver{reverse(zaaktype)}"
+
+        response = self.client.delete(url)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        notificatie = Notificatie.objects.get()
+        self.assertEqual(notificatie.kanaal, "zaaktypen")
+        self.assertEqual(notificatie.actie, "destroy")
+        self.assertEqual(notificatie.resource_url, url)
+        self.assertEqual(
+            notificatie.bericht["kenmerken"],
+            {"catalogus": f"http://testserver{reverse(zaaktype.catalogus)}"},
+        )
+
+    def test_publish_writes_outbox(self):
+        zaaktype = ZaakTypeFactory.create(concept=True)
+        url = f"http://testserver{reverse(zaaktype)}"
+
+        response = self.client.post(
+            get_operation_url("zaaktype_publish", uuid=zaaktype.uuid)
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        notificatie = Notificatie.objects.get()
+        self.assertEqual(notificatie.kanaal, "zaaktypen")
+        self.assertEqual(notificatie.actie, "publish")
+        self.assertEqual(notificatie.resource_url, url)
+        self.assertEqual(
+            notificatie.bericht["kenmerken"],
+            {"catalogus": f"http://testserver{reverse(zaaktype.catalogus)}"},
+        )
+
+    def test_publish_besluittype_writes_outbox(self):
+        besluittype = BesluitTypeFactory.create(concept=True)
+        url = f"http://testserver{reverse(besluittype)}"
+
+        response = self.client.post(
+            get_operation_url("besluittype_publish", uuid=besluittype.uuid)
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        notificatie = Notificatie.objects.get()
+        self.assertEqual(notificatie.kanaal, "besluittypen")
+        self.assertEqual(notificatie.resource_url, url)
+
+    @override_settings(NOTIFICATIONS_DISABLED=True)
+    def test_notifications_disabled(self):
+        zaaktype = ZaakTypeFactory.create(concept=True)
+
+        response = self.client.delete(reverse(zaaktype))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Notificatie.objects.exists())
+
+
+@override_settings(NOTIFICATIONS_DISABLED=False)
+class OutboxAPIScopeTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_CATALOGI_READ, SCOPE_CATALOGI_WRITE]
+
+    def test_failed_write_leaves_outbox_empty(self):
+        zaaktype = ZaakTypeFactory.create(concept=False)
+
+        response = self.client.delete(reverse(zaaktype))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Notificatie.objects.exists())
+
+
+class SendNotificationsTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubNotificatiesHandler)
+        cls.server.received = []
+        cls.server.failures = 0
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        super().setUp()
+        self.server.received = []
+        self.server.failures = 0
+
+        api_root = f"http://127.0.0.1:{self.server.server_port}/api/v1/"
+        config = NotificationsConfig.get_solo()
+        config.notifications_api_service = Service.objects.create(
+            label="Notificaties API stub",
+            api_type=APITypes.nrc,
+            api_root=api_root,
+            oas=f"{api_root}schema/openapi.yaml",
+            auth_type=AuthTypes.no_auth,
+        )
+        config.save()
+
+    def test_send_in_batches(self):
+        for i in range(5):
+            Notificatie.objects.enqueue(get_bericht(f"http://testserver/{i}"))
+
+        stdout = StringIO()
+        call_command("send_notifications", batch_size=2, stdout=stdout)
+
+        self.assertEqual(len(self.server.received), 5)
+        self.assertFalse(Notificatie.objects.filter(verzonden__isnull=True).exists())
+        self.assertEqual(stdout.getvalue().count("Sent"), 3)
+
+    def test_retry_with_backoff(self):
+        notificatie = Notificatie.objects.enqueue(get_bericht("http://testserver/1"))
+        self.server.failures = 2
+
+        call_command("send_notifications", backoff=60, stdout=StringIO())
+
+        notificatie.refresh_from_db()
+        self.assertIsNone(notificatie.verzonden)
+        self.assertEqual(notificatie.pogingen, 1)
+        self.assertGreater(
+            notificatie.volgende_poging, timezone.now() + timedelta(seconds=50)
+        )
+        self.assertNotEqual(notificatie.laatste_fout, "")
+
+        # not due yet
+        call_command("send_notifications", stdout=StringIO())
+        notificatie.refresh_from_db()
+        self.assertEqual(notificatie.pogingen, 1)
+
+        Notificatie.objects.update(volgende_poging=timezone.now())
+        call_command("send_notifications", backoff=60, stdout=StringIO())
+        notificatie.refresh_from_db()
+        self.assertEqual(notificatie.pogingen, 2)
+        self.assertGreater(
+            notificatie.volgende_poging, timezone.now() + timedelta(seconds=110)
+        )
+
+        Notificatie.objects.update(volgende_poging=timezone.now())
+        call_command("send_notifications", stdout=StringIO())
+        notificatie.refresh_from_db()
+        self.assertIsNotNone(notificatie.verzonden)
+        self.assertEqual(self.server.received, [notificatie.bericht])
+
+    def test_give_up_after_max_attempts(self):
+        Notificatie.objects.enqueue(get_bericht("http://testserver/1"))
+        Notificatie.objects.update(pogingen=3)
+
+        call_command("send_notifications", max_attempts=3, stdout=StringIO())
+
+        self.assertEqual(self.server.received, [])
+
+    def test_claimed_batch_skipped(self):
+        Notificatie.objects.enqueue(get_bericht("http://testserver/1"))
+        Command().claim_batch(10, 10, timedelta(minutes=5))
+
+        call_command("send_notifications", stdout=StringIO())
+
+        self.assertEqual(self.server.received, [])
+        self.assertFalse(Notificatie.objects.te_verzenden(10).exists())
+
+    def test_cleanup(self):
+        oud = timezone.now() - timedelta(days=31)
+        verzonden = Notificatie.objects.enqueue(get_bericht("http://testserver/1"))
+        opgegeven = Notificatie.objects.enqueue(get_bericht("http://testserver/2"))
+        wachtend = Notificatie.objects.enqueue(get_bericht("http://testserver/3"))
+        recent = Notificatie.objects.enqueue(get_bericht("http://testserver/4"))
+        Notificatie.objects.filter(pk=verzonden.pk).update(verzonden=oud)
+        Notificatie.objects.filter(pk=opgegeven.pk).update(pogingen=10)
+        Notificatie.objects.filter(pk=wachtend.pk).update(
+            pogingen=2, volgende_poging=timezone.now() + timedelta(hours=1)
+        )
+        Notificatie.objects.exclude(pk=recent.pk).update(aangemaakt=oud)
+        Notificatie.objects.filter(pk=recent.pk).update(verzonden=timezone.now())
+
+        call_command("send_notifications", keep_days=30, stdout=StringIO())
+
+        self.assertCountEqual(
+            Notificatie.objects.values_list("pk", flat=True), [wachtend.pk, recent.pk]
+        )
+
+    def test_not_configured(self):
+        config = NotificationsConfig.get_solo()
+        config.notifications_api_service = None
+        config.save()
+        Notificatie.objects.enqueue(get_bericht("http://testserver/1"))
+        stderr = StringIO()
+
+        call_command("send_notifications", stdout=StringIO(), stderr=stderr)
+
+        self.assertIn("not configured", stderr.getvalue())
+        self.assertTrue(Notificatie.objects.filter(verzonden__isnull=True).exists())
@@ -1,9 +1,21 @@
+from functools import lru_cache
 from urllib.parse import urlencode
+from uuid import UUID
 
-from django.urls import reverse
+from django.forms.models import BaseInlineFormSet
+from django.urls import get_script_prefix, reverse
+from django.utils.functional import cached_property
+from django.utils.html import format_html
 from django.utils.safestring import mark_safe
 from django.utils.translation import ugettext_lazy as _
 
+UUID_PLACEHOLDER = str(UUID(int=0))
+
+
+@lru_cache()
+def _get_api_url_template(view_name: str, script_prefix: str) -> str:
+    return reverse(view_name, kwargs={"version": "1", "uuid": UUID_PLACEHOLDER})
+
 
 class ObjectActionsAdminMixin(object):
     def _build_changelist_url(self, model, query=None):
@@ -72,14 +84,78 @@ class ListObjectActionsAdminMixin(ObjectActionsAdminMixin):
         return tuple(list_display) + ("_get_object_actions",)
 
 
+class APIURLAdminMixin(object):
+    """
+    Show the API URL of the objects without reversing the URL for every row.
+    """
+
+    def get_absolute_api_url(self, obj):
+        view_name = f"{obj._meta.model_name}-detail"
+        template = _get_api_url_template(view_name, get_script_prefix())
+        path = template.replace(UUID_PLACEHOLDER, str(obj.uuid))
+        return format_html('<a href="{path}">{path}</a>', path=path)
+
+    get_absolute_api_url.short_description = _("API URL")
+
+
+class LimitedInlineFormSet(BaseInlineFormSet):
+    """
+    Only render the first ``max_shown`` related objects.
+
+    The complete list of related objects is linked with ``changelist_url``.
+    """
+
+    max_shown = None
+
+    def get_queryset(self):
+        if not hasattr(self, "_queryset"):
+            queryset = super().get_queryset()
+            if self.max_shown is not None:
+                queryset = queryset[: self.max_shown]
+            self._queryset = queryset
+        return self._queryset
+
+    @cached_property
+    def total_count(self) -> int:
+        shown = len(self.get_queryset())
+        if shown != self.max_shown:
+            return shown
+        return self.queryset.count()
+
+    @property
+    def has_more(self) -> bool:
+        return self.total_count > len(self.get_queryset())
+
+    @property
+    def changelist_url(self) -> str:
+        opts = self.model._meta
+        url = reverse(f"admin:{opts.app_label}_{opts.model_name}_changelist")
+        query = urlencode({f"{self.fk.name}__id__exact": self.instance.pk})
+        return f"{url}?{query}"
+
+
 class EditInlineAdminMixin(object):
     template = "admin/edit_inline/tabular_add_and_edit.html"
+    formset = LimitedInlineFormSet
     extra = 0
     can_delete = False
     show_change_link = True
+    max_shown = 20
+    list_select_related = ()
 
     def has_add_permission(self, request, obj):
         return False
 
     def get_readonly_fields(self, request, obj=None):
         return super().get_fields(request, obj)
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if self.list_select_related:
+            queryset = queryset.select_related(*self.list_select_related)
+        return queryset
+
+    def get_formset(self, request, obj=None, **kwargs):
+        formset = super().get_formset(request, obj, **kwargs)
+        formset.max_shown = self.max_shown
+        return formset
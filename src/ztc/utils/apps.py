@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.core.signals import request_started
 
 
 class UtilsConfig(AppConfig):
@@ -6,3 +7,8 @@ class UtilsConfig(AppConfig):
 
     def ready(self):
         from . import checks  # noqa
+        from .db import check_connection_health
+
+        request_started.connect(
+            check_connection_health, dispatch_uid="check_connection_health"
+        )
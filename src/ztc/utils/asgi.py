@@ -0,0 +1,72 @@
+"""
+Run the sync code of ASGI requests in a pool of persistent threads.
+
+Django 3.2 runs the thread-sensitive sync code (signals, middleware and sync
+views) of all requests in a single thread. asgiref's ``ThreadSensitiveContext``
+gives each request a thread of its own instead, but it starts a new thread per
+request, whose database connection is discarded with it. :class:`PooledThreadContext`
+lends each request one of a fixed number of threads, which keep their database
+connection between requests for ``CONN_MAX_AGE`` seconds.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from asgiref.sync import SyncToAsync, ThreadSensitiveContext
+
+
+class ThreadPool:
+    """
+    A fixed number of single-thread executors, lent out to one request at a time.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._executors: List[ThreadPoolExecutor] = []
+        self._available: Optional[asyncio.Queue] = None
+
+    def _get_queue(self) -> asyncio.Queue:
+        # created in the event loop of the server
+        if self._available is None:
+            self._available = asyncio.Queue()
+            for i in range(self.size):
+                executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix=f"asgi-sync-{i}"
+                )
+                self._executors.append(executor)
+                self._available.put_nowait(executor)
+        return self._available
+
+    async def acquire(self) -> ThreadPoolExecutor:
+        return await self._get_queue().get()
+
+    def release(self, executor: ThreadPoolExecutor) -> None:
+        self._get_queue().put_nowait(executor)
+
+
+class PooledThreadContext(ThreadSensitiveContext):
+    """
+    Run the thread-sensitive sync code of the context in a thread of ``pool``.
+
+    Requests wait for a free thread when all threads are in use.
+    """
+
+    def __init__(self, pool: ThreadPool):
+        super().__init__()
+        self.pool = pool
+        self.executor: Optional[ThreadPoolExecutor] = None
+
+    async def __aenter__(self):
+        await super().__aenter__()
+        if self.token:
+            self.executor = await self.pool.acquire()
+            SyncToAsync.context_to_thread_executor[self] = self.executor
+        return self
+
+    async def __aexit__(self, exc, value, tb):
+        if self.executor is not None:
+            # returned to the pool instead of being shut down by the base class
+            SyncToAsync.context_to_thread_executor.pop(self, None)
+            self.pool.release(self.executor)
+            self.executor = None
+        await super().__aexit__(exc, value, tb)
@@ -0,0 +1,29 @@
+"""
+Registry for the micro-benchmarks run by the ``benchmark`` management command.
+
+Apps define their benchmarks in a ``benchmarks`` module, which is discovered
+automatically. A benchmark is a function returning a mapping of labels to
+callables, the callables are timed by the management command::
+
+    @register("serializers")
+    def serializer_fields():
+        return {"zaaktype": lambda: ZaakTypeSerializer().fields}
+"""
+from collections import OrderedDict
+from typing import Callable, Dict
+
+from django.utils.module_loading import autodiscover_modules
+
+BENCHMARKS: Dict[str, Callable[[], Dict[str, Callable]]] = OrderedDict()
+
+
+def register(name: str):
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+
+    return decorator
+
+
+def autodiscover():
+    autodiscover_modules("benchmarks")
@@ -0,0 +1,21 @@
+"""
+Health checks for persistent database connections.
+
+Connections are reused for ``CONN_MAX_AGE`` seconds, but Django 3.2 only discards
+a broken connection after a query on it failed, which fails the request. With the
+``CONN_HEALTH_CHECKS`` database setting (built-in from Django 4.1 on) the
+connection is verified when a request starts and replaced if it's unusable.
+"""
+from django.db import connections
+
+
+def check_connection_health(**kwargs) -> None:
+    for connection in connections.all():
+        if not connection.settings_dict.get("CONN_HEALTH_CHECKS"):
+            continue
+
+        if connection.connection is None or connection.in_atomic_block:
+            continue
+
+        if not connection.is_usable():
+            connection.close()
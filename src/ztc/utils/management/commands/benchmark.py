@@ -0,0 +1,50 @@
+import timeit
+
+from django.core.management import BaseCommand, CommandError
+
+from ...benchmarks import BENCHMARKS, autodiscover
+
+
+class Command(BaseCommand):
+    help = "Run the micro-benchmarks of performance sensitive code paths"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "benchmarks",
+            nargs="*",
+            help="Names of the benchmarks to run. Runs all benchmarks by default.",
+        )
+        parser.add_argument(
+            "--number",
+            type=int,
+            default=100,
+            help="Number of calls per measurement.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Number of measurements, the best one is reported.",
+        )
+
+    def handle(self, **options):
+        autodiscover()
+
+        names = options["benchmarks"] or list(BENCHMARKS)
+        unknown = set(names) - set(BENCHMARKS)
+        if unknown:
+            raise CommandError(
+                "Unknown benchmark(s): {}. Choose from: {}".format(
+                    ", ".join(sorted(unknown)), ", ".join(BENCHMARKS)
+                )
+            )
+
+        for name in names:
+            self.stdout.write(f"Benchmark {name}")
+            cases = BENCHMARKS[name]()
+            for label, func in cases.items():
+                timings = timeit.repeat(
+                    func, number=options["number"], repeat=options["repeat"]
+                )
+                per_call = min(timings) / options["number"] * 1_000_000
+                self.stdout.write(f"  {label}: {per_call:.1f} µs per call")
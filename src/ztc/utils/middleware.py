@@ -0,0 +1,70 @@
+"""
+Middleware that leaves API requests alone.
+
+API clients authenticate with a JWT (see
+:class:`vng_api_common.middleware.AuthMiddleware`), they don't use sessions,
+messages, logins or CSRF tokens. The middleware below passes requests for the
+paths in ``API_PATH_PREFIXES`` on to the next middleware and behaves like the
+original middleware for all other paths, e.g. the admin.
+
+API URLs don't end with a slash. API requests are only checked for a redirect to
+the URL with a slash when they result in a 404, instead of resolving the URL
+before every request.
+"""
+from django.conf import settings
+from django.contrib.auth import middleware as auth
+from django.contrib.messages import middleware as messages
+from django.contrib.sessions import middleware as sessions
+from django.http import HttpRequest
+from django.middleware import common, csrf
+
+from axes import middleware as axes
+
+
+def is_api_request(request: HttpRequest) -> bool:
+    return request.path_info.startswith(tuple(settings.API_PATH_PREFIXES))
+
+
+class SkipAPIRequestsMixin:
+    def __call__(self, request):
+        if is_api_request(request):
+            return self.get_response(request)
+        return super().__call__(request)
+
+
+class SessionMiddleware(SkipAPIRequestsMixin, sessions.SessionMiddleware):
+    pass
+
+
+class CommonMiddleware(common.CommonMiddleware):
+    def process_request(self, request):
+        # the URL is checked for a missing slash after a 404 response instead
+        request._skip_slash_redirect = is_api_request(request)
+        try:
+            return super().process_request(request)
+        finally:
+            request._skip_slash_redirect = False
+
+    def should_redirect_with_slash(self, request):
+        if getattr(request, "_skip_slash_redirect", False):
+            return False
+        return super().should_redirect_with_slash(request)
+
+
+class CsrfViewMiddleware(SkipAPIRequestsMixin, csrf.CsrfViewMiddleware):
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        if is_api_request(request):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+class AuthenticationMiddleware(SkipAPIRequestsMixin, auth.AuthenticationMiddleware):
+    pass
+
+
+class MessageMiddleware(SkipAPIRequestsMixin, messages.MessageMiddleware):
+    pass
+
+
+class AxesMiddleware(SkipAPIRequestsMixin, axes.AxesMiddleware):
+    pass
@@ -0,0 +1,19 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+
+
+class BenchmarkCommandTests(SimpleTestCase):
+    def test_run_benchmark(self):
+        stdout = StringIO()
+
+        call_command("benchmark", "serializers", number=1, repeat=1, stdout=stdout)
+
+        output = stdout.getvalue()
+        self.assertIn("Benchmark serializers", output)
+        self.assertIn("ZaakTypeSerializer (cached)", output)
+
+    def test_unknown_benchmark(self):
+        with self.assertRaises(CommandError):
+            call_command("benchmark", "unknown", stdout=StringIO())
@@ -0,0 +1,34 @@
+from unittest.mock import patch
+
+from django.core.signals import request_started
+from django.db import connection
+from django.test import TransactionTestCase
+
+from ..db import check_connection_health
+
+
+class ConnectionHealthCheckTests(TransactionTestCase):
+    def setUp(self):
+        super().setUp()
+        connection.ensure_connection()
+
+    def test_unusable_connection_is_closed(self):
+        with patch.object(connection, "is_usable", return_value=False):
+            request_started.send(sender=self.__class__)
+
+        self.assertIsNone(connection.connection)
+
+    def test_usable_connection_is_reused(self):
+        db_connection = connection.connection
+
+        check_connection_health()
+
+        self.assertIs(connection.connection, db_connection)
+
+    def test_health_checks_disabled(self):
+        with patch.dict(connection.settings_dict, {"CONN_HEALTH_CHECKS": False}):
+            with patch.object(connection, "is_usable") as is_usable:
+                check_connection_health()
+
+        is_usable.assert_not_called()
+        self.assertIsNotNone(connection.connection)
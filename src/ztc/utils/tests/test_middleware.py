@@ -0,0 +1,86 @@
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.views.decorators.csrf import csrf_protect
+
+from ..middleware import (
+    AuthenticationMiddleware,
+    CommonMiddleware,
+    CsrfViewMiddleware,
+    MessageMiddleware,
+    SessionMiddleware,
+)
+
+
+def view(request):
+    return HttpResponse()
+
+
+@override_settings(ALLOWED_HOSTS=["testserver"], API_PATH_PREFIXES=["/api/"])
+class PathAwareMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.factory = RequestFactory()
+
+    def _get_handler(self):
+        handler = view
+        for middleware_class in (
+            MessageMiddleware,
+            AuthenticationMiddleware,
+            SessionMiddleware,
+        ):
+            handler = middleware_class(handler)
+        return handler
+
+    def test_api_request_skips_sessions(self):
+        request = self.factory.get("/api/v1/zaaktypen")
+
+        self._get_handler()(request)
+
+        self.assertFalse(hasattr(request, "session"))
+        self.assertFalse(hasattr(request, "user"))
+        self.assertFalse(hasattr(request, "_messages"))
+
+    def test_admin_request_uses_sessions(self):
+        request = self.factory.get("/admin/")
+
+        self._get_handler()(request)
+
+        self.assertTrue(hasattr(request, "session"))
+        self.assertTrue(hasattr(request, "user"))
+        self.assertTrue(hasattr(request, "_messages"))
+
+    def test_csrf_check_skipped_for_api_request(self):
+        middleware = CsrfViewMiddleware(view)
+        request = self.factory.post("/api/v1/zaaktypen")
+
+        response = middleware.process_view(request, csrf_protect(view), (), {})
+
+        self.assertIsNone(response)
+
+    def test_csrf_check_for_admin_request(self):
+        middleware = CsrfViewMiddleware(view)
+        request = self.factory.post("/admin/login/")
+
+        response = middleware.process_view(request, csrf_protect(view), (), {})
+
+        self.assertEqual(response.status_code, 403)
+
+    @override_settings(ROOT_URLCONF="ztc.urls", APPEND_SLASH=True)
+    def test_slash_redirect_for_api_request_not_found(self):
+        middleware = CommonMiddleware(view)
+        request = self.factory.get("/api/v1/schema")
+
+        self.assertIsNone(middleware.process_request(request))
+
+        response = middleware.process_response(request, HttpResponse(status=404))
+
+        self.assertEqual(response.status_code, 301)
+        self.assertEqual(response.url, "/api/v1/schema/")
+
+    @override_settings(ROOT_URLCONF="ztc.urls", APPEND_SLASH=True)
+    def test_slash_redirect_for_admin_request(self):
+        middleware = CommonMiddleware(view)
+
+        response = middleware.process_request(self.factory.get("/admin"))
+
+        self.assertEqual(response.status_code, 301)
@@ -12,20 +12,31 @@ from django.core.wsgi import get_wsgi_application
 
 
 def init_newrelic():
-    if os.environ.get("PROJECT_ROOT"):
-        try:
-            import newrelic.agent
+    """
+    Initialize the New Relic agent if ``NEW_RELIC_CONFIG_FILE`` is set.
 
-            newrelic.agent.initialize(
-                os.path.join(os.environ.get("PROJECT_ROOT"), "newrelic.ini"),
-                "production",
-            )
-        except Exception as e:
-            print("Could not initialize New Relic APM, ignoring:")
-            print(e)
+    The agent is only imported when it is used.
+    """
+    config_file = os.environ.get("NEW_RELIC_CONFIG_FILE")
+    if not config_file:
+        return
 
+    try:
+        import newrelic.agent
 
-# Enable New Relic on production
-# init_newrelic()
+        newrelic.agent.initialize(
+            config_file, os.environ.get("NEW_RELIC_ENVIRONMENT", "production")
+        )
+    except Exception as e:
+        print("Could not initialize New Relic APM, ignoring:")
+        print(e)
+
+
+init_newrelic()
 
 application = get_wsgi_application()
+
+# build the OpenAPI schema before the first request instead of during it
+from ztc.api.openapi import preload_schema  # noqa isort:skip
+
+preload_schema()